@@ -0,0 +1,216 @@
+"""
+Sliding Window is a technique for computing something over every window (contiguous
+run) of a sequence, reusing the work done for the previous window instead of
+recomputing each window from scratch. When the window slides one step, one element
+enters on the right and (at most) one leaves on the left, so an aggregate that can
+be updated for an entering and a leaving element costs O(1) per step instead of O(w).
+
+sum, mean and variance are updated arithmetically. min and max can't be "un-done"
+when an element leaves, so they use a monotonic deque: a deque of candidates kept in
+decreasing order (for max). A new element first pops every smaller candidate from
+the back (they can never be the maximum again, the new element is bigger and leaves
+the window later), then it's appended. The front is always the maximum of the
+window, and it's popped from the front once it leaves the window. Every element is
+pushed and popped at most once, so it's O(1) amortized per element.
+
+Windows can be fixed-count (the last `size` elements) or time-based (the elements
+whose timestamp is within the last `duration`), see SlidingWindow.
+
+sliding_window_max([1, 3, -1, -3, 5, 3, 6, 7], 3)   # Output: [3, 3, 5, 5, 6, 7]
+sliding_window_min([1, 3, -1, -3, 5, 3, 6, 7], 3)   # Output: [-1, -3, -3, -3, 3, 3]
+"""
+import os
+import sys
+
+# the linked Deque (with its node pool) from data-structures/linear/deque, the directories are scripts, not packages
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "data-structures", "linear", "deque"))
+from deque import Deque
+
+
+def sliding_window_max(values, k):
+    """Maximum of every window of k consecutive values, in O(n)"""
+    return _sliding_window_extreme(values, k, lambda candidate, new: candidate <= new)
+
+
+def sliding_window_min(values, k):
+    """Minimum of every window of k consecutive values, in O(n)"""
+    return _sliding_window_extreme(values, k, lambda candidate, new: candidate >= new)
+
+
+def _sliding_window_extreme(values, k, dominated):
+    if k < 1:
+        raise ValueError("The window size must be at least 1")
+    candidates = Deque()   # indices of the candidates, their values are monotonic
+    res = []
+    for i, value in enumerate(values):
+        # drop the candidates the new value beats, they can't be the answer anymore
+        while not candidates.isempty() and dominated(values[candidates.end()], value):
+            candidates.pop()
+        candidates.append(i)
+        if candidates.front() <= i - k:   # the front has left the window
+            candidates.popleft()
+        if i >= k - 1:   # the first full window ends at index k - 1
+            res.append(values[candidates.front()])
+    return res
+
+
+class SlidingWindow:
+    """
+    Streaming aggregates (count, sum, mean, variance, min, max) over a sliding window,
+    O(1) amortized per pushed value.
+
+    SlidingWindow(size=100)        the last 100 values
+    SlidingWindow(duration=60)     the values pushed in the last 60 (seconds, or
+                                   whatever unit the timestamps are in)
+    Both can be given, then a value leaves as soon as either limit drops it.
+    Timestamps must be pushed in non-decreasing order.
+    """
+
+    def __init__(self, size=None, duration=None, pool_size=1024):
+        if size is None and duration is None:
+            raise ValueError("Give a window size, a duration or both")
+        if size is not None and size < 1:
+            raise ValueError("The window size must be at least 1")
+        if duration is not None and duration < 0:
+            raise ValueError("The duration must be non-negative")
+        self._size = size
+        self._duration = duration
+        self._seq = 0   # sequence number of the next pushed value
+        self._now = None   # latest timestamp seen
+        # (seq, timestamp, value) of every value in the window, oldest first.
+        # The windows churn nodes all the time, so their deques recycle them
+        self._window = Deque(pool_size=pool_size)
+        # (seq, value) candidates for the max (decreasing) and the min (increasing)
+        self._max = Deque(pool_size=pool_size)
+        self._min = Deque(pool_size=pool_size)
+        # running sum, and mean / sum of squared deviations (Welford's method,
+        # which can also take values out and is far more stable than summing squares)
+        self._sum = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+
+
+    def push(self, value, timestamp=None):
+        """Add a value to the window (and evict whatever falls out of it)"""
+        """Time Complexity O(1) (amortized)"""
+        if self._duration is not None:
+            if timestamp is None:
+                raise ValueError("A time based window needs a timestamp for every value")
+            if self._now is not None and timestamp < self._now:
+                raise ValueError("Timestamps must be non-decreasing")
+            self._now = timestamp
+
+        seq = self._seq
+        self._seq += 1
+        window, maxq, minq = self._window, self._max, self._min
+        window.append((seq, timestamp, value))
+        # this runs for every value, so peek at the tail nodes directly
+        while maxq.tail is not None and maxq.tail.data[1] <= value:
+            maxq.pop()
+        maxq.append((seq, value))
+        while minq.tail is not None and minq.tail.data[1] >= value:
+            minq.pop()
+        minq.append((seq, value))
+
+        self._sum += value
+        delta = value - self._mean
+        self._mean += delta / window._n
+        self._m2 += delta * (value - self._mean)
+
+        if (self._size is not None and window._n > self._size) or self._duration is not None:
+            self._evict()
+
+
+    def extend(self, values, timestamps=None):
+        """push every value (with its timestamp, for a time based window)"""
+        """Time Complexity O(k) (amortized)"""
+        if timestamps is None:
+            for value in values: self.push(value)
+        else:
+            for value, timestamp in zip(values, timestamps): self.push(value, timestamp)
+
+
+    def advance(self, timestamp):
+        """Move the clock of a time based window forward without pushing anything"""
+        """Time Complexity O(1) (amortized)"""
+        if self._duration is None:
+            raise ValueError("Only a time based window has a clock")
+        if self._now is not None and timestamp < self._now:
+            raise ValueError("Timestamps must be non-decreasing")
+        self._now = timestamp
+        self._evict()
+
+
+    def _evict(self):
+        """Drop the oldest values while the window is too long (by count or by time)"""
+        window = self._window
+        while window.head is not None:
+            seq, timestamp, value = window.head.data
+            too_many = self._size is not None and window._n > self._size
+            too_old = self._duration is not None and timestamp <= self._now - self._duration
+            if not (too_many or too_old):
+                break
+            window.popleft()
+            if self._max.head.data[0] == seq:
+                self._max.popleft()
+            if self._min.head.data[0] == seq:
+                self._min.popleft()
+
+            self._sum -= value
+            n = window._n
+            if n == 0:
+                self._sum, self._mean, self._m2 = 0, 0.0, 0.0
+            else:   # Welford's update run backwards
+                delta = value - self._mean
+                self._mean -= delta / n
+                self._m2 -= delta * (value - self._mean)
+
+
+    def max(self):
+        """Time Complexity O(1)"""
+        if self._max.isempty():
+            raise ValueError("Empty window")
+        return self._max.front()[1]
+
+
+    def min(self):
+        """Time Complexity O(1)"""
+        if self._min.isempty():
+            raise ValueError("Empty window")
+        return self._min.front()[1]
+
+
+    def sum(self):
+        """Time Complexity O(1)"""
+        return self._sum
+
+
+    def mean(self):
+        """Time Complexity O(1)"""
+        if self._window.isempty():
+            raise ValueError("Empty window")
+        return self._mean
+
+
+    def variance(self, ddof=0):
+        """Population variance (ddof=0) or sample variance (ddof=1) of the window"""
+        """Time Complexity O(1)"""
+        n = len(self._window)
+        if n - ddof <= 0:
+            raise ValueError("Not enough values in the window")
+        return max(0.0, self._m2) / (n - ddof)   # clamp tiny negative rounding errors
+
+
+    def tolist(self):
+        """The values in the window, oldest first"""
+        return [value for _, _, value in self._window]
+
+
+    def __repr__(self):
+        """Representation of a SlidingWindow object"""
+        return f"SlidingWindow({self.tolist()})"
+
+
+    def __len__(self):
+        return len(self._window)
+    count = size = __len__
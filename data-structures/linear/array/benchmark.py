@@ -0,0 +1,70 @@
+"""
+Rough timings of DynamicArray against the built-in list for the same operations
+
+# run from anywhere, optionally with the number of elements
+❯ python3 data-structures/linear/array/benchmark.py 1000000
+"""
+import sys
+from time import perf_counter
+
+from dynamic_array import DynamicArray
+
+
+def timeit(func, repeat=3):
+    """Return the best wall-clock time of `repeat` runs of func"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        func()
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def report(name, *timings):
+    """Print one row of the result table"""
+    print(f"{name:<28}" + "".join(f"{t * 1000:>14.3f}" for t in timings))
+
+
+def bench_shifts(n, ops=100):
+    """Middle inserts/pops and block inserts/deletes on an array with n elements"""
+    print(f"\n{n:,} elements, {ops} operations each (ms, best of 3)")
+    print(f"{'operation':<28}{'list':>14}{'DynamicArray':>14}{'typed (q)':>14}")
+
+    def middle_insert(arr):
+        def run():
+            for _ in range(ops):
+                arr.insert(len(arr) // 2, 0)
+        return run
+
+    def middle_pop(arr):
+        def run():
+            for _ in range(ops):
+                arr.pop(len(arr) // 2)
+        return run
+
+    def block_insert(arr):
+        block = list(range(ops))
+        if isinstance(arr, list):
+            def run(): arr[len(arr) // 2:len(arr) // 2] = block
+        else:
+            def run(): arr.insert_many(len(arr) // 2, block)
+        return run
+
+    def block_delete(arr):
+        if isinstance(arr, list):
+            def run(): del arr[len(arr) // 2:len(arr) // 2 + ops]
+        else:
+            def run(): arr.delete_range(len(arr) // 2, len(arr) // 2 + ops)
+        return run
+
+    data = list(range(n))
+    containers = (list(data), DynamicArray(data), DynamicArray(data, typecode='q'))
+    for name, make in (("insert (middle)", middle_insert),
+                       ("pop (middle)", middle_pop),
+                       ("insert_many (middle)", block_insert),
+                       ("delete_range (middle)", block_delete)):
+        report(name, *(timeit(make(arr)) for arr in containers))
+
+
+if __name__ == "__main__":
+    bench_shifts(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
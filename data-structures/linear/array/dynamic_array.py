@@ -1,28 +1,332 @@
 import ctypes    # for low-level arrays
+import array     # for low-level typed (primitive) arrays
+import itertools
 
-class DynamicArray:
+from growth_policy import GrowthPolicy
+
+try:
+    import numpy as np   # optional, vectorized batch operations for typed storage
+except ImportError:
+    np = None
+
+# typecodes whose array module and numpy layouts are the same
+NUMPY_TYPECODES = "bBhHiIlLqQfd"
+
+_VACANT = object()   # what TypedStorage._clear leaves in a vacated object mode slot
+
+class ArrayView:
+    """A read-only window over a DynamicArray or a StaticArray that doesn't copy the elements"""
+
+    # arr.view(2, 10, 2) only remembers which indices of arr it covers (as a range),
+    # so creating a view or slicing a view is O(1) whatever the size of the window.
+    # Any resize or shift of the parent array makes the view stale, using a stale
+    # view raises RuntimeError instead of silently reading the wrong elements
+    # (a StaticArray never resizes, so its views stay valid)
+    def __init__(self, parent, indices):
+        self._parent = parent
+        self._indices = indices    # range of the parent indices covered by the view
+        self._version = parent._version
+
+
+    def _storage(self):
+        """Return the parent's low-level array, if the view is still valid"""
+        if self._parent._version != self._version:
+            raise RuntimeError("view invalidated by a resize or shift of the array")
+        return self._parent._array
+
+
+    def tolist(self):
+        """Copy the elements of the view into a list"""
+        """Time Complexity O(k)"""
+        return list(self)
+
+
+    def tobuffer(self):
+        """Return a zero-copy (strided) memoryview over the view (typed mode only)"""
+        """Time Complexity O(1)"""
+        if self._parent._typecode is None:
+            raise TypeError("buffer export requires a typecode (typed storage)")
+        storage, indices = self._storage(), self._indices
+        if len(indices) == 0:
+            return memoryview(storage)[0:0]
+        stop = indices[-1] + (1 if indices.step > 0 else -1)
+        return memoryview(storage)[indices[0]:stop if stop >= 0 else None:indices.step]
+
+
+    def __len__(self):
+        """Time Complexity O(1)"""
+        return len(self._indices)
+
+
+    def __iter__(self):
+        storage = self._storage()
+        for i in self._indices:
+            if self._parent._version != self._version:
+                raise RuntimeError("view invalidated by a resize or shift of the array")
+            yield storage[i]
+
+
+    def __getitem__(self, key):
+        """Return an element, or a nested view for a slice"""
+        """Time Complexity O(1)"""
+        if isinstance(key, int):
+            storage = self._storage()
+            try:
+                return storage[self._indices[key]]
+            except IndexError:
+                raise IndexError("Index out of range") from None
+        elif isinstance(key, slice):
+            self._storage()   # slicing a stale view is an error too
+            return ArrayView(self._parent, self._indices[key])
+        else:
+            raise TypeError(f"Invalid key type: {type(key).__name__}")
+
+
+    def __repr__(self):
+        return f"ArrayView({list(self)})"
+
+
+class BatchOperations:
+    """
+    Batch operations shared by DynamicArray and StaticArray (and MappedArray).
+
+    They run as a single vectorized NumPy call when the array has typed storage
+    and NumPy is installed, otherwise they fall back to pure Python working on one
+    C level copy of the live elements (not a per item __getitem__).
+    The classes provide _array, _n, _typecode and _from_values(values, typecode)
+    """
+
+    _not_found = "Value not in list"   # message of the ValueError raised by index()
+
+    def count(self, value):
+        """Return the total number of occurrences of value"""
+        """Time Complexity O(n)"""
+        values = self._ndarray()
+        if values is not None:
+            return int(np.count_nonzero(values == value))
+        return self._copy().count(value)
+
+
+    def find_all(self, value):
+        """Return the indices of all the occurrences of value"""
+        """Time Complexity O(n)"""
+        values = self._ndarray()
+        if values is not None:
+            return np.flatnonzero(values == value).tolist()
+        return [i for i, v in enumerate(self._copy()) if v == value]
+
+
+    def index(self, value):
+        """Return the index of the first occurrence of value"""
+        """Time Complexity O(n)"""
+        values = self._ndarray()
+        if values is not None:
+            found = np.flatnonzero(values == value)
+            if len(found):
+                return int(found[0])
+        else:
+            try:
+                return self._copy().index(value)
+            except ValueError:
+                pass
+        raise ValueError(self._not_found)
+
+
+    def sum(self):
+        """Return the sum of all the elements"""
+        """Time Complexity O(n)"""
+        values = self._ndarray()
+        if values is None:
+            return sum(self._copy())
+        if values.dtype.kind in "iu":
+            # NumPy adds integers in fixed-width 64 bit arithmetic and silently wraps
+            # around, so it's only used when n * the largest magnitude can't overflow.
+            # Otherwise the exact Python int sum is used, same answer with or without NumPy
+            bound = max(abs(int(values.min())), abs(int(values.max()))) * len(values)
+            if bound >= 2**63:
+                return sum(self._copy())
+            return int(values.sum(dtype=np.int64))
+        return values.sum().item()
+
+
+    def min(self):
+        """Return the smallest element"""
+        """Time Complexity O(n)"""
+        values = self._ndarray()
+        if values is not None:
+            return values.min().item()
+        return min(self._copy())
+
+
+    def max(self):
+        """Return the largest element"""
+        """Time Complexity O(n)"""
+        values = self._ndarray()
+        if values is not None:
+            return values.max().item()
+        return max(self._copy())
+
+
+    def argsort(self):
+        """Return a new array (typecode 'q') of the indices that would sort the array"""
+        """Time Complexity O(n log(n))"""
+        values = self._ndarray()
+        if values is not None:
+            return self._from_ndarray(np.argsort(values, kind="stable"), "q")
+        block = self._copy()
+        return self._from_values(sorted(range(self._n), key=block.__getitem__), "q")
+
+
+    def take(self, indices):
+        """Return a new array with the elements at the given indices"""
+        """Time Complexity O(k)"""
+        indices = self._as_sequence(indices)
+        values = self._ndarray()
+        if values is not None:
+            return self._from_ndarray(values[np.asarray(indices, dtype=np.intp)], self._typecode)
+        block = self._copy()
+        return self._from_values([block[i] for i in indices], self._typecode)
+
+
+    def filter(self, mask):
+        """Return a new array with the elements where the boolean mask is true"""
+        """Time Complexity O(n)"""
+        mask = self._as_sequence(mask)
+        if len(mask) != self._n:
+            raise ValueError("The mask must have the same length as the array")
+        values = self._ndarray()
+        if values is not None:
+            return self._from_ndarray(values[np.asarray(mask, dtype=bool)], self._typecode)
+        return self._from_values(list(itertools.compress(self._copy(), mask)), self._typecode)
+
+
+    def _copy(self, key=None):
+        """Return a C level copy of the live elements (or of the given slice of them)"""
+        if key is None:
+            key = slice(0, self._n)
+        return self._array[key]
+
+
+    def _ndarray(self):
+        """Return a zero-copy NumPy view of the live elements, or None to use pure Python"""
+        if np is None or self._typecode is None or self._typecode not in NUMPY_TYPECODES or self._n == 0:
+            return None
+        return np.frombuffer(self._array, dtype=self._typecode, count=self._n)
+
+
+    def _from_ndarray(self, values, typecode):
+        """Return a new array of the same class with the elements of a NumPy array"""
+        return self._from_values(array.array(typecode, np.ascontiguousarray(values, dtype=typecode).tobytes()), typecode)
+
+
+    @staticmethod
+    def _as_sequence(values):
+        """Indices or a mask as something with a length that NumPy and Python can both index"""
+        if isinstance(values, BatchOperations):
+            return values._copy()   # C level copy, skips the per item __getitem__
+        if isinstance(values, (list, tuple, array.array)):
+            return values
+        return list(values)
+
+
+class TypedStorage:
+    """
+    The storage helpers shared by DynamicArray and the array based Stacks.
+
+    The elements live in _array, either a ctypes array of py_object references
+    (object mode, _typecode is None) or a zero-filled array.array of raw values
+    (typed mode), and len() is the number of live ones.
+    """
+
+    @property
+    def typecode(self):
+        """The typecode of the underlying typed storage (None in object mode)"""
+        return self._typecode
+
+
+    def tobuffer(self):
+        """Return a zero-copy memoryview over the live elements (typed mode only)"""
+        """Time Complexity O(1)"""
+        # e.g. numpy.frombuffer(arr.tobuffer(), dtype=arr.typecode) shares the memory.
+        # The view is bound to the current storage, so it goes stale after a resize
+        if self._typecode is None:
+            raise TypeError("buffer export requires a typecode (typed storage)")
+        n = len(self)   # read first, a MappedArray may map its file again on reading it
+        return memoryview(self._array)[:n]
+
+
+    def __buffer__(self, flags):
+        """Buffer protocol support (Python 3.12+), e.g. memoryview(arr) or numpy.asarray(arr)"""
+        return self.tobuffer()
+
+
+    def _make_block(self, values):
+        """Return the values in a form that can be slice-assigned into the storage"""
+        if isinstance(values, DynamicArray):
+            values = values._copy()   # C level copy, skips the per item __getitem__
+        if self._typecode is not None:
+            if isinstance(values, array.array) and values.typecode == self._typecode:
+                return values
+            return array.array(self._typecode, values)
+        if isinstance(values, list):
+            return values
+        return list(values)
+
+
+    def _make_array(self, capacity):
+        """Return a low-level new array with given capacity"""
+        if self._typecode is not None:
+            # zero-filled typed array, the slots hold the raw values themselves
+            return array.array(self._typecode, bytes(capacity * array.array(self._typecode).itemsize))
+        return (capacity * ctypes.py_object)()   # get low-level array with exact capacity
+
+
+    def _clear(self, start, stop):
+        """Drop the references held by the vacated object mode slots [start, stop)"""
+        # ctypes keeps the objects stored in a py_object array alive in its _objects
+        # dict and skips that bookkeeping when None is stored, so a None would leave
+        # the old object alive: the slots get a placeholder object instead
+        if self._typecode is None and stop > start:
+            self._array[start:stop] = [_VACANT] * (stop - start)
+
+
+class DynamicArray(BatchOperations, TypedStorage):
     """A dynamic array class akin to a simplified Python List"""
 
-    def __init__(self, array=None):
+    # DynamicArray([1, 2, 3]) stores references to boxed Python objects (any type)
+    # DynamicArray([1, 2, 3], typecode='q') stores raw 8 byte signed integers in a
+    # contiguous buffer (see the `array` module for the available typecodes), so a
+    # million ints take 8 MB instead of a pointer plus a boxed int object each
+    #
+    # Only typed mode gets memmove-speed shifts (insert, pop, remove in the middle,
+    # on par with list). In object mode every moved slot still goes through ctypes'
+    # py_object reference counting, which is only ~1.3x faster than a Python loop
+    # and about 1000x slower than list: use a list, or a typecode, for that
+    def __init__(self, array=None, typecode=None, policy=None):
         """Create a Dynamic Array Object"""
+        self._typecode = typecode   # None means object mode (heterogeneous data)
+        self._policy = policy if policy is not None else GrowthPolicy()
+        self._grows = self._shrinks = 0   # resize counters
+        self._version = 0   # bumped whenever elements move, so that views can detect it
         if array is None:
             # creating an empty array
             self._n = 0  # count actual elements
-            self._capacity = 1  # default array capacity
+            self._capacity = self._policy.min_capacity  # default array capacity
             self._array = self._make_array(self._capacity) # get a low-level array with default capacity
         else:
-            # creating the array from a given list as parameter
-            self._n = self._capacity = len(array)
-            self._array = self._make_array(self._n)
-            for i in range(self._n):
-                self._array[i] = array[i]
+            # creating the array from a given iterable as parameter (copied in one block)
+            block = self._make_block(array)
+            self._n = len(block)
+            self._capacity = max(self._policy.min_capacity, self._n)
+            self._array = self._make_array(self._capacity)
+            self._array[:self._n] = block
 
 
     def append(self, value):
         """Append one item to the end of the array"""
         """Time Complexity O(1) (amortized)"""
-        if self._n == self._capacity:   # if the array is full, then resize it to it's double capacity
-            self._resize(2 * self._capacity)
+        if self._n == self._capacity:   # if the array is full, then grow it as the policy says
+            self._grow(self._n + 1)
         self._array[self._n] = value
         self._n += 1
 
@@ -30,14 +334,27 @@ class DynamicArray:
     def extend(self, array):
         """Extend current array with the values of another array"""
         """Time Complexity O(n)"""
-        for val in array:
-            self.append(val)
+        # the values are collected once (list() pre-sizes from len() or __length_hint__),
+        # then there is at most one resize and a single block copy
+        block = self._make_block(array)
+        k = len(block)
+        self._grow(self._n + k)
+        self._array[self._n:self._n + k] = block
+        self._n += k
 
 
-    def count(self, value):
-        """Return the total number of occurrences of value"""
-        """Time Complexity O(n)"""
-        return sum(1 for v in self if v == value)
+    @property
+    def itemsize(self):
+        """Size in bytes of one stored element"""
+        if self._typecode is None:
+            return ctypes.sizeof(ctypes.py_object)    # only the reference, not the object
+        return self._array.itemsize
+
+
+    def view(self, start=None, stop=None, step=None):
+        """Return a zero-copy ArrayView, like self[start:stop:step] without copying"""
+        """Time Complexity O(1)"""
+        return ArrayView(self, range(*slice(start, stop, step).indices(self._n)))
 
 
     def insert(self, index, value):
@@ -52,50 +369,54 @@ class DynamicArray:
         if index >= self._n:  # if the index is greater or equal than the total num of elements in the array
             self.append(value)
         elif 0 <= index < self._n:
-            if self._n + 1 > self._capacity:  # resize as we will need more space to store the new value
-                self._resize(2 * self._capacity)
-            for i in range(self._n, index, -1):
-                self._array[i] = self._array[i - 1]
+            self._grow(self._n + 1)  # resize if we will need more space to store the new value
+            self._shift(index, index + 1, self._n - index)   # right shift all the elements in one block move
             self._array[index] = value
             self._n += 1
         else:
             raise IndexError("Invalid Index")   # else raise an exception
 
 
-    def index(self, value):
-        """Return the index of the first occurrence of value"""
-        """Time Complexity O(n)"""
-        for i, val in enumerate(self):
-            if val == value:
-                return i
-        raise ValueError("Value not in list")
+    def insert_many(self, index, values):
+        """Insert all the values from an iterable before the given index"""
+        """Time Complexity O(n + k) (a single shift no matter how many values)"""
+        index = slice(index, None).indices(self._n)[0]   # list-like clamping of the index
+        values = self._make_block(values)
+        k = len(values)
+        if k == 0:
+            return
+        self._grow(self._n + k)
+        self._shift(index, index + k, self._n - index)   # open a gap of k slots
+        self._array[index:index + k] = values
+        self._n += k
+
+
+    def delete_range(self, start, stop):
+        """Delete the elements from index start up to (but not including) stop"""
+        """Time Complexity O(n) (a single shift no matter how many values)"""
+        start, stop, _ = slice(start, stop).indices(self._n)
+        if start >= stop:
+            return
+        self._shift(stop, start, self._n - stop)   # close the gap
+        self._n -= stop - start
+        self._shrink()
 
 
     def remove(self, value):
         """Remove the first item from the array where array[i] == value"""
         """Time Complexity O(n) (amortized)"""
         try:
-            # if total num of elements in the array is less than one forth of the capacity,
-            # reduce the capacity by half
-            if 4 * self._n <= self._capacity:
-                self._resize(self._capacity // 2)
-
             index = self.index(value)
-            for i in range(index, self._n - 1):
-                self._array[i] = self._array[i + 1]   # left shift all the elements
-            self._n -= 1
         except ValueError:
             raise ValueError("Value not in list")
+        self._shift(index + 1, index, self._n - index - 1)   # left shift all the elements
+        self._n -= 1
+        self._shrink()
 
 
     def pop(self, index=None):
         """Pop an item from the array"""
         """Time Complexity O(n) (amortized)"""
-        # if total num of elements in the array is less than one forth of the capacity,
-        # reduce the capacity by half
-        if 4 * self._n <= self._capacity:
-            self._resize(self._capacity // 2)
-
         if index is None:
             index = self._n - 1    # pop the last element by default
 
@@ -107,10 +428,11 @@ class DynamicArray:
             raise IndexError("Index out of range")
 
         value = self._array[index]
-        for i in range(index, self._n - 1):
-            self._array[i] = self._array[i + 1]   # left shift all the elements
+        self._shift(index + 1, index, self._n - index - 1)   # left shift all the elements
 
         self._n -= 1
+        # shrink only after the element is gone, so the policy sees the real occupancy
+        self._shrink()
         return value
 
 
@@ -118,20 +440,44 @@ class DynamicArray:
         """Clear the array"""
         """Time Complexity O(1)"""
         self._n = 0
-        self._resize(1)
+        self._resize(self._policy.min_capacity)
+
+
+    def reserve(self, capacity):
+        """Make sure the array can hold `capacity` elements without resizing"""
+        """Time Complexity O(n)"""
+        if capacity > self._capacity:
+            self._resize(capacity)
+
+
+    def shrink_to_fit(self):
+        """Release the unused capacity"""
+        """Time Complexity O(n)"""
+        capacity = max(self._policy.min_capacity, self._n)
+        if capacity != self._capacity:
+            self._resize(capacity)
+
+
+    @property
+    def capacity(self):
+        """Number of elements the array can hold before it has to grow"""
+        return self._capacity
+
+
+    def resize_stats(self):
+        """Return how many times the array grew and shrank, to tune the growth policy"""
+        return {"grows": self._grows, "shrinks": self._shrinks, "capacity": self._capacity}
 
 
     def __add__(self, other):
         """Adding two Dynamic Array objects"""
         """Time Complexity O(n1 + n2)"""
-        ans = self._make_array(len(self) + len(other))
-
-        for i in range(len(self)):
-            ans[i] = self[i]
-        for i in range(len(other)):
-            ans[i + len(self)] = other[i]
-
-        return DynamicArray(ans)
+        block = self._make_block(other)
+        ans = self._with_capacity(self._n + len(block))
+        ans._array[:self._n] = self._copy()
+        ans._array[self._n:self._n + len(block)] = block
+        ans._n = self._n + len(block)
+        return ans
 
 
     def __iadd__(self, other):
@@ -150,11 +496,10 @@ class DynamicArray:
         if const == 1:
             return self
 
-        result = self._make_array(const * self._capacity)
-        for j in range(const):
-            for i in range(self._n):
-                result[i + self._n * j] = self[i]
-        return DynamicArray(result)
+        result = self._with_capacity(const * self._n)
+        result._array[:const * self._n] = self._copy() * const   # repeated at C level
+        result._n = const * self._n
+        return result
 
 
     def __imul__(self, const):
@@ -166,14 +511,13 @@ class DynamicArray:
         if const == 1:
             return self
 
-        aux = self._make_array(const * self._capacity)
-        for j in range(const):
-            for i in range(self._n):
-                aux[i + self._n * j] = self[i]
+        aux = self._make_array(max(self._policy.min_capacity, const * self._n))
+        aux[:const * self._n] = self._copy() * const   # repeated at C level
 
-        self._capacity = self._capacity * const
+        self._capacity = len(aux)
         self._n = self._n * const
         self._array = aux
+        self._version += 1
         return self
 
 
@@ -193,6 +537,8 @@ class DynamicArray:
 
     def __repr__(self):
         """Representation of the DynamicArray Object"""
+        if self._typecode is not None:
+            return f"DynamicArray({list(self)}, typecode={self._typecode!r})"
         return f"DynamicArray({list(self)})"
 
 
@@ -214,27 +560,84 @@ class DynamicArray:
             return self._array[key]
         elif isinstance(key, slice):  # handle slicing
             start, stop, step = key.indices(len(self))
-            return self._array[start:stop:step]
+            return self._copy(slice(start, stop, step))
         else:
             raise TypeError(f"Invalid key type: {type(key).__name__}")
 
 
     def __setitem__(self, key, value):
         """Modify the index or slice with the given value(s)"""
-        if isinstance(key, (int, slice)): # handle both indexing and slicing
+        """Time Complexity O(1) (indexing)"""
+        """Time Complexity O(k) (slicing)"""
+        if isinstance(key, int):  # handle indexing
+            if key < 0:  # handle negative indexing
+                key += self._n
+            if key < 0 or key >= self._n:
+                raise IndexError("Index out of range")
             self._array[key] = value
+        elif isinstance(key, slice):  # handle slicing
+            # only the live elements can be replaced and the size can't change, the
+            # storage behind them is fixed (use insert_many / delete_range for that)
+            start, stop, step = key.indices(self._n)
+            size = len(range(start, stop, step))
+            block = self._make_block(value)
+            if len(block) != size:
+                raise ValueError(f"attempt to assign a sequence of size {len(block)} to a slice of size {size}")
+            if size == 0:
+                return
+            if stop < 0:   # a negative step running past index 0, not an index from the end
+                stop = None
+            self._array[start:stop:step] = block
         else:
             raise TypeError(f"Invalid key type: {type(key).__name__}")
 
 
+    def _grow(self, needed):
+        """Make room for `needed` elements, growing as the policy says"""
+        if needed > self._capacity:
+            self._resize(self._policy.grow(self._capacity, needed))
+
+
+    def _shrink(self):
+        """Give back memory if the policy says the array is too empty"""
+        capacity = self._policy.shrink(self._capacity, self._n)
+        if capacity is not None:
+            self._resize(capacity)
+
+
     def _resize(self, capacity):
+        if capacity > self._capacity:
+            self._grows += 1
+        elif capacity < self._capacity:
+            self._shrinks += 1
+        self._version += 1
         aux = self._make_array(capacity)  # new auxiliary array
-        for i in range(self._n):  # copy the elements from the previous array
-            aux[i] = self._array[i]
+        aux[:self._n] = self._array[:self._n]  # copy the elements from the previous array in one block
         self._array = aux    # set the resized array as the new array
         self._capacity = capacity   # updating capacity
 
 
-    def _make_array(self, capacity):
-        """Return a low-level new array with given capacity"""
-        return (capacity * ctypes.py_object)()   # get low-level array with exact capacity
+    def _shift(self, src, dst, count):
+        """Move count elements starting at src so they start at dst"""
+        # slice assignment copies the whole block at C level: a memmove for typed
+        # storage, but for py_object storage ctypes boxes and re-stores every slot, so
+        # object mode only gains ~1.3x over a Python loop. The right hand side is a
+        # temporary copy so overlapping moves in either direction are safe.
+        # A raw ctypes.memmove would be wrong for py_object slots as it skips the refcounts
+        self._version += 1
+        if count > 0:
+            self._array[dst:dst + count] = self._array[src:src + count]
+
+
+    def _from_values(self, values, typecode):
+        """Return a new DynamicArray with the given values (for the batch operations)"""
+        return DynamicArray(values, typecode, self._policy)
+
+
+    def _with_capacity(self, capacity):
+        """Return a new empty DynamicArray of the same storage mode with the given capacity"""
+        result = DynamicArray(typecode=self._typecode, policy=self._policy)
+        capacity = max(self._policy.min_capacity, capacity)
+        result._capacity = capacity
+        result._array = result._make_array(capacity)
+        return result
@@ -0,0 +1,50 @@
+"""
+The growth policy shared by the array-backed containers (DynamicArray, the
+dynamic Stack, the array based and circular Queues and the array Deque). They all
+import it from here, so one policy object works with any of them.
+
+The directories hold standalone scripts, not packages, so the modules that live
+outside this one (and also reuse TypedStorage from dynamic_array.py) put this
+directory on sys.path with a single line, pointing back here, right before the import:
+
+    sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "array"))   # see growth_policy.py
+    from growth_policy import GrowthPolicy
+"""
+
+class GrowthPolicy:
+    """When and by how much an array-backed container grows and shrinks"""
+
+    # GrowthPolicy() is the classic behaviour: double when full and halve once the
+    # container is a quarter full. Keeping shrink_threshold below 1 / factor leaves a
+    # gap (hysteresis) between the two, so alternating push/pop at a boundary can't
+    # resize on every operation. shrink_threshold=None never gives memory back.
+    # The same policy object can be shared by any of the array-backed containers
+    def __init__(self, factor=2, min_capacity=1, shrink_threshold=0.25):
+        if factor <= 1:
+            raise ValueError("The growth factor must be greater than 1")
+        if min_capacity < 1:
+            raise ValueError("The minimum capacity must be at least 1")
+        if shrink_threshold is not None and not 0 <= shrink_threshold < 1 / factor:
+            raise ValueError("The shrink threshold must be in [0, 1 / factor)")
+        self.factor = factor
+        self.min_capacity = min_capacity
+        self.shrink_threshold = shrink_threshold
+
+
+    def grow(self, capacity, needed):
+        """Return the new capacity for a container that needs room for `needed` items"""
+        return max(needed, self.min_capacity, int(capacity * self.factor), capacity + 1)
+
+
+    def shrink(self, capacity, n):
+        """Return the new capacity for a container holding n items, or None to keep it"""
+        if self.shrink_threshold is None or capacity <= self.min_capacity:
+            return None
+        if n > capacity * self.shrink_threshold:
+            return None
+        return max(self.min_capacity, n, int(capacity / self.factor))
+
+
+    def __repr__(self):
+        return (f"GrowthPolicy(factor={self.factor}, min_capacity={self.min_capacity}, "
+                f"shrink_threshold={self.shrink_threshold})")
@@ -0,0 +1,165 @@
+"""
+A file-backed DynamicArray. The elements are fixed-width typed values living in a
+memory-mapped file, so opening an array of any size is O(1) (nothing is parsed or
+copied, the OS pages the data in on demand) and several processes that map the same
+file share the same physical pages.
+
+File layout: a 16 byte header (magic, typecode, element count) followed by the raw
+elements in native byte order. The unused capacity at the end of the file is what
+lets append() grow in amortized O(1), exactly like DynamicArray.
+
+Sharing: one process may write while any number of others read. A reader sees the
+new count as soon as the writer stores it and maps the file again by itself when the
+writer has grown it past the reader's mapping. Several writers must take turns with
+a lock of their own, as each one only knows the capacity it resized the file to.
+
+❯ python3 -i data-structures/linear/array/mmap_array.py
+>>> a = MappedArray("samples.bin", typecode='d')
+>>> a.extend([0.5, 1.5, 2.5])
+>>> a.close()
+>>> MappedArray("samples.bin")
+MappedArray('samples.bin', [0.5, 1.5, 2.5], typecode='d')
+"""
+import array
+import mmap
+import os
+import struct
+
+from dynamic_array import DynamicArray, GrowthPolicy, NUMPY_TYPECODES
+
+
+class MappedArray(DynamicArray):
+    """A typed DynamicArray whose elements are stored in a memory-mapped file"""
+
+    MAGIC = b"PYDA"
+    HEADER = struct.Struct("=4sc3xQ")   # magic, typecode, padding, element count
+
+    def __init__(self, path, typecode=None, policy=None):
+        """Open the array stored at path, or create it if the file doesn't exist"""
+        """Time Complexity O(1)"""
+        self._path = path
+        self._policy = policy if policy is not None else GrowthPolicy()
+        self._grows = self._shrinks = 0   # resize counters
+        self._version = 0
+
+        if os.path.exists(path) and os.path.getsize(path) > 0:
+            with open(path, "rb") as f:
+                header = f.read(self.HEADER.size)
+            if len(header) < self.HEADER.size or header[:4] != self.MAGIC:
+                raise ValueError(f"{path!r} is not a MappedArray file")
+            stored = self.HEADER.unpack(header)[1].decode()
+            if typecode is not None and typecode != stored:
+                raise ValueError(f"{path!r} stores typecode {stored!r}, not {typecode!r}")
+            typecode = stored
+        else:
+            if typecode is None:
+                raise ValueError("A typecode is required to create a new MappedArray")
+            if typecode not in NUMPY_TYPECODES:
+                raise ValueError(f"Unsupported typecode {typecode!r}, use one of {NUMPY_TYPECODES!r}")
+            with open(path, "wb") as f:
+                f.write(self.HEADER.pack(self.MAGIC, typecode.encode(), 0))
+                f.truncate(self.HEADER.size + self._policy.min_capacity * array.array(typecode).itemsize)
+
+        self._typecode = typecode
+        self._file = open(path, "r+b")
+        self._map()
+
+
+    # the element count is kept in the file header, so every change of the size is
+    # visible to the other processes mapping the same file and survives a reopen.
+    # Another process may have grown the file past our mapping since we mapped it,
+    # so a count beyond the capacity means the file must be mapped again first
+    @property
+    def _n(self):
+        n = self._count[0]
+        if n > self._capacity:
+            self._remap()
+        return n
+
+    @_n.setter
+    def _n(self, value):
+        self._count[0] = value
+
+
+    def flush(self):
+        """Write the dirty pages back to the file"""
+        self._mmap.flush()
+
+
+    def close(self):
+        """Flush and unmap the array, the object can't be used afterwards"""
+        if self._file.closed:
+            return
+        self.flush()
+        self._unmap()
+        self._file.close()
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *args):
+        self.close()
+
+
+    def __imul__(self, const):
+        """In-place multiplication"""
+        """Time Complexity O(k*n)"""
+        if not isinstance(const, int) or const <= 0:
+            raise ValueError("The constant must be a positive integer")
+        if const > 1:
+            self.extend(self._copy() * (const - 1))   # the storage must stay in the file
+        return self
+
+
+    def __repr__(self):
+        """Representation of the MappedArray Object"""
+        return f"MappedArray({self._path!r}, {list(self)}, typecode={self._typecode!r})"
+
+
+    def _map(self):
+        """Map the whole file and view the header count and the elements"""
+        self._mmap = mmap.mmap(self._file.fileno(), 0)
+        self._count = memoryview(self._mmap)[8:self.HEADER.size].cast("Q")
+        self._array = memoryview(self._mmap)[self.HEADER.size:].cast(self._typecode)
+        self._capacity = len(self._array)
+
+
+    def _remap(self):
+        """Map the file again after another process grew it"""
+        # the old mapping isn't closed: views still using it (our own or exported ones)
+        # stay valid, as the file only grew, and it's unmapped once they're all gone
+        self._map()
+
+
+    def _unmap(self):
+        """Release the views and the mapping of the file"""
+        self._count.release()
+        self._array.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            # somebody still holds a view (e.g. from tobuffer() or numpy), truncating
+            # the file under that view could crash the process, so refuse to do it
+            self._map()
+            raise BufferError("release the exported buffers before resizing or closing") from None
+
+
+    def _resize(self, capacity):
+        """Grow or shrink the file in place, the elements are not copied"""
+        if capacity > self._capacity:
+            self._grows += 1
+        elif capacity < self._capacity:
+            self._shrinks += 1
+        self._version += 1
+        self._unmap()
+        self._file.truncate(self.HEADER.size + capacity * array.array(self._typecode).itemsize)
+        self._map()
+
+
+    def _copy(self, key=None):
+        """Return an in-memory copy of the live elements (or of the given slice of them)"""
+        if key is None:
+            key = slice(0, self._n)
+        return array.array(self._typecode, self._array[key].tobytes())
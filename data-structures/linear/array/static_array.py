@@ -1,30 +1,32 @@
 import ctypes
+import array     # for low-level typed (primitive) arrays
 
-class StaticArray:
-    def __init__(self, array):
+# the zero-copy views and the (NumPy vectorized) batch operations are shared with DynamicArray
+from dynamic_array import ArrayView, BatchOperations
+
+class StaticArray(BatchOperations):
+    # StaticArray([1, 2, 3], typecode='q') stores the raw values in a contiguous
+    # typed array (see the `array` module for the typecodes) instead of py_objects
+    _not_found = "item doesn't exist in the array"   # message of the ValueError raised by index()
+    _version = 0   # a static array never resizes or shifts, so its views never go stale
+
+    def __init__(self, array, typecode=None):
         """initializing a new static array"""
+        self._typecode = typecode   # None means object mode (heterogeneous data)
         self._n = len(array)    # total elements
-        self._array = (self._n * ctypes.py_object)() # creating a low-level python array with size of self._n
-        for i in range(self._n):
-            self._array[i] = array[i]
-
-    def index(self, item):
-        """search for an item in the static array and return the index of the first occurrence of that item"""
-        """Time Complexity O(n)"""
-        for i in range(self._n):
-            if self._array[i] == item:
-                return i
-        raise ValueError("item doesn't exist in the array")
+        self._array = self._make_array(array)
 
 
-    def count(self, item):
-        """Count the num of occurrences of an item in an array"""
-        """Time Complexity O(n)"""
-        return sum(1 for i in self if i == item)
+    def view(self, start=None, stop=None, step=None):
+        """Return a zero-copy ArrayView, like self[start:stop:step] without copying"""
+        """Time Complexity O(1)"""
+        return ArrayView(self, range(*slice(start, stop, step).indices(self._n)))
 
 
     def __repr__(self):
         """Representation of a static array"""
+        if self._typecode is not None:
+            return f"StaticArray({list(self)}, typecode={self._typecode!r})"
         return f"StaticArray({list(self)})"
 
 
@@ -53,3 +55,22 @@ class StaticArray:
         if isinstance(key, slice):
             start, stop, step = key.indices(self._n)   # handing slicing
             return self._array[start:stop:step]
+
+
+    def _from_values(self, values, typecode):
+        """Return a new StaticArray with the given values (for the batch operations)"""
+        if not isinstance(values, (list, array.array)):
+            values = list(values)
+        return StaticArray(values, typecode)
+
+
+    def _make_array(self, values):
+        """Return a low-level array filled with the given values"""
+        if self._typecode is not None:
+            if isinstance(values, array.array) and values.typecode == self._typecode:
+                return array.array(self._typecode, values.tobytes())   # a single block copy
+            return array.array(self._typecode, values)
+        low_level = (self._n * ctypes.py_object)() # creating a low-level python array with size of self._n
+        for i in range(self._n):
+            low_level[i] = values[i]
+        return low_level
@@ -0,0 +1,283 @@
+"""
+We will implement the deque (double-ended-queue) using a circular array, the same
+way the circular array based queue works, but the front can move both ways.
+append, appendleft, pop and popleft are O(1) (amortized) and, unlike the linked
+deques, reaching any element by its index is O(1) as well since it's at
+(front + index) % capacity. Pushing doesn't allocate a node either.
+
+With a maxlen the deque is bounded: once it's full, appending on one end drops
+the element on the other end (like collections.deque).
+"""
+import ctypes
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "array"))   # see growth_policy.py
+from growth_policy import GrowthPolicy
+from dynamic_array import _VACANT
+
+
+class Deque:
+    def __init__(self, deque=None, maxlen=None, policy=None):
+        if maxlen is not None and maxlen < 0:
+            raise ValueError("maxlen must be non-negative")
+        self._n = 0   # total elements
+        self._maxlen = maxlen
+        self._policy = policy if policy is not None else GrowthPolicy()
+        self._grows = self._shrinks = 0   # resize counters
+        self._capacity = self._policy.min_capacity  # default-capacity is 1
+        self._front = 0   # index of the first element of the deque
+        self._deque = self._make_array(self._capacity)
+        if deque is not None:
+            for data in deque: self.append(data)
+
+
+    def append(self, data):
+        """append an element at the end of the Deque"""
+        """Time Complexity O(1) (amortized)"""
+        if self._n == self._maxlen:   # bounded and full, make room on the other end
+            if self._maxlen == 0:
+                return
+            self.popleft()
+        if self._n == self._capacity:
+            self._grow()
+        self._deque[(self._front + self._n) % self._capacity] = data
+        self._n += 1
+
+
+    def appendleft(self, data):
+        """append an element at the start of the Deque"""
+        """Time Complexity O(1) (amortized)"""
+        if self._n == self._maxlen:   # bounded and full, make room on the other end
+            if self._maxlen == 0:
+                return
+            self.pop()
+        if self._n == self._capacity:
+            self._grow()
+        self._front = (self._front - 1) % self._capacity
+        self._deque[self._front] = data
+        self._n += 1
+
+
+    def extend(self, other):
+        """append all the elements of an iterable at the end"""
+        """Time Complexity O(k) (amortized)"""
+        for data in other:
+            self.append(data)
+
+
+    def extendleft(self, other):
+        """appendleft all the elements of an iterable (so they end up reversed)"""
+        """Time Complexity O(k) (amortized)"""
+        for data in other:
+            self.appendleft(data)
+
+
+    def pop(self):
+        """Remove and return the last element"""
+        """Time Complexity O(1) (amortized)"""
+        if not self._n:
+            raise ValueError("Empty Deque")
+
+        end = (self._front + self._n - 1) % self._capacity
+        value = self._deque[end]
+        self._deque[end] = _VACANT
+        self._n -= 1
+        if self._n <= self._shrink_at:
+            self._shrink()
+        return value
+
+
+    def popleft(self):
+        """Remove and return the first element"""
+        """Time Complexity O(1) (amortized)"""
+        if not self._n:
+            raise ValueError("Empty Deque")
+
+        value = self._deque[self._front]
+        self._deque[self._front] = _VACANT
+        self._front = (self._front + 1) % self._capacity
+        self._n -= 1
+        if self._n <= self._shrink_at:
+            self._shrink()
+        return value
+
+
+    def end(self):
+        """Get the last item from the deque without removing it"""
+        """Time Complexity O(1)"""
+        if self.isempty():
+            raise ValueError("Empty Deque")
+        return self._deque[(self._front + self._n - 1) % self._capacity]
+    last = end
+
+
+    def front(self):
+        """Get the first element from the deque"""
+        """Time Complexity O(1)"""
+        if self.isempty():
+            raise ValueError("Empty Deque")
+        return self._deque[self._front]
+    first = front
+
+
+    def rotate(self, k=1):
+        """Rotate the deque k steps to the right (to the left if k is negative)"""
+        """Time Complexity O(min(k, n - k)), O(1) when the array is full"""
+        if self._n <= 1:
+            return
+        k %= self._n
+        if self._n == self._capacity:
+            # no gap in the ring, moving the front is enough
+            self._front = (self._front - k) % self._capacity
+            return
+        # otherwise move whichever side is shorter across the gap, one slot at a time
+        if k <= self._n // 2:
+            for _ in range(k):   # last element -> before the front
+                end = (self._front + self._n - 1) % self._capacity
+                self._front = (self._front - 1) % self._capacity
+                self._deque[self._front] = self._deque[end]
+                self._deque[end] = _VACANT
+        else:
+            for _ in range(self._n - k):   # first element -> after the end
+                end = (self._front + self._n) % self._capacity
+                self._deque[end] = self._deque[self._front]
+                self._deque[self._front] = _VACANT
+                self._front = (self._front + 1) % self._capacity
+
+
+    def isempty(self):
+        """Time Complexity O(1)"""
+        return self._n == 0
+
+
+    def clear(self):
+        """Remove all the elements"""
+        """Time Complexity O(1)"""
+        self._front = self._n = 0
+        self._deque = self._make_array(self._policy.min_capacity)
+
+
+    def index(self, data, start=0):
+        """return the first index of data"""
+        """Time Complexity O(n)"""
+        for current_index in range(max(0, start), self._n):
+            if self._deque[(self._front + current_index) % self._capacity] == data:
+                return current_index
+        raise ValueError("Value not in the Deque")
+
+
+    def reserve(self, capacity):
+        """Make sure the deque can hold `capacity` elements without resizing"""
+        """Time Complexity O(n)"""
+        if capacity > self._capacity:
+            self._resize(capacity)
+
+
+    def shrink_to_fit(self):
+        """Release the unused capacity"""
+        """Time Complexity O(n)"""
+        capacity = max(self._policy.min_capacity, self._n)
+        if capacity != self._capacity:
+            self._resize(capacity)
+
+
+    def resize_stats(self):
+        """Return how many times the deque grew and shrank, to tune the growth policy"""
+        return {"grows": self._grows, "shrinks": self._shrinks, "capacity": self._capacity}
+
+
+    @property
+    def maxlen(self):
+        return self._maxlen
+
+
+    def tolist(self):
+        """traverse the whole Deque and return that list"""
+        return list(self)
+
+
+    def __getitem__(self, key):
+        """get data from the Deque using indexing and slicing"""
+        """Time Complexity O(1) (indexing)"""
+        """Time Complexity O(k) (slicing)"""
+        if isinstance(key, int):
+            if key < 0:
+                key += self._n    # handle negative index
+            if key < 0 or key >= self._n:
+                raise IndexError("Deque index out of range")
+            return self._deque[(self._front + key) % self._capacity]
+
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self._n)
+            return [self._deque[(self._front + i) % self._capacity] for i in range(start, stop, step)]
+
+        raise TypeError(f"Invalid key type: {type(key).__name__}")
+
+
+    def __setitem__(self, key, data):
+        """replace the element at an index"""
+        """Time Complexity O(1)"""
+        if key < 0:
+            key += self._n
+        if key < 0 or key >= self._n:
+            raise IndexError("Deque index out of range")
+        self._deque[(self._front + key) % self._capacity] = data
+
+
+    def __iter__(self):
+        """Iterator for the Deque object"""
+        for i in range(self._n):
+            yield self._deque[(self._front + i) % self._capacity]
+
+
+    def __repr__(self):
+        """Representation of a Deque object"""
+        values = map(str, self.tolist())
+        sep = ' \u21cc '
+        return f"Deque({sep.join(values)})"
+
+
+    def __len__(self):
+        """Get the length of the Deque"""
+        return self._n
+    size = __len__
+
+
+    def _grow(self):
+        capacity = self._policy.grow(self._capacity, self._n + 1)
+        if self._maxlen is not None:
+            capacity = min(capacity, self._maxlen)   # a bounded deque never needs more
+        self._resize(capacity)
+
+
+    def _shrink(self):
+        # shrink only after the pop, so the policy sees the real occupancy
+        # (pop and popleft only call this once the size is down to _shrink_at)
+        capacity = self._policy.shrink(self._capacity, self._n)
+        if capacity is not None:
+            self._resize(capacity)
+
+
+    def _resize(self, capacity):
+        if capacity > self._capacity:
+            self._grows += 1
+        elif capacity < self._capacity:
+            self._shrinks += 1
+        old, old_capacity = self._deque, self._capacity
+        aux = self._make_array(capacity)
+        # copy the (up to two) runs of the ring in order to the start of the new array
+        first = min(self._n, old_capacity - self._front)
+        aux[:first] = old[self._front:self._front + first]
+        aux[first:self._n] = old[:self._n - first]
+        self._deque = aux
+        self._front = 0
+
+
+    def _make_array(self, capacity):
+        self._capacity = capacity
+        # size at or below which the policy may want to shrink, precomputed so
+        # the pops can skip calling it (-1 when it never shrinks)
+        threshold = self._policy.shrink_threshold
+        self._shrink_at = -1 if threshold is None else int(capacity * threshold)
+        return (self._capacity * ctypes.py_object)()
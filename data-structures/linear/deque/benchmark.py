@@ -0,0 +1,67 @@
+"""
+The circular array Deque against the linked Deque and collections.deque
+
+# run from anywhere, optionally with the number of elements
+❯ python3 data-structures/linear/deque/benchmark.py 100000
+"""
+import collections
+import os
+import random
+import sys
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import array_deque
+import deque
+
+
+def timeit(func, repeat=3):
+    """Return the best wall-clock time of `repeat` runs of func"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        func()
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def bench_deques(n, ops=1000):
+    """Churn at both ends, random indexing and rotation on the three deques (ms, best of 3)"""
+    print(f"\n{n:,} elements (ms, best of 3)")
+    print(f"{'workload':<30}{'collections':>14}{'array Deque':>14}{'linked Deque':>14}")
+    containers = (collections.deque(range(n)), array_deque.Deque(range(n)), deque.Deque(range(n)))
+    positions = [random.randrange(n) for _ in range(ops)]
+
+    def churn(container):
+        def run():
+            for i in range(n):
+                container.append(i)
+                container.popleft()
+                container.appendleft(i)
+                container.pop()
+        return run
+
+    def random_access(container):
+        def run():
+            for i in positions:
+                container[i]
+        return run
+
+    def rotate(container):
+        def run():
+            for k in (n // 3, -n // 3, 1, -1):
+                container.rotate(k)
+        return run
+
+    workloads = [(f"{n:,} x 4 end operations", churn),
+                 (f"{ops} random indexes", random_access)]
+    for name, make in workloads:
+        print(f"{name:<30}" + "".join(f"{timeit(make(c)) * 1000:>14.3f}" for c in containers))
+    # the linked Deque has no rotate
+    print(f"{'rotate by n/3 and 1':<30}" + "".join(f"{timeit(rotate(c)) * 1000:>14.3f}" for c in containers[:2]))
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    bench_deques(n)
@@ -4,6 +4,15 @@ In this implementation we can append, appendleft, pop and popleft in constant
 time. The deque will have two pointers (head and tail) and each node in the deque
 will have two pointers (prev and next)
 """
+import os
+import sys
+
+# the pool of removed nodes is shared by all the linked containers, it lives with the linked lists
+_LINKED_LIST_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "linked-list"))
+if _LINKED_LIST_DIR not in sys.path:
+    sys.path.append(_LINKED_LIST_DIR)
+from node_pool import NodePool
+
 
 class Deque:
     class Node:
@@ -11,6 +20,8 @@ class Deque:
         # Each Node has a data and two pointers
         # one pointer to the next Node
         # another to the prev Node
+        __slots__ = ("data", "next", "prev")
+
         def __init__(self, data, next=None, prev=None):
             self.data = data # data stored in the current Node
 
@@ -34,10 +45,11 @@ class Deque:
     # Each Deque has a head and tail pointer
     # head points to the first Node and tail points to the last Node
     # If there is no Node (the linked list is empty) then head and tail points to None
-    def __init__(self, linkedlist=None):
+    def __init__(self, linkedlist=None, pool_size=0):
         self.head = None  # the head pointer
         self.tail = None   # the tail pointer
         self._n = 0    # total nodes
+        self._pool = NodePool(pool_size)
 
         # Deque(['A', 'B', 'C', 'D']) to A ⇌ B ⇌ C ⇌ D
         if linkedlist is not None:
@@ -47,7 +59,7 @@ class Deque:
     def append(self, data):
         """append a new Node at the end of the Deque"""
         """Time Complexity O(1)"""
-        new_node = self.Node(data)   # create a new node
+        new_node = self._pool.acquire(self.Node, data)   # create a new node
 
         # case 1: the list is empty
         if self.isempty():
@@ -66,7 +78,7 @@ class Deque:
     def appendleft(self, data):
         """append a new Node at the start of the Deque"""
         """Time Complexity O(1)"""
-        new_node = self.Node(data)    # Create the new node
+        new_node = self._pool.acquire(self.Node, data)    # Create the new node
 
         # case 1: the list is empty
         if self.isempty():
@@ -87,13 +99,15 @@ class Deque:
         if self.isempty(): # no element can be popped from an empty list
             raise ValueError("Empty Deque")
 
-        value = self.tail.data
+        node = self.tail
+        value = node.data
         if self.head.next is None:  # if there is only one element
             self.head = self.tail = None
         else:   # there is more than 1 element
             self.tail.prev.next = None
             self.tail = self.tail.prev
 
+        self._pool.release(node)
         self._n -= 1
         return value
 
@@ -114,7 +128,8 @@ class Deque:
         if self.isempty():
             raise ValueError("Empty Deque")
 
-        value = self.head.data
+        node = self.head
+        value = node.data
         # Case 2: total nodes (1)
         if self.head.next is None:
             self.head = self.tail = None
@@ -123,6 +138,7 @@ class Deque:
             self.head = self.head.next
             self.head.prev = None
 
+        self._pool.release(node)
         self._n -= 1
         return value
 
@@ -5,6 +5,15 @@ a doubly linked list with sentinels under the hood).
 Sentinels are used in a doubly linked list to simplify the implementations as using them removes the corner cases.
 Two dummy nodes named generally `header` and `trailer`, work as sentinels (guards) in the Doubly Linked List
 """
+import os
+import sys
+
+# the pool of removed nodes is shared by all the linked containers, it lives with the linked lists
+_LINKED_LIST_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "linked-list"))
+if _LINKED_LIST_DIR not in sys.path:
+    sys.path.append(_LINKED_LIST_DIR)
+from node_pool import NodePool
+
 
 class Deque:
     class Node:
@@ -12,7 +21,9 @@ class Deque:
         # Each Node has a data and two pointers
         # one pointer to the next Node
         # another to the prev Node
-        def __init__(self, data, prev, next):
+        __slots__ = ("data", "prev", "next")
+
+        def __init__(self, data, prev=None, next=None):
             self.data = data # data stored in the current Node
 
             # each Node points to the next and prev Node of the Linked List
@@ -29,12 +40,14 @@ class Deque:
     # If there is no Node (the linked list is empty) then
     # Header's next pointer will point to Trailer
     # and Trailer's prev pointer will point to Header
-    def __init__(self, linkedlist=None):
+    def __init__(self, linkedlist=None, pool_size=0):
         self.header = self.Node(None, None, None)  # the header sentinel
         self.trailer = self.Node(None, None, None)   # the trailer sentinel
         self.header.next = self.trailer
         self.trailer.prev = self.header
         self._n = 0    # total nodes
+        # the nodes never leave the deque, so pooling is always safe here
+        self._pool = NodePool(pool_size)
 
         # Deque(['A', 'B', 'C', 'D']) to A ⇌ B ⇌ C ⇌ D
         if linkedlist is not None:
@@ -43,7 +56,8 @@ class Deque:
 
     def _insert_between(self, data, predecessor, successor):
         """Add new node with `data` between two existing nodes and return the new node"""
-        new_node = self.Node(data, predecessor, successor)
+        new_node = self._pool.acquire(self.Node, data)
+        new_node.prev, new_node.next = predecessor, successor
 
         predecessor.next = new_node
         successor.prev = new_node
@@ -74,6 +88,7 @@ class Deque:
         successor.prev = predecessor
 
         node.prev = node.next = node.data = None   # deprecate node
+        self._pool.release(node)
 
         self._n -= 1
         return value
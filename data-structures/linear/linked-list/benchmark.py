@@ -0,0 +1,184 @@
+"""
+Rough memory and time measurements of the linked structures (linked lists, the
+linked deques and the linked queue)
+
+# run from anywhere, optionally with the number of elements
+❯ python3 data-structures/linear/linked-list/benchmark.py 100000
+"""
+import os
+import random
+import sys
+import tracemalloc
+from time import perf_counter
+
+here = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [os.path.join(here, "..", "deque"), os.path.join(here, "..", "queue"),
+                os.path.join(here, "..", "array")]
+
+import singly_linked_list
+import doubly_linked_list
+import singly_circular_linked_list
+import doubly_circular_linked_list
+import positional_list
+import deque
+import positional_deque
+import linked_list_based_queue
+import unrolled_linked_list
+import indexable_skip_list
+from dynamic_array import DynamicArray
+
+
+# (name, container class, where its node class lives, node class attribute, method to add one element)
+STRUCTURES = [
+    ("SinglyLinkedList", singly_linked_list.SinglyLinkedList,
+        singly_linked_list.SinglyLinkedList, "Node", "append"),
+    ("DoublyLinkedList", doubly_linked_list.DoublyLinkedList,
+        doubly_linked_list.DoublyLinkedList, "Node", "append"),
+    ("CircularLinkedList (singly)", singly_circular_linked_list.CircularLinkedList,
+        singly_circular_linked_list.CircularLinkedList, "Node", "append"),
+    ("CircularLinkedList (doubly)", doubly_circular_linked_list.CircularLinkedList,
+        doubly_circular_linked_list.CircularLinkedList, "Node", "append"),
+    ("PositionalList", positional_list.PositionalList,
+        positional_list.PositionalList, "_Node", "append"),
+    ("Deque (linked)", deque.Deque, deque.Deque, "Node", "append"),
+    ("Deque (positional)", positional_deque.Deque, positional_deque.Deque, "Node", "append"),
+    ("Queue (linked)", linked_list_based_queue.Queue, linked_list_based_queue, "Node", "enqueue"),
+]
+
+
+def timeit(func, repeat=3):
+    """Return the best wall-clock time of `repeat` runs of func"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        func()
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def without_slots(node_class):
+    """Return a copy of node_class that keeps its attributes in a per instance __dict__"""
+    slots = getattr(node_class, "__slots__", ())
+    attrs = {k: v for k, v in vars(node_class).items()
+             if k not in slots and k not in ("__slots__", "__dict__", "__weakref__")}
+    return type(node_class.__name__, (), attrs)
+
+
+def bytes_per_element(container_class, add, values):
+    """Traced memory of a container holding `values`, divided by their number"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    container = container_class()
+    for value in values:
+        getattr(container, add)(value)
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del container
+    return used / len(values)
+
+
+def bench_memory(n):
+    """Bytes per element with plain (__dict__) nodes versus __slots__ nodes"""
+    values = list(range(n))   # created up front so the ints are not counted
+    print(f"\n{n:,} elements, bytes per element (element objects not included)")
+    print(f"{'structure':<30}{'plain nodes':>14}{'__slots__':>14}")
+    for name, container_class, owner, attr, add in STRUCTURES:
+        slotted = getattr(owner, attr)
+        setattr(owner, attr, without_slots(slotted))
+        try:
+            plain = bytes_per_element(container_class, add, values)
+        finally:
+            setattr(owner, attr, slotted)
+        print(f"{name:<30}{plain:>14.1f}{bytes_per_element(container_class, add, values):>14.1f}")
+
+
+def bench_churn(n):
+    """Time of n append + popleft pairs on a non-empty structure, with and without a node pool"""
+    print(f"\n{n:,} append/popleft pairs (ms, best of 3)")
+    print(f"{'structure':<30}{'no pool':>14}{'pool':>14}")
+    churn = [
+        ("DoublyLinkedList", doubly_linked_list.DoublyLinkedList, "append", "popleft"),
+        ("Deque (linked)", deque.Deque, "append", "popleft"),
+        ("Deque (positional)", positional_deque.Deque, "append", "popleft"),
+        ("Queue (linked)", linked_list_based_queue.Queue, "enqueue", "dequeue"),
+    ]
+    for name, container_class, add, remove in churn:
+        timings = []
+        for pool_size in (0, 1024):
+            container = container_class(range(1000), pool_size=pool_size)
+            push, pop = getattr(container, add), getattr(container, remove)
+            def run():
+                for i in range(n):
+                    push(i)
+                    pop()
+            timings.append(timeit(run))
+        print(f"{name:<30}" + "".join(f"{t * 1000:>14.3f}" for t in timings))
+
+
+def bench_unrolled(n, ops=200):
+    """Insert-heavy and scan-heavy workloads on UnrolledLinkedList, DoublyLinkedList and DynamicArray"""
+    print(f"\n{n:,} elements (ms, best of 3)")
+    print(f"{'workload':<30}{'Unrolled':>14}{'DoublyLinked':>14}{'DynamicArray':>14}")
+    containers = (unrolled_linked_list.UnrolledLinkedList(range(n)),
+                  doubly_linked_list.DoublyLinkedList(range(n)),
+                  DynamicArray(range(n)))
+    positions = [random.randrange(n) for _ in range(ops)]
+
+    def inserts(container):
+        def run():
+            for i in positions:
+                container.insert(i, i)
+        return run
+
+    def scan(container):
+        def run():
+            for _ in container:
+                pass
+        return run
+
+    def index_last(container):
+        last = container[-1]
+        return lambda: container.index(last)
+
+    def middle_slice(container):
+        return lambda: container[n // 4:n // 4 + 1000]
+
+    for name, make in ((f"{ops} random inserts", inserts),
+                       ("iterate", scan),
+                       ("index of the last element", index_last),
+                       ("slice of 1000 (middle)", middle_slice)):
+        print(f"{name:<30}" + "".join(f"{timeit(make(c)) * 1000:>14.3f}" for c in containers))
+
+
+def bench_positional(n, ops=200):
+    """Random get/insert/pop at arbitrary indices on IndexableSkipList, UnrolledLinkedList and DoublyLinkedList"""
+    print(f"\n{n:,} elements, {ops} random positional edits (ms, best of 3)")
+    print(f"{'workload':<30}{'SkipList':>14}{'Unrolled':>14}{'DoublyLinked':>14}")
+    containers = (indexable_skip_list.IndexableSkipList(range(n)),
+                  unrolled_linked_list.UnrolledLinkedList(range(n)),
+                  doubly_linked_list.DoublyLinkedList(range(n)))
+    positions = [random.randrange(n // 2) for _ in range(ops)]
+
+    def gets(container):
+        def run():
+            for i in positions:
+                container[i]
+        return run
+
+    def edits(container):
+        def run():   # one insert and one pop per position, so the size stays the same
+            for i in positions:
+                container.insert(i, i)
+                container.pop(i)
+        return run
+
+    for name, make in (("random get", gets), ("random insert + pop", edits)):
+        print(f"{name:<30}" + "".join(f"{timeit(make(c)) * 1000:>14.3f}" for c in containers))
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    bench_memory(n)
+    bench_churn(n)
+    bench_unrolled(n)
+    bench_positional(n)
@@ -1,9 +1,14 @@
+from node_pool import NodePool
+
+
 class CircularLinkedList:
     class Node:
         """each Node of a Linked List structure"""
         # Each Node has a data and two pointers
         # one pointer to the next Node
         # another to the prev Node
+        __slots__ = ("data", "next", "prev")
+
         def __init__(self, data, next=None, prev=None):
             self.data = data # data stored in the current Node
 
@@ -24,10 +29,11 @@ class CircularLinkedList:
             return f"Node({self.prev.data} <- {self.data} -> {self.next.data})"
 
 
-    def __init__(self, linkedlist=None):
+    def __init__(self, linkedlist=None, pool_size=0):
         # we don't need the tail pointer as head.prev = tail
         self.head = None   # the head pointer
         self._n = 0    # total nodes
+        self._pool = NodePool(pool_size)
 
         # DoublyLinkedList(['A', 'B', 'C', 'D']) to A ⇌ B ⇌ C ⇌ D ⇌ A ...
         if linkedlist is not None:
@@ -54,7 +60,7 @@ class CircularLinkedList:
 
     def append(self, data):
         """append a new Node at the end of the Linked List"""
-        new_node = self.Node(data)   # create a new node
+        new_node = self._pool.acquire(self.Node, data)   # create a new node
 
         # case 1: the list is empty
         if self.head is None:
@@ -73,7 +79,7 @@ class CircularLinkedList:
 
     def appendleft(self, data):
         """append a new Node at the start of the Linked List"""
-        new_node = self.Node(data)    # Create the new node
+        new_node = self._pool.acquire(self.Node, data)    # Create the new node
 
         # case 1: the list is empty
         if self.head is None:
@@ -104,7 +110,7 @@ class CircularLinkedList:
             self.append(data)
             return
 
-        new_node = self.Node(data)
+        new_node = self._pool.acquire(self.Node, data)
 
         # if index is smaller or equal than half of the total nodes
         # then start traversing from the head
@@ -216,6 +222,7 @@ class CircularLinkedList:
 
 
     def popleft(self):
+        node = self.head
         # Case 1: empty
         if self._n == 0:
             raise ValueError("Empty Linked List")
@@ -231,6 +238,7 @@ class CircularLinkedList:
             self.head.prev = tail
             tail.next = self.head
 
+        self._pool.release(node)
         self._n -= 1
         return value
 
@@ -1,9 +1,14 @@
+from node_pool import NodePool
+
+
 class DoublyLinkedList:
     class Node:
         """each Node of a Linked List structure"""
         # Each Node has a data and two pointers
         # one pointer to the next Node
         # another to the prev Node
+        __slots__ = ("data", "next", "prev")
+
         def __init__(self, data, next=None, prev=None):
             self.data = data # data stored in the current Node
 
@@ -27,14 +32,19 @@ class DoublyLinkedList:
     # Each Linked List has a head and tail pointer
     # head points to the first Node and tail points to the last Node
     # If there is no Node (the linked list is empty) then head and tail points to None
-    def __init__(self, linkedlist=None):
+    def __init__(self, linkedlist=None, pool_size=0):
         self.head = None  # the head pointer
         self.tail = None   # the tail pointer
         self._n = 0    # total nodes
+        # (index, node) of the last node reached by getnode, so that sequential or
+        # nearby indexing walks from there instead of from the head. Anything that
+        # shifts the indices of existing nodes resets it
+        self._cursor = None
+        self._pool = NodePool(pool_size)
 
         # DoublyLinkedList(['A', 'B', 'C', 'D']) to A ⇌ B ⇌ C ⇌ D
         if linkedlist is not None:
-            for data in linkedlist: self.append(data)
+            self.extend(linkedlist)
 
 
     def index(self, data, start=0):
@@ -52,7 +62,7 @@ class DoublyLinkedList:
 
     def append(self, data):
         """append a new Node at the end of the Linked List"""
-        new_node = self.Node(data)   # create a new node
+        new_node = self._pool.acquire(self.Node, data)   # create a new node
 
         # case 1: the list is empty
         if self.head is None:
@@ -70,7 +80,8 @@ class DoublyLinkedList:
 
     def appendleft(self, data):
         """append a new Node at the start of the Linked List"""
-        new_node = self.Node(data)    # Create the new node
+        self._cursor = None
+        new_node = self._pool.acquire(self.Node, data)    # Create the new node
 
         # case 1: the list is empty
         if self.head is None:
@@ -87,6 +98,7 @@ class DoublyLinkedList:
 
     def insert(self, index, data):
         """insert data before index"""
+        self._cursor = None
         if index < 0:
             if self._n == 0:
                 self.append(data)
@@ -100,7 +112,7 @@ class DoublyLinkedList:
             self.append(data)
             return
 
-        new_node = self.Node(data)
+        new_node = self._pool.acquire(self.Node, data)
 
         # if index is smaller or equal than half of the total nodes
         # then start traversing from the head
@@ -142,26 +154,100 @@ class DoublyLinkedList:
 
 
     def extend(self, other):
-        """Extend current list with the elements from other list (in-place)"""
-        self.tail.next = other.head
-        other.head.prev = self.tail
-        self.tail = other.tail
+        """Extend current list with the elements from another iterable (in-place)"""
+        """Time Complexity O(k)"""
+        # the new nodes are chained up first and linked in one go
+        first, last, count = self._chain(other)
+        if count == 0:
+            return
+        if self.head is None:
+            self.head = first
+        else:
+            self.tail.next = first
+            first.prev = self.tail
+        self.tail = last
+        self._n += count
+
+
+    def insert_many(self, index, values):
+        """insert all the values before index, keeping their order"""
+        """Time Complexity O(min(index, n - index) + k)"""
+        index = slice(index, None).indices(self._n)[0]   # list-like clamping of the index
+        if index == self._n:
+            self.extend(values)
+            return
+        first, last, count = self._chain(values)
+        if count == 0:
+            return
+
+        next_node = self.getnode(index)
+        prev_node = next_node.prev
+        first.prev, last.next = prev_node, next_node
+        next_node.prev = last
+        if prev_node is None:
+            self.head = first
+        else:
+            prev_node.next = first
+        self._cursor = None   # getnode cached an index that just shifted
+        self._n += count
+
 
+    def splice(self, other):
+        """move all the nodes of other (a DoublyLinkedList) to the end of this list, leaving other empty"""
+        """Time Complexity O(1)"""
+        if not isinstance(other, DoublyLinkedList):
+            raise TypeError(f"can only splice a DoublyLinkedList, not {type(other).__name__}")
+        if other is self or other.head is None:
+            return
+        if self.head is None:
+            self.head = other.head
+        else:
+            self.tail.next = other.head
+            other.head.prev = self.tail
+        self.tail = other.tail
         self._n += other._n
 
+        other.head = other.tail = None
+        other._n = 0
+        other._cursor = None
+
+
+    def split_at(self, index):
+        """cut the list in two: this list keeps the items before index,
+        the items from index on are moved (not copied) to the returned list"""
+        """Time Complexity O(min(index, n - index))"""
+        index = slice(index, None).indices(self._n)[0]   # list-like clamping of the index
+        res = type(self)(pool_size=self._pool.size)
+        if index == self._n:
+            return res
+
+        first = self.getnode(index)   # walks from whichever end is closer
+        self._cursor = None
+        res.head, res.tail = first, self.tail
+        self.tail = first.prev
+        first.prev = None
+        if self.tail is None:
+            self.head = None
+        else:
+            self.tail.next = None
+        res._n = self._n - index
+        self._n = index
+        return res
+
 
     def pop(self, index=None):
         """Pop an item from the list using indexing"""
         if self._n == 0:   # no element can be popped from an empty list
             raise ValueError("Empty Linked List")
+        self._cursor = None
         if index is None or index >= self._n:   # default is the last item
             index = self._n - 1
-        if index == 0:
-            return self.popleft()
         if index < 0:
             index += self._n
         if index < 0:
             raise IndexError("Index out of range")
+        if index == 0:
+            return self.popleft()
 
         if index == self._n - 1:
             if self.head.next is None:  # if there is only one element
@@ -210,6 +296,8 @@ class DoublyLinkedList:
 
 
     def popleft(self):
+        self._cursor = None
+        node = self.head
         # Case 1: empty
         if self.head is None:
             raise ValueError("Empty Linked List")
@@ -223,6 +311,7 @@ class DoublyLinkedList:
             self.head = self.head.next
             self.head.prev = None
 
+        self._pool.release(node)
         self._n -= 1
         return value
 
@@ -246,6 +335,7 @@ class DoublyLinkedList:
     def reverse(self):
         """reverse the actual linked list in place
         like from A ⇌ B ⇌ C ⇌ D to D ⇌ C ⇌ B ⇌ A"""
+        self._cursor = None
         self.tail = self.head
         prev_visited = None
         current_node = self.head
@@ -273,27 +363,28 @@ class DoublyLinkedList:
 
     def getnode(self, index):
         """get Node from the Linked List using 0 indexing"""
+        """Time Complexity O(distance from the closest of head, tail and the last accessed node)"""
         if index < 0:
             index += self._n
         if index < 0 or index >= self._n:
             raise IndexError("Index out of range")
 
-        if index <= self._n // 2:
-            current_node = self.head
-            current_index = 0
+        # start from whichever of the head, the tail or the cached cursor is closer
+        current_index, current_node = 0, self.head
+        if self._n - 1 - index < index:
+            current_index, current_node = self._n - 1, self.tail
+        if self._cursor is not None and abs(self._cursor[0] - index) < abs(current_index - index):
+            current_index, current_node = self._cursor
 
-            while current_node is not None and current_index != index:
-                current_node = current_node.next
-                current_index += 1
-        else:
-            current_node = self.tail
-            current_index = self._n - 1
-
-            while current_node is not None and current_index != index:
-                current_node = current_node.prev
-                current_index -= 1
+        while current_node is not None and current_index < index:
+            current_node = current_node.next
+            current_index += 1
+        while current_node is not None and current_index > index:
+            current_node = current_node.prev
+            current_index -= 1
 
         if current_node is not None:
+            self._cursor = (current_index, current_node)
             return current_node
 
 
@@ -317,7 +408,24 @@ class DoublyLinkedList:
         # Supporting DoublyLinkList[2:3:2]
         if isinstance(key, slice):
             start, stop, step = key.indices(len(self))
-            return [self.getnode(k).data for k in range(start, stop, step)]
+            return self._slice(range(start, stop, step))
+
+
+    def _slice(self, indices):
+        """Collect the data at the given indices in a single walk (backwards for a negative step)"""
+        """Time Complexity O(k * |step| + distance to the first index)"""
+        if len(indices) == 0:
+            return []
+        step = indices.step
+
+        current_node = self.getnode(indices[0])
+        res = [current_node.data]
+        for _ in range(len(indices) - 1):
+            for _ in range(abs(step)):
+                current_node = current_node.next if step > 0 else current_node.prev
+            res.append(current_node.data)
+        self._cursor = (indices[-1], current_node)
+        return res
 
 
     def __iter__(self):
@@ -339,3 +447,19 @@ class DoublyLinkedList:
         """Get the length of the Singly Linked List"""
         return self._n
     size = __len__
+
+
+    def _chain(self, values):
+        """Link new nodes holding values into a chain, return (first, last, count)"""
+        first = last = None
+        count = 0
+        for data in values:
+            new_node = self._pool.acquire(self.Node, data)
+            new_node.prev = last
+            if first is None:
+                first = new_node
+            else:
+                last.next = new_node
+            last = new_node
+            count += 1
+        return first, last, count
@@ -0,0 +1,256 @@
+"""
+An indexable skip list is a sequence (kept in insertion order, not sorted) built as a
+linked list with extra "express lanes" on top of it. Every node is linked on level 0
+and, with probability 1/2, 1/4, 1/8, ... on the levels above, so a walk can skip
+over long runs of nodes.
+
+Each link also stores its span (width): how many positions it jumps over. Adding up
+the spans while walking tells us the index of the node we are standing on, so
+getting, inserting and deleting at an arbitrary index takes O(log n) expected time
+instead of the O(n) walk of a DoublyLinkedList.
+"""
+import random
+
+class IndexableSkipList:
+    MAX_LEVEL = 32   # enough express lanes for 2 ** 32 elements
+
+    class Node:
+        """each Node of a Skip List"""
+        # Each Node has a data and, for every level it's linked on, a pointer
+        # to the next Node on that level and the number of positions it spans
+        __slots__ = ("data", "next", "width")
+
+        def __init__(self, data, level):
+            self.data = data # data stored in the current Node
+            self.next = [None] * level
+            self.width = [0] * level
+
+
+        def __repr__(self):
+            """Represenattion of a Node object"""
+            return f"Node({self.data}, level={len(self.next)})"
+
+
+    # The head is a sentinel linked on every level, standing at position -1.
+    # Invariant: a link of a node at position p that points to None spans up to
+    # the virtual end of the list, i.e. its width is n - p
+    def __init__(self, linkedlist=None):
+        self._build(linkedlist if linkedlist is not None else ())
+
+
+    def _build(self, values):
+        """(Re)build the whole list from an iterable in O(n)"""
+        self.head = self.Node(None, self.MAX_LEVEL)
+        self._levels = 1   # number of levels in use
+        last = [self.head] * self.MAX_LEVEL   # last node linked on each level so far
+        last_position = [-1] * self.MAX_LEVEL
+
+        position = -1
+        for position, data in enumerate(values):
+            level = self._random_level()
+            self._levels = max(self._levels, level)
+            node = self.Node(data, level)
+            for lvl in range(level):
+                last[lvl].next[lvl] = node
+                last[lvl].width[lvl] = position - last_position[lvl]
+                last[lvl] = node
+                last_position[lvl] = position
+
+        self._n = position + 1
+        for lvl in range(self.MAX_LEVEL):   # the last link of every level spans to the end
+            last[lvl].width[lvl] = self._n - last_position[lvl]
+
+
+    def _random_level(self):
+        """Level of a new node, 1 with probability 1/2, 2 with 1/4, ..."""
+        level = 1
+        while level < self.MAX_LEVEL and random.random() < 0.5:
+            level += 1
+        return level
+
+
+    def _predecessors(self, index):
+        """Return, for every level, the last node before index and its position"""
+        update = [self.head] * self.MAX_LEVEL
+        positions = [-1] * self.MAX_LEVEL
+        node, position = self.head, -1
+        for lvl in reversed(range(self._levels)):
+            while node.next[lvl] is not None and position + node.width[lvl] < index:
+                position += node.width[lvl]
+                node = node.next[lvl]
+            update[lvl] = node
+            positions[lvl] = position
+        return update, positions
+
+
+    def getnode(self, index):
+        """get Node from the Skip List using 0 indexing"""
+        """Time Complexity O(log(n)) (expected)"""
+        if index < 0:
+            index += self._n
+        if index < 0 or index >= self._n:
+            raise IndexError("Index out of range")
+
+        node, position = self.head, -1
+        for lvl in reversed(range(self._levels)):
+            while node.next[lvl] is not None and position + node.width[lvl] <= index:
+                position += node.width[lvl]
+                node = node.next[lvl]
+        return node
+
+
+    def insert(self, index, data):
+        """insert data before index"""
+        """Time Complexity O(log(n)) (expected)"""
+        index = slice(index, None).indices(self._n)[0]   # list-like clamping of the index
+        level = self._random_level()
+        if level > self._levels:
+            self._levels = level   # the head's links on the new levels already span to the end
+
+        update, positions = self._predecessors(index)
+        new_node = self.Node(data, level)
+        for lvl in range(self.MAX_LEVEL):
+            prev = update[lvl]
+            if lvl < level:
+                # split prev's link in two around the new node
+                new_node.next[lvl] = prev.next[lvl]
+                new_node.width[lvl] = prev.width[lvl] - (index - positions[lvl]) + 1
+                prev.next[lvl] = new_node
+                prev.width[lvl] = index - positions[lvl]
+            else:
+                prev.width[lvl] += 1   # the link jumps over one more position now
+        self._n += 1
+
+
+    def append(self, data):
+        """append data at the end of the Skip List"""
+        """Time Complexity O(log(n)) (expected)"""
+        self.insert(self._n, data)
+
+
+    def appendleft(self, data):
+        """append data at the start of the Skip List"""
+        """Time Complexity O(log(n)) (expected)"""
+        self.insert(0, data)
+
+
+    def extend(self, other):
+        """Extend current list with the elements from an iterable (in-place)"""
+        """Time Complexity O(min(k*log(n), n + k)) (expected)"""
+        values = list(other)
+        # an insert costs about as much as rebuilding 4-5 nodes, so a small batch is
+        # inserted one by one and only a large one rebuilds the list in a single pass
+        if len(values) * 4 < self._n:
+            for data in values:
+                self.insert(self._n, data)
+        else:
+            self._build(self.tolist() + values)
+
+
+    def pop(self, index=None):
+        """Pop an item from the list using indexing"""
+        """Time Complexity O(log(n)) (expected)"""
+        if self._n == 0:   # no element can be popped from an empty list
+            raise ValueError("Empty Skip List")
+        if index is None:   # default is the last item
+            index = self._n - 1
+        if index < 0:
+            index += self._n
+        if index < 0 or index >= self._n:
+            raise IndexError("Index out of range")
+
+        update, _ = self._predecessors(index)
+        target = update[0].next[0]
+        for lvl in range(self.MAX_LEVEL):
+            prev = update[lvl]
+            if prev.next[lvl] is target:
+                # merge the two links around the target into one
+                prev.width[lvl] += target.width[lvl] - 1
+                prev.next[lvl] = target.next[lvl]
+            else:
+                prev.width[lvl] -= 1
+        self._n -= 1
+        return target.data
+
+
+    def popleft(self):
+        """Time Complexity O(log(n)) (expected)"""
+        return self.pop(0)
+
+
+    def index(self, data, start=0):
+        """return the first index of data"""
+        """Time Complexity O(n)"""
+        for current_index, value in enumerate(self):
+            if value == data and current_index >= start:
+                return current_index
+        raise ValueError("Value not in the Skip List")
+
+
+    def remove(self, value):
+        """Remove the first occurrence of value"""
+        """Time Complexity O(n)"""
+        self.pop(self.index(value))
+
+
+    def reverse(self):
+        """reverse the Skip List in place"""
+        """Time Complexity O(n)"""
+        self._build(self.tolist()[::-1])
+
+
+    def tolist(self):
+        """traverse the whole Skip List and return that list"""
+        return list(self)
+
+
+    def __getitem__(self, key):
+        """get data from the Skip List using indexing and slicing"""
+        """Time Complexity O(log(n)) (indexing)"""
+        """Time Complexity O(log(n) + k * |step|) (slicing)"""
+        if isinstance(key, int):
+            return self.getnode(key).data
+
+        if isinstance(key, slice):
+            indices = range(*key.indices(self._n))
+            if len(indices) == 0:
+                return []
+            forward = indices if indices.step > 0 else indices[::-1]
+            # jump to the first wanted node, then walk along level 0
+            current_node = self.getnode(forward[0])
+            res = [current_node.data]
+            for _ in range(len(forward) - 1):
+                for _ in range(forward.step):
+                    current_node = current_node.next[0]
+                res.append(current_node.data)
+            if indices.step < 0:
+                res.reverse()
+            return res
+
+        raise TypeError(f"Invalid key type: {type(key).__name__}")
+
+
+    def __setitem__(self, index, data):
+        """replace the data at index"""
+        """Time Complexity O(log(n)) (expected)"""
+        self.getnode(index).data = data
+
+
+    def __iter__(self):
+        """Iterator for the IndexableSkipList object"""
+        current_node = self.head.next[0]
+        while current_node is not None:
+            yield current_node.data
+            current_node = current_node.next[0]
+
+
+    def __repr__(self):
+        """Representation of a IndexableSkipList object"""
+        values = map(str, self.tolist())
+        return f"IndexableSkipList({' -> '.join(values)})"
+
+
+    def __len__(self):
+        """Get the length of the Skip List"""
+        return self._n
+    size = __len__
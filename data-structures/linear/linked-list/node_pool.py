@@ -0,0 +1,55 @@
+"""
+The free list of removed nodes used by the linked lists, the linked Deques and the
+linked Queue. A container given pool_size > 0 keeps up to that many removed nodes
+around and reuses them for new elements, so append/pop churn doesn't allocate a
+node every time.
+
+The node classes of those containers declare __slots__, which drops the per
+instance __dict__ and makes every node much smaller, and their constructors take
+the data first and default every link to None. The pool relies on the latter:
+Node(None) is a blank node, and acquire() only has to set the data of one.
+"""
+
+
+class NodePool(list):
+    """A stack of removed nodes waiting to be reused, holding at most `size` of them
+
+    A pooled node is handed out again for a new element, so a node you still hold a
+    reference to (e.g. one returned by getnode) can start showing another element
+    once it is removed from its container. Only enable pooling if you don't hold on
+    to nodes after removing them.
+    """
+    # a list subclass, so the checks, pop and append stay C calls
+    __slots__ = ("size",)
+
+    def __init__(self, size=0):
+        super().__init__()
+        self.size = size    # 0 disables pooling
+
+
+    def acquire(self, cls, data):
+        """Return a node holding data and no links, cls(data) or a released one"""
+        """Time Complexity O(1)"""
+        if self:
+            node = self.pop()
+            node.data = data
+            return node
+        return cls(data)
+
+
+    def release(self, node):
+        """Take back a node removed from its container (if the pool isn't full)"""
+        """Time Complexity O(1)"""
+        if len(self) < self.size:
+            node.__init__(None)   # a blank node, it doesn't keep data or neighbours alive
+            self.append(node)
+
+
+    def disable(self):
+        """Stop pooling for good, e.g. once the container handed its nodes out"""
+        self.size = 0
+        self.clear()
+
+
+    def __repr__(self):
+        return f"NodePool({len(self)}/{self.size})"
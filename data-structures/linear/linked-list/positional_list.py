@@ -10,6 +10,9 @@ class PositionalList:
 
     class _Node:
         """Doubly-linked node."""
+        # no node pool here: a recycled node would make stale Positions valid again
+        __slots__ = ("data", "prev", "next")
+
         def __init__(self, data, prev, next):
             self.data = data
             self.prev = prev   # previous node reference
@@ -1,7 +1,12 @@
+from node_pool import NodePool
+
+
 class CircularLinkedList:
     class Node:
         """each Node of a Linked List structure"""
         # Each Node has a data and a pointer to the next Node
+        __slots__ = ("data", "next")
+
         def __init__(self, data, next=None):
             self.data = data # data stored in the current Node
 
@@ -18,12 +23,13 @@ class CircularLinkedList:
             return f"Node({self.data} -> {self.next.data})"
 
 
-    def __init__(self, linkedlist=None):
+    def __init__(self, linkedlist=None, pool_size=0):
         # we use `tail` pointer instead of `head`
         # because `tail.next` equals to `head`
         # so using tail, we can access head easily, but not the vice-versa
         self.tail = None  # the tail pointer (points to the last element)
         self._n = 0    # total nodes
+        self._pool = NodePool(pool_size)
 
         # CircularLinkedList(['A', 'B', 'C', 'D']) to A -> B -> C -> D -> A -> B -> C -> ...
         if linkedlist is not None:
@@ -49,7 +55,7 @@ class CircularLinkedList:
 
     def append(self, data):
         """append a new Node at the end of the Linked List"""
-        new_node = self.Node(data)
+        new_node = self._pool.acquire(self.Node, data)
 
         # case 1: the list is empty
         if self.isempty():
@@ -66,7 +72,7 @@ class CircularLinkedList:
 
     def appendleft(self, data):
         """append a new Node at the start of the Linked List"""
-        new_node = self.Node(data)     # Create the new node
+        new_node = self._pool.acquire(self.Node, data)     # Create the new node
         # case 1: the list is empty
         if self.isempty():
             self.tail = new_node
@@ -96,7 +102,7 @@ class CircularLinkedList:
 
         current_node = self.tail.next
         current_index = 0
-        new_node = self.Node(data)
+        new_node = self._pool.acquire(self.Node, data)
 
         # traverse to the index `index - 1`
         while current_index != (index-1):
@@ -160,6 +166,7 @@ class CircularLinkedList:
         if self.isempty():
             raise ValueError("Empty Linked List")
 
+        node = self.tail.next   # the head
         # Case 2: total nodes (1)
         if self._n == 1:
             value = self.tail.data
@@ -169,6 +176,7 @@ class CircularLinkedList:
             value = self.tail.next.data
             self.tail.next = self.tail.next.next
 
+        self._pool.release(node)
         self._n -= 1
         return value
 
@@ -278,7 +286,7 @@ class CircularLinkedList:
         """Representation of a CircularLinkedList object"""
         if not self._n: return "CircularLinkedList()"
         values = map(str, self.tolist())
-        return f"CircularLinkedList({" -> ".join(values)}" + " -> ...)"
+        return f"CircularLinkedList({' -> '.join(values)}" + " -> ...)"
 
 
     def __len__(self):
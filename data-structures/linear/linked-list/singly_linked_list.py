@@ -1,7 +1,12 @@
+from node_pool import NodePool
+
+
 class SinglyLinkedList:
     class Node:
         """each Node of a Linked List structure"""
         # Each Node has a data and a pointer to the next Node
+        __slots__ = ("data", "next")
+
         def __init__(self, data, next=None):
             self.data = data # data stored in the current Node
 
@@ -17,17 +22,24 @@ class SinglyLinkedList:
             return f"Node({self.data} -> {self.next.data})"
 
 
-    # Each Linked List has a head pointer
-    # which points to the head (first Node) of the Linked List
+    # Each Linked List has a head and a tail pointer
+    # head points to the head (first Node) of the Linked List
+    # tail points to the last Node, so appending and splicing don't walk the list
     # If there is no Node (the linked list is empty)
-    # then head points to None
-    def __init__(self, linkedlist=None):
+    # then head and tail point to None
+    def __init__(self, linkedlist=None, pool_size=0):
         self.head = None  # the head pointer
+        self.tail = None  # the tail pointer
         self._n = 0    # total nodes
+        # (index, node) of the last node reached by getnode, so that sequential or
+        # nearby indexing walks from there instead of from the head. Anything that
+        # shifts the indices of existing nodes resets it
+        self._cursor = None
+        self._pool = NodePool(pool_size)
 
         # SinglyLinkedList(['A', 'B', 'C', 'D']) to A -> B -> C -> D
         if linkedlist is not None:
-            for data in linkedlist: self.append(data)
+            self.extend(linkedlist)
 
 
     def index(self, data, start=0):
@@ -46,35 +58,34 @@ class SinglyLinkedList:
 
     def append(self, data):
         """append a new Node at the end of the Linked List"""
-        current_node = self.head
-        new_node = self.Node(data)
+        new_node = self._pool.acquire(self.Node, data)
 
         # case 1: the list is empty
-        if current_node is None:
-            self.head = new_node
+        if self.head is None:
+            self.head = self.tail = new_node
 
         # case 2: the list has already one or more elements
         else:
-            # while current_node is not the last node
-            while current_node.next is not None:
-                current_node = current_node.next
-
-            # current_node is now the last node
             # link the new node from the last node
-            current_node.next = new_node
+            self.tail.next = new_node
+            self.tail = new_node
         self._n += 1
 
 
     def appendleft(self, data):
         """append a new Node at the start of the Linked List"""
-        new_node = self.Node(data)    # Create the new node
+        self._cursor = None
+        new_node = self._pool.acquire(self.Node, data)    # Create the new node
         new_node.next = self.head     # new_node points it to the old head
         self.head = new_node          # Make it the new head
+        if self.tail is None:
+            self.tail = new_node
         self._n += 1
 
 
     def insert(self, index, data):
         """insert data before index"""
+        self._cursor = None
         if index < 0:
             if self._n == 0:
                 self.append(data)
@@ -90,7 +101,7 @@ class SinglyLinkedList:
 
         current_node = self.head
         current_index = 0
-        new_node = self.Node(data)
+        new_node = self._pool.acquire(self.Node, data)
 
         # traverse to the index `index - 1`
         while current_node is not None and current_index != (index-1):
@@ -106,20 +117,89 @@ class SinglyLinkedList:
 
 
     def extend(self, other):
-        """extend current linked list with the items from another list in-place"""
-        curr_node = self.head
-        while curr_node.next is not None:
-            curr_node = curr_node.next
+        """extend current linked list with the items from another iterable in-place"""
+        """Time Complexity O(k)"""
+        # the new nodes are chained up first and linked in one go
+        first, last, count = self._chain(other)
+        if count == 0:
+            return
+        if self.head is None:
+            self.head = first
+        else:
+            self.tail.next = first
+        self.tail = last
+        self._n += count
+
+
+    def insert_many(self, index, values):
+        """insert all the values before index, keeping their order"""
+        """Time Complexity O(index + k)"""
+        index = slice(index, None).indices(self._n)[0]   # list-like clamping of the index
+        if index == self._n:
+            self.extend(values)
+            return
+        first, last, count = self._chain(values)
+        if count == 0:
+            return
+        self._cursor = None
 
-        # curr_node is the last node
-        curr_node.next = other.head
+        if index == 0:
+            last.next = self.head
+            self.head = first
+        else:
+            prev_node = self.getnode(index - 1)
+            last.next = prev_node.next
+            prev_node.next = first
+        self._n += count
+
+
+    def splice(self, other):
+        """move all the nodes of other (a SinglyLinkedList) to the end of this list, leaving other empty"""
+        """Time Complexity O(1)"""
+        if not isinstance(other, SinglyLinkedList):
+            raise TypeError(f"can only splice a SinglyLinkedList, not {type(other).__name__}")
+        if other is self or other.head is None:
+            return
+        if self.head is None:
+            self.head = other.head
+        else:
+            self.tail.next = other.head
+        self.tail = other.tail
         self._n += other._n
 
+        other.head = other.tail = None
+        other._n = 0
+        other._cursor = None
+
+
+    def split_at(self, index):
+        """cut the list in two: this list keeps the items before index,
+        the items from index on are moved (not copied) to the returned list"""
+        """Time Complexity O(index)"""
+        index = slice(index, None).indices(self._n)[0]   # list-like clamping of the index
+        res = type(self)(pool_size=self._pool.size)
+        if index == self._n:
+            return res
+        self._cursor = None
+
+        if index == 0:
+            res.head, res.tail = self.head, self.tail
+            self.head = self.tail = None
+        else:
+            new_tail = self.getnode(index - 1)
+            res.head, res.tail = new_tail.next, self.tail
+            new_tail.next = None
+            self.tail = new_tail
+        res._n = self._n - index
+        self._n = index
+        return res
+
 
     def pop(self, index=None):
         """Pop an item from the list using indexing"""
         if self._n == 0:
             raise ValueError("Empty Linked List")
+        self._cursor = None
 
         if index is None or index >= self._n:   # default is the last item
             index = self._n - 1
@@ -140,6 +220,8 @@ class SinglyLinkedList:
         # current_node is in (index - 1)th position
         value = current_node.next.data
         current_node.next = current_node.next.next
+        if current_node.next is None:   # the last node was popped
+            self.tail = current_node
         self._n -= 1
         return value
 
@@ -150,8 +232,13 @@ class SinglyLinkedList:
             raise ValueError("Empty Linked List")
 
         # Case 2: total nodes (>= 1)
-        value = self.head.data
-        self.head = self.head.next
+        self._cursor = None
+        node = self.head
+        value = node.data
+        self.head = node.next
+        if self.head is None:
+            self.tail = None
+        self._pool.release(node)
 
         self._n -= 1
         return value
@@ -188,6 +275,8 @@ class SinglyLinkedList:
     def reverse(self):
         """reverse the actual linked list in place
         like from A -> B -> C -> D to A <- B <- C <- D"""
+        self._cursor = None
+        self.tail = self.head
         prev_visited = None
         current_node = self.head
 
@@ -203,19 +292,26 @@ class SinglyLinkedList:
 
     def getnode(self, index):
         """get Node from the Linked List using 0 indexing"""
+        """Time Complexity O(distance from the head or from the last accessed node)"""
         if index < 0:
             index += self._n
         if index < 0 or index >= self._n:
             raise IndexError("Index out of range")
 
-        current_node = self.head
-        current_index = 0
+        # a singly linked list can only walk forward, so the cached cursor
+        # helps whenever it is not past the wanted index
+        if self._cursor is not None and self._cursor[0] <= index:
+            current_index, current_node = self._cursor
+        else:
+            current_node = self.head
+            current_index = 0
 
         while current_node is not None and current_index != index:
             current_node = current_node.next
             current_index += 1
 
         if current_node is not None:
+            self._cursor = (current_index, current_node)
             return current_node
 
 
@@ -235,7 +331,28 @@ class SinglyLinkedList:
 
         if isinstance(key, slice):
             start, stop, step = key.indices(len(self))
-            return [self.getnode(k).data for k in range(start, stop, step)]
+            return self._slice(range(start, stop, step))
+
+
+    def _slice(self, indices):
+        """Collect the data at the given indices in a single forward walk"""
+        """Time Complexity O(k * |step| + distance to the first index)"""
+        if len(indices) == 0:
+            return []
+        step = indices.step
+        forward = indices if step > 0 else indices[::-1]   # we can only walk forward
+
+        current_node = self.getnode(forward[0])
+        res = [current_node.data]
+        for _ in range(len(forward) - 1):
+            for _ in range(abs(step)):
+                current_node = current_node.next
+            res.append(current_node.data)
+        self._cursor = (forward[-1], current_node)
+
+        if step < 0:
+            res.reverse()
+        return res
 
 
     def __iter__(self):
@@ -253,7 +370,7 @@ class SinglyLinkedList:
             values.extend(map(str, self.tolist()))
             values.append("None")
         else: values = map(str, self.tolist())
-        return f"SinglyLinkedList({" -> ".join(values)})"
+        return f"SinglyLinkedList({' -> '.join(values)})"
 
 
     def __len__(self):
@@ -261,3 +378,18 @@ class SinglyLinkedList:
         return self._n
 
     size = __len__
+
+
+    def _chain(self, values):
+        """Link new nodes holding values into a chain, return (first, last, count)"""
+        first = last = None
+        count = 0
+        for data in values:
+            new_node = self._pool.acquire(self.Node, data)
+            if first is None:
+                first = new_node
+            else:
+                last.next = new_node
+            last = new_node
+            count += 1
+        return first, last, count
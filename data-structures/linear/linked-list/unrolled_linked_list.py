@@ -0,0 +1,271 @@
+"""
+An unrolled linked list is a doubly linked list where every node stores a small
+array (a block) of up to `block_size` elements instead of a single element.
+
+Walking the list hops from block to block, so reaching an index costs O(n / block_size)
+pointer hops plus an O(1) array access, and iterating is almost as fast as iterating
+a Python list. Inserting in the middle only shifts the elements of one block, and a
+full block is split in two, so middle insertion stays cheap.
+
+Indices follow DoublyLinkedList, not Python's list: insert wraps a negative index
+around and appends past the end, and pop past the end pops the last element.
+"""
+import itertools
+
+class UnrolledLinkedList:
+    class Node:
+        """each Node (block) of an Unrolled Linked List"""
+        # Each Node has a list of elements and two pointers
+        # one pointer to the next Node, another to the prev Node
+        __slots__ = ("items", "next", "prev")
+
+        def __init__(self, items=None, next=None, prev=None):
+            self.items = items if items is not None else []  # elements stored in the current Node
+            self.next = next
+            self.prev = prev
+
+
+        def __repr__(self):
+            """Represenattion of a Node object"""
+            return f"Node({self.items})"
+
+
+    # head points to the first block and tail points to the last block
+    # If there is no element (the linked list is empty) then head and tail points to None
+    def __init__(self, linkedlist=None, block_size=64):
+        if block_size < 2:
+            raise ValueError("block_size must be at least 2")
+        self.head = None  # the head pointer
+        self.tail = None   # the tail pointer
+        self._n = 0    # total elements (not nodes)
+        self._block_size = block_size
+
+        # UnrolledLinkedList(['A', 'B', 'C', 'D']) to [A B C D]
+        if linkedlist is not None:
+            for data in linkedlist: self.append(data)
+
+
+    def index(self, data, start=0):
+        """return the first index of data"""
+        """Time Complexity O(n)"""
+        offset = 0   # index of the first element of the current block
+        current_node = self.head
+        while current_node is not None:
+            items = current_node.items
+            if offset + len(items) > start:
+                try:   # search the block at C speed
+                    return offset + items.index(data, max(0, start - offset))
+                except ValueError:
+                    pass
+            offset += len(items)
+            current_node = current_node.next
+        raise ValueError("Value not in the Linked List")
+
+
+    def append(self, data):
+        """append a new element at the end of the Linked List"""
+        """Time Complexity O(1)"""
+        if self.tail is None or len(self.tail.items) >= self._block_size:
+            self._link_after(self.tail, self.Node())
+        self.tail.items.append(data)
+        self._n += 1
+
+
+    def appendleft(self, data):
+        """append a new element at the start of the Linked List"""
+        """Time Complexity O(block_size)"""
+        if self.head is None or len(self.head.items) >= self._block_size:
+            self._link_after(None, self.Node())
+        self.head.items.insert(0, data)
+        self._n += 1
+
+
+    def extend(self, other):
+        """Extend current list with the elements from an iterable (in-place)"""
+        """Time Complexity O(k)"""
+        for data in other:
+            self.append(data)
+
+
+    def insert(self, index, data):
+        """insert data before index"""
+        """Time Complexity O(n / block_size + block_size)"""
+        # the same index rules as DoublyLinkedList.insert: a negative index wraps around
+        # (as many times as needed) and an index past the end appends
+        if index < 0 and self._n > 0:
+            index %= self._n
+        if index < 0 or index >= self._n:
+            self.append(data)
+            return
+
+        node, offset = self._locate(index)
+        node.items.insert(offset, data)
+        self._n += 1
+        if len(node.items) > self._block_size:   # split the full block in two halves
+            half = len(node.items) // 2
+            self._link_after(node, self.Node(node.items[half:]))
+            del node.items[half:]
+
+
+    def pop(self, index=None):
+        """Pop an item from the list using indexing"""
+        """Time Complexity O(n / block_size + block_size)"""
+        if self._n == 0:   # no element can be popped from an empty list
+            raise ValueError("Empty Linked List")
+        # the same index rules as DoublyLinkedList.pop: an index past the end pops the last item
+        if index is None or index >= self._n:   # default is the last item
+            index = self._n - 1
+        if index < 0:
+            index += self._n
+        if index < 0:
+            raise IndexError("Index out of range")
+
+        node, offset = self._locate(index)
+        value = node.items.pop(offset)
+        self._n -= 1
+
+        if not node.items:
+            self._unlink(node)
+        elif node.next is not None and len(node.items) + len(node.next.items) <= self._block_size // 2:
+            # keep the blocks at least half full on average by merging sparse neighbours
+            node.items.extend(node.next.items)
+            self._unlink(node.next)
+        return value
+
+
+    def popleft(self):
+        """Time Complexity O(block_size)"""
+        return self.pop(0)
+
+
+    def remove(self, value):
+        """Remove the first occurrence of value"""
+        """Time Complexity O(n)"""
+        self.pop(self.index(value))
+
+
+    def reverse(self):
+        """reverse the actual linked list in place"""
+        """Time Complexity O(n)"""
+        current_node = self.head
+        while current_node is not None:
+            current_node.items.reverse()
+            current_node.next, current_node.prev = current_node.prev, current_node.next
+            current_node = current_node.prev   # the old next
+        self.head, self.tail = self.tail, self.head
+
+
+    def tolist(self):
+        """traverse the whole Linked List and return that list"""
+        """Time Complexity O(n)"""
+        res = []
+        current_node = self.head
+        while current_node is not None:
+            res.extend(current_node.items)
+            current_node = current_node.next
+        return res
+
+
+    def _locate(self, index):
+        """Return the block holding index and the offset of index inside it"""
+        """Time Complexity O(n / block_size)"""
+        # walk whole blocks from whichever end is closer
+        if index <= self._n // 2:
+            current_node = self.head
+            while index >= len(current_node.items):
+                index -= len(current_node.items)
+                current_node = current_node.next
+            return current_node, index
+
+        index = self._n - 1 - index   # distance from the end
+        current_node = self.tail
+        while index >= len(current_node.items):
+            index -= len(current_node.items)
+            current_node = current_node.prev
+        return current_node, len(current_node.items) - 1 - index
+
+
+    def _link_after(self, node, new_node):
+        """Link new_node after node (at the head when node is None)"""
+        if node is None:
+            new_node.next = self.head
+            if self.head is not None:
+                self.head.prev = new_node
+            self.head = new_node
+        else:
+            new_node.prev = node
+            new_node.next = node.next
+            if node.next is not None:
+                node.next.prev = new_node
+            node.next = new_node
+        if new_node.next is None:
+            self.tail = new_node
+
+
+    def _unlink(self, node):
+        """Remove node from the chain of blocks"""
+        if node.prev is not None:
+            node.prev.next = node.next
+        else:
+            self.head = node.next
+        if node.next is not None:
+            node.next.prev = node.prev
+        else:
+            self.tail = node.prev
+        node.prev = node.next = None
+
+
+    def _iter_from(self, node, offset):
+        """Iterate over the elements starting at offset inside node"""
+        while node is not None:
+            yield from node.items[offset:]
+            offset = 0
+            node = node.next
+
+
+    def __getitem__(self, key):
+        """get data from the Linked List using indexing and slicing"""
+        """Time Complexity O(n / block_size) (indexing)"""
+        """Time Complexity O(n / block_size + k * |step|) (slicing)"""
+        if isinstance(key, int):
+            if key < 0:
+                key += self._n    # handle negative index
+            if key < 0 or key >= self._n:
+                raise IndexError("Linked List index out of range")
+            node, offset = self._locate(key)
+            return node.items[offset]
+
+        if isinstance(key, slice):
+            indices = range(*key.indices(self._n))
+            if len(indices) == 0:
+                return []
+            forward = indices if indices.step > 0 else indices[::-1]
+            node, offset = self._locate(forward[0])
+            # one walk from the first wanted element, taking every step-th element
+            res = list(itertools.islice(self._iter_from(node, offset), 0, forward[-1] - forward[0] + 1, forward.step))
+            if indices.step < 0:
+                res.reverse()
+            return res
+
+        raise TypeError(f"Invalid key type: {type(key).__name__}")
+
+
+    def __iter__(self):
+        """Iterator for the UnrolledLinkedList object"""
+        current_node = self.head
+        while current_node is not None:
+            yield from current_node.items
+            current_node = current_node.next
+
+
+    def __repr__(self):
+        """Representation of a UnrolledLinkedList object"""
+        values = map(str, self.tolist())
+        sep = ' \u21cc '
+        return f"UnrolledLinkedList({sep.join(values)})"
+
+
+    def __len__(self):
+        """Get the length of the Unrolled Linked List"""
+        return self._n
+    size = __len__
@@ -1,9 +1,20 @@
 import ctypes
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "array"))   # see growth_policy.py
+from growth_policy import GrowthPolicy
+from dynamic_array import _VACANT
 
 class Queue:
-    def __init__(self, queue=None):
+    def __init__(self, queue=None, policy=None):
         self._n = 0   # total elements
-        self._capacity = 1  # default-capacity is 1
+        self._policy = policy if policy is not None else GrowthPolicy()
+        self._grows = self._shrinks = 0   # resize counters
+        self._capacity = self._policy.min_capacity  # default-capacity is 1
+        # the elements live in _queue[_head:_head + _n]. Dequeuing just moves the head
+        # forward, the dead slots in front of it are reclaimed lazily (see enqueue)
+        self._head = 0
         self._queue = self._make_array(self._capacity) # getting a low-level array with default capacity
         if queue is not None:
             for item in queue: self.enqueue(item)
@@ -12,9 +23,15 @@ class Queue:
     def enqueue(self, item):
         """Adding an item at the end of the queue"""
         """Time Complexity O(1) (amortized)"""
-        if self._n == self._capacity:
-            self._resize(2 * self._capacity)
-        self._queue[self._n] = item
+        if self._head + self._n == self._capacity:   # no room left after the last element
+            if self._head >= self._capacity // 2 and self._head > 0:
+                # at least half of the array is dead slots, slide the elements back to
+                # the start instead of growing. That moves at most capacity / 2 elements
+                # and frees at least as many slots, so it's O(1) amortized
+                self._compact()
+            else:
+                self._resize(self._policy.grow(self._capacity, self._n + 1))
+        self._queue[self._head + self._n] = item
         self._n += 1
 
     add = enqueue
@@ -22,34 +39,72 @@ class Queue:
 
     def dequeue(self):
         """Removing an item from the front of the queue"""
-        """Time Complexity O(n) (amortized)"""
+        """Time Complexity O(1) (amortized)"""
         if self.isempty():
             raise ValueError("Queue is empty")
-        # if num of total elements is less than or euqal to
-        # 1/4 th of the total capacity, half the capacity
-        if 4 * self._n <= self._capacity:
-            self._resize(self._capacity // 2)
-
-        value = self._queue[0]
-        for i in range(self._n - 1):
-            self._queue[i] = self._queue[i + 1]
 
+        value = self._queue[self._head]
+        self._queue[self._head] = _VACANT
+        self._head += 1
         self._n -= 1
+        self._after_dequeue()
         return value
 
     poll = dequeue
 
 
+    def drain(self, n):
+        """Removing up to n items from the front of the queue, returned as a list in a single copy"""
+        """Time Complexity O(k) (amortized)"""
+        k = max(0, min(n, self._n))
+        head = self._head
+        values = self._queue[head:head + k]
+        self._queue[head:head + k] = [_VACANT] * k
+        self._head += k
+        self._n -= k
+        self._after_dequeue()
+        return values
+
+
+    def _after_dequeue(self):
+        if self._n == 0:
+            self._head = 0   # nothing to move, start over from the front for free
+        # shrink only after the dequeue, so the policy sees the real occupancy
+        capacity = self._policy.shrink(self._capacity, self._n)
+        if capacity is not None:
+            self._resize(capacity)
+
+
     def first(self):
         """Time Complexity O(1)"""
         """getting the first element without removing"""
         if self.isempty():
             raise ValueError("Queue is empty")
-        return self._queue[0]
+        return self._queue[self._head]
 
     peek = first
 
 
+    def reserve(self, capacity):
+        """Make sure the queue can hold `capacity` elements without resizing"""
+        """Time Complexity O(n)"""
+        if capacity > self._capacity:
+            self._resize(capacity)
+
+
+    def shrink_to_fit(self):
+        """Release the unused capacity"""
+        """Time Complexity O(n)"""
+        capacity = max(self._policy.min_capacity, self._n)
+        if capacity != self._capacity:
+            self._resize(capacity)
+
+
+    def resize_stats(self):
+        """Return how many times the queue grew and shrank, to tune the growth policy"""
+        return {"grows": self._grows, "shrinks": self._shrinks, "capacity": self._capacity}
+
+
     def isempty(self):
         """Time Complexity O(1)"""
         """check if the queue is empty"""
@@ -71,7 +126,7 @@ class Queue:
 
     def __iter__(self):
         """getting an queue iterator"""
-        for i in range(self._n):
+        for i in range(self._head, self._head + self._n):
             yield self._queue[i]
 
 
@@ -83,17 +138,30 @@ class Queue:
                 key += self._n
             if key < 0 or key >= self._n:
                 raise IndexError("Index out of range")
-            return self._queue[key]
+            return self._queue[self._head + key]
         if isinstance(key, slice):
             start, stop, step = key.indices(self._n)
-            return self._queue[start:stop:step]
+            return [self._queue[self._head + i] for i in range(start, stop, step)]
 
 
     def _resize(self, capacity):
+        if capacity > self._capacity:
+            self._grows += 1
+        elif capacity < self._capacity:
+            self._shrinks += 1
         aux = self._make_array(capacity)
-        for i in range(self._n):
-            aux[i] = self._queue[i]
+        aux[:self._n] = self._queue[self._head:self._head + self._n]
         self._queue = aux
+        self._head = 0
+
+
+    def _compact(self):
+        """Slide the elements back to the start of the array, in place"""
+        """Time Complexity O(n)"""
+        head, n = self._head, self._n
+        self._queue[:n] = self._queue[head:head + n]
+        self._queue[n:head + n] = [_VACANT] * head
+        self._head = 0
 
 
     def _make_array(self, capacity):
@@ -0,0 +1,143 @@
+"""
+Throughput of the bounded ring buffers against the standard library queues, with
+several producers and consumers moving n items through a buffer of maxsize slots
+
+# run from anywhere, optionally with the number of items
+❯ python3 data-structures/linear/queue/benchmark.py 200000
+"""
+import asyncio
+import multiprocessing
+import os
+import queue
+import sys
+import threading
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from ring_buffer import AsyncRingBuffer, RingBuffer
+from shared_ring_buffer import SharedRingBuffer
+
+
+def run_threads(n, producers, consumers, put, get):
+    """Time n items going through put/get, split evenly between the producer and consumer threads"""
+    threads = [threading.Thread(target=put, args=(n // producers,)) for _ in range(producers)]
+    threads += [threading.Thread(target=get, args=(n // consumers,)) for _ in range(consumers)]
+    start = perf_counter()
+    for thread in threads: thread.start()
+    for thread in threads: thread.join()
+    return perf_counter() - start
+
+
+def bench_threads(n, producers=4, consumers=4, maxsize=1024, batch=64):
+    """queue.Queue versus RingBuffer (one item at a time and in batches) with threads"""
+    print(f"\n{n:,} items, {producers} producer / {consumers} consumer threads, maxsize {maxsize}")
+    print(f"{'buffer':<30}{'items/s':>14}")
+
+    def one_by_one(q):
+        def put(count):
+            for i in range(count): q.put(i)
+        def get(count):
+            for _ in range(count): q.get()
+        return put, get
+
+    def batched(q):
+        items = list(range(batch))
+        def put(count):
+            for _ in range(count // batch): q.put_many(items)
+            q.put_many(items[:count % batch])
+        def get(count):
+            while count > 0:
+                count -= len(q.get_many(min(batch, count)))
+        return put, get
+
+    for name, q, make in (("queue.Queue", queue.Queue(maxsize), one_by_one),
+                          ("RingBuffer", RingBuffer(maxsize), one_by_one),
+                          (f"RingBuffer (batches of {batch})", RingBuffer(maxsize), batched)):
+        elapsed = run_threads(n, producers, consumers, *make(q))
+        print(f"{name:<30}{n / elapsed:>14,.0f}")
+
+
+async def run_tasks(n, producers, consumers, put, get):
+    """Time n items going through put/get, split evenly between the producer and consumer tasks"""
+    start = perf_counter()
+    await asyncio.gather(*[put(n // producers) for _ in range(producers)],
+                         *[get(n // consumers) for _ in range(consumers)])
+    return perf_counter() - start
+
+
+def bench_asyncio(n, producers=4, consumers=4, maxsize=1024, batch=64):
+    """asyncio.Queue versus AsyncRingBuffer (one item at a time and in batches)"""
+    print(f"\n{n:,} items, {producers} producer / {consumers} consumer tasks, maxsize {maxsize}")
+    print(f"{'buffer':<30}{'items/s':>14}")
+
+    def one_by_one(q):
+        async def put(count):
+            for i in range(count): await q.put(i)
+        async def get(count):
+            for _ in range(count): await q.get()
+        return put, get
+
+    def batched(q):
+        items = list(range(batch))
+        async def put(count):
+            for _ in range(count // batch): await q.put_many(items)
+            await q.put_many(items[:count % batch])
+        async def get(count):
+            while count > 0:
+                count -= len(await q.get_many(min(batch, count)))
+        return put, get
+
+    async def main():
+        for name, make_queue, make in (("asyncio.Queue", asyncio.Queue, one_by_one),
+                                       ("AsyncRingBuffer", AsyncRingBuffer, one_by_one),
+                                       (f"AsyncRingBuffer (batches of {batch})", AsyncRingBuffer, batched)):
+            elapsed = await run_tasks(n, producers, consumers, *make(make_queue(maxsize)))
+            print(f"{name:<30}{n / elapsed:>14,.0f}")
+
+    asyncio.run(main())
+
+
+def produce_records(q, n, record_size, batch):
+    """Producer process: send n records, one by one (batch=1) or in batches"""
+    record = bytes(record_size)
+    if batch == 1:
+        for _ in range(n): q.put(record)
+    else:
+        records = [record] * batch
+        for _ in range(n // batch): q.put_many(records)
+        q.put_many(records[:n % batch])
+
+
+def bench_processes(n, record_size=64, maxsize=1024, batch=64):
+    """multiprocessing.Queue versus SharedRingBuffer, one producer process feeding this process"""
+    print(f"\n{n:,} records of {record_size} bytes, 1 producer process -> 1 consumer process")
+    print(f"{'buffer':<30}{'records/s':>14}")
+
+    def consume_one_by_one(q):
+        for _ in range(n): q.get()
+
+    def consume_batched(q):
+        count = n
+        while count > 0:
+            count -= len(q.get_many(min(batch, count)))
+
+    ring, ring_batched = SharedRingBuffer(maxsize, record_size), SharedRingBuffer(maxsize, record_size)
+    for name, q, batch_size, consume in (("multiprocessing.Queue", multiprocessing.Queue(maxsize), 1, consume_one_by_one),
+                                         ("SharedRingBuffer", ring, 1, consume_one_by_one),
+                                         (f"SharedRingBuffer (batches of {batch})", ring_batched, batch, consume_batched)):
+        producer = multiprocessing.Process(target=produce_records, args=(q, n, record_size, batch_size))
+        start = perf_counter()
+        producer.start()
+        consume(q)
+        producer.join()
+        print(f"{name:<30}{n / (perf_counter() - start):>14,.0f}")
+    ring.close()
+    ring_batched.close()
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    bench_threads(n)
+    bench_asyncio(n)
+    bench_processes(n)
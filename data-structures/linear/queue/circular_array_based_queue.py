@@ -1,9 +1,16 @@
 import ctypes
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "array"))   # see growth_policy.py
+from growth_policy import GrowthPolicy
 
 class Queue:
-    def __init__(self, queue=None):
+    def __init__(self, queue=None, policy=None):
         self._n = 0   # total elements
-        self._capacity = 1  # default-capacity is 1
+        self._policy = policy if policy is not None else GrowthPolicy()
+        self._grows = self._shrinks = 0   # resize counters
+        self._capacity = self._policy.min_capacity  # default-capacity is 1
         self._front = 0   # index of the first element of the queue
         self._queue = self._make_array(self._capacity) # getting a low-level array with default capacity
         if queue is not None:
@@ -14,7 +21,7 @@ class Queue:
         """Adding an item at the end of the queue"""
         """Time Complexity O(1) (amortized)"""
         if self._n == self._capacity:
-            self._resize(2 * self._capacity)
+            self._resize(self._policy.grow(self._capacity, self._n + 1))
         end = (self._front + self._n) % self._capacity
         self._queue[end] = item
         self._n += 1
@@ -26,18 +33,47 @@ class Queue:
         """Time Complexity O(1) (amortized)"""
         if self.isempty():
             raise ValueError("Queue is empty")
-        # if num of total elements is less than or euqal to
-        # 1/4 th of the total capacity, half the capacity
-        if 4 * self._n <= self._capacity:
-            self._resize(self._capacity // 2)
 
         value = self._queue[self._front]
         self._front = (self._front + 1) % self._capacity
         self._n -= 1
+        # shrink only after the dequeue, so the policy sees the real occupancy
+        capacity = self._policy.shrink(self._capacity, self._n)
+        if capacity is not None:
+            self._resize(capacity)
         return value
     poll = dequeue
 
 
+    def enqueue_many(self, items):
+        """Adding all the items at the end of the queue with at most two block copies"""
+        """Time Complexity O(k) (amortized)"""
+        items = list(items)
+        k = len(items)
+        if self._n + k > self._capacity:
+            self._resize(self._policy.grow(self._capacity, self._n + k))
+        end = (self._front + self._n) % self._capacity
+        first = min(k, self._capacity - end)   # the part that fits before wrapping around
+        self._queue[end:end + first] = items[:first]
+        self._queue[0:k - first] = items[first:]
+        self._n += k
+
+
+    def dequeue_many(self, k):
+        """Removing up to k items from the front of the queue, returned as a list"""
+        """Time Complexity O(k) (amortized)"""
+        k = max(0, min(k, self._n))
+        first = min(k, self._capacity - self._front)   # the part before wrapping around
+        values = self._queue[self._front:self._front + first]
+        values += self._queue[0:k - first]
+        self._front = (self._front + k) % self._capacity
+        self._n -= k
+        capacity = self._policy.shrink(self._capacity, self._n)
+        if capacity is not None:
+            self._resize(capacity)
+        return values
+
+
     def first(self):
         """Time Complexity O(1)"""
         """getting the first element without removing"""
@@ -47,6 +83,26 @@ class Queue:
     peek = first
 
 
+    def reserve(self, capacity):
+        """Make sure the queue can hold `capacity` elements without resizing"""
+        """Time Complexity O(n)"""
+        if capacity > self._capacity:
+            self._resize(capacity)
+
+
+    def shrink_to_fit(self):
+        """Release the unused capacity"""
+        """Time Complexity O(n)"""
+        capacity = max(self._policy.min_capacity, self._n)
+        if capacity != self._capacity:
+            self._resize(capacity)
+
+
+    def resize_stats(self):
+        """Return how many times the queue grew and shrank, to tune the growth policy"""
+        return {"grows": self._grows, "shrinks": self._shrinks, "capacity": self._capacity}
+
+
     def isempty(self):
         """Time Complexity O(1)"""
         """check if the queue is empty"""
@@ -91,6 +147,10 @@ class Queue:
 
 
     def _resize(self, capacity):
+        if capacity > self._capacity:
+            self._grows += 1
+        elif capacity < self._capacity:
+            self._shrinks += 1
         old_capacity = self._capacity
         position = self._front
 
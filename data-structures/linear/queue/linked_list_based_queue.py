@@ -4,8 +4,19 @@ both head an tail pointers. So this will make it easier for us to
 enqueue (adding element at the end) and dequeue (removing element from the front)
 in constant time O(1)
 """
+import os
+import sys
+
+# the pool of removed nodes is shared by all the linked containers, it lives with the linked lists
+_LINKED_LIST_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "linked-list"))
+if _LINKED_LIST_DIR not in sys.path:
+    sys.path.append(_LINKED_LIST_DIR)
+from node_pool import NodePool
+
 
 class Node:
+    __slots__ = ("data", "next")
+
     def __init__(self, data, next=None):
         self.data = data
         self.next = next
@@ -16,16 +27,19 @@ class Node:
 
 
 class Queue:
-    def __init__(self, queue=None):
+    def __init__(self, queue=None, pool_size=0):
         self._n = 0      # total nodes
         self.head = self.tail = None
+        # getnode() and queue[i, True] hand nodes out, and a handed out node could be
+        # recycled while the caller still holds it: they switch the pool off for good
+        self._pool = NodePool(pool_size)
         if queue is not None:
             for data in queue: self.enqueue(data)
 
 
     def enqueue(self, data):
         """Time Complexity O(1)"""
-        new_node = Node(data)
+        new_node = self._pool.acquire(Node, data)
         # case 1: if the queue is empty
         if self.isempty():
             self.head = self.tail = new_node
@@ -43,7 +57,8 @@ class Queue:
         if self.isempty():
             raise ValueError("Queue is empty")
 
-        value = self.head.data
+        node = self.head
+        value = node.data
         # case 2: one node
         if self.head.next is None:
             self.head = self.tail = None
@@ -51,6 +66,8 @@ class Queue:
         else:
             self.head = self.head.next
 
+        self._pool.release(node)
+
         self._n -= 1
         return value
     poll = dequeue
@@ -91,6 +108,12 @@ class Queue:
 
 
     def getnode(self, index):
+        self._pool.disable()   # the caller may keep the node
+        return self._walk(index)
+
+
+    def _walk(self, index):
+        """Return the node at index, without handing it out"""
         if index < 0:
             index += self._n
         if index < 0 or index >= self._n:
@@ -113,12 +136,14 @@ class Queue:
                 key += self._n
             if key < 0 or key >= self._n:
                 raise IndexError("Index out of range")
-            curr_node = self.getnode(key)
+            curr_node = self._walk(key)
             if curr_node:
-                if node: return curr_node
+                if node:
+                    self._pool.disable()   # the caller may keep the node
+                    return curr_node
                 return curr_node.data
             raise ValueError("Node doesn't exist")
 
         if isinstance(key, slice):
             start, stop, step = key.indices(self._n)
-            return [self.getnode(i).data for i in range(start, stop, step)]
+            return [self._walk(i).data for i in range(start, stop, step)]
@@ -0,0 +1,322 @@
+"""
+Bounded ring buffers built on the circular array based Queue, for handing items
+from producers to consumers:
+
+RingBuffer is thread safe. One lock guards the buffer and two condition variables
+(not empty / not full) let put and get block, optionally with a timeout, the same
+way queue.Queue does. put_many and get_many move a whole batch while taking the
+lock once, so the locking cost is paid per batch instead of per item.
+
+AsyncRingBuffer is the asyncio version (await q.put(item), await q.get()). It
+needs no lock at all since only one coroutine runs at a time, waiting coroutines
+are parked on futures and woken up when their turn comes.
+
+Both raise queue.Full / queue.Empty, like the standard library queues.
+"""
+import asyncio
+import collections
+import threading
+from queue import Empty, Full
+from time import monotonic
+
+from circular_array_based_queue import GrowthPolicy, Queue
+
+
+def _make_queue(maxsize):
+    """A circular Queue allocated once with room for maxsize items, that never resizes"""
+    if maxsize < 1:
+        raise ValueError("maxsize must be at least 1")
+    return Queue(policy=GrowthPolicy(min_capacity=maxsize, shrink_threshold=None))
+
+
+class RingBuffer:
+    def __init__(self, maxsize, items=None):
+        self._queue = _make_queue(maxsize)
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        # number of threads blocked in get / put, notify is skipped when nobody waits
+        self._waiting_getters = self._waiting_putters = 0
+        if items is not None:
+            self.put_many(items, block=False)
+
+
+    def put(self, item, block=True, timeout=None):
+        """Add an item, waiting (up to timeout seconds) for a free slot if the buffer is full"""
+        """Time Complexity O(1)"""
+        if timeout is not None and timeout < 0:
+            raise ValueError("'timeout' must be a non-negative number")
+        with self._lock:
+            if len(self._queue) >= self._maxsize:
+                self._wait_for_room(block, timeout)
+            self._queue.enqueue(item)
+            if self._waiting_getters:
+                self._not_empty.notify()
+
+
+    def get(self, block=True, timeout=None):
+        """Remove and return the first item, waiting (up to timeout seconds) for one if the buffer is empty"""
+        """Time Complexity O(1)"""
+        if timeout is not None and timeout < 0:
+            raise ValueError("'timeout' must be a non-negative number")
+        with self._lock:
+            if not len(self._queue):
+                self._wait_for_items(block, timeout)
+            item = self._queue.dequeue()
+            if self._waiting_putters:
+                self._not_full.notify()
+            return item
+
+
+    def put_nowait(self, item):
+        return self.put(item, block=False)
+
+
+    def get_nowait(self):
+        return self.get(block=False)
+
+
+    def put_many(self, items, block=True, timeout=None):
+        """Add all the items in order, a batch at a time (as many as there are free slots)"""
+        """Time Complexity O(k)"""
+        # If the time runs out halfway, the items already added stay in the buffer
+        # and Full is raised for the rest
+        items = list(items)
+        if timeout is not None and timeout < 0:
+            raise ValueError("'timeout' must be a non-negative number")
+        deadline = None if timeout is None else monotonic() + timeout
+        added = 0
+        with self._lock:
+            while added < len(items):
+                if len(self._queue) >= self._maxsize:
+                    remaining = None if deadline is None else max(0, deadline - monotonic())
+                    self._wait_for_room(block, remaining)
+                batch = items[added:added + self._maxsize - len(self._queue)]
+                self._queue.enqueue_many(batch)
+                added += len(batch)
+                if self._waiting_getters:
+                    self._not_empty.notify(len(batch))
+
+
+    def get_many(self, max_items, block=True, timeout=None):
+        """Remove and return up to max_items items (at least one), waiting for the first if the buffer is empty"""
+        """Time Complexity O(k)"""
+        if max_items < 0:
+            raise ValueError("'max_items' must be a non-negative number")
+        if timeout is not None and timeout < 0:
+            raise ValueError("'timeout' must be a non-negative number")
+        if max_items == 0:
+            return []   # nothing was asked for, so there's nothing to wait for either
+        with self._lock:
+            if not len(self._queue):
+                self._wait_for_items(block, timeout)
+            items = self._queue.dequeue_many(max_items)
+            if self._waiting_putters:
+                self._not_full.notify(len(items))
+            return items
+
+
+    def _wait_for_room(self, block, timeout):
+        """Wait (the lock held) until there is a free slot, raise Full when giving up"""
+        if not block:
+            raise Full
+        self._waiting_putters += 1
+        try:
+            ready = self._not_full.wait_for(lambda: len(self._queue) < self._maxsize, timeout)
+        finally:
+            self._waiting_putters -= 1
+        if not ready:
+            raise Full
+
+
+    def _wait_for_items(self, block, timeout):
+        """Wait (the lock held) until there is an item, raise Empty when giving up"""
+        if not block:
+            raise Empty
+        self._waiting_getters += 1
+        try:
+            ready = self._not_empty.wait_for(lambda: len(self._queue) > 0, timeout)
+        finally:
+            self._waiting_getters -= 1
+        if not ready:
+            raise Empty
+
+
+    @property
+    def maxsize(self):
+        return self._maxsize
+
+
+    def empty(self):
+        """Time Complexity O(1)"""
+        with self._lock:
+            return len(self._queue) == 0
+
+
+    def full(self):
+        """Time Complexity O(1)"""
+        with self._lock:
+            return len(self._queue) == self._maxsize
+
+
+    def tolist(self):
+        """Get a list object (a snapshot) from the RingBuffer"""
+        with self._lock:
+            return self._queue.tolist()
+
+
+    def __repr__(self):
+        """representation of a RingBuffer object"""
+        return f"RingBuffer({self.tolist()}, maxsize={self._maxsize})"
+
+
+    def __len__(self):
+        """Time Complexity O(1)"""
+        with self._lock:
+            return len(self._queue)
+    qsize = size = __len__
+
+
+class AsyncRingBuffer:
+    def __init__(self, maxsize, items=None):
+        self._queue = _make_queue(maxsize)
+        self._maxsize = maxsize
+        # futures of the coroutines waiting for an item / for a free slot
+        self._getters = collections.deque()
+        self._putters = collections.deque()
+        if items is not None:
+            for item in items: self.put_nowait(item)
+
+
+    async def put(self, item):
+        """Add an item, waiting for a free slot if the buffer is full"""
+        """Time Complexity O(1)"""
+        while len(self._queue) >= self._maxsize:
+            await self._park(self._putters, self._has_room)
+        self._queue.enqueue(item)
+        if self._getters:
+            self._wakeup(self._getters, 1)
+
+
+    async def get(self):
+        """Remove and return the first item, waiting for one if the buffer is empty"""
+        """Time Complexity O(1)"""
+        while not len(self._queue):
+            await self._park(self._getters, self._has_items)
+        item = self._queue.dequeue()
+        if self._putters:
+            self._wakeup(self._putters, 1)
+        return item
+
+
+    def put_nowait(self, item):
+        """Time Complexity O(1)"""
+        if self.full():
+            raise Full
+        self._queue.enqueue(item)
+        self._wakeup(self._getters, 1)
+
+
+    def get_nowait(self):
+        """Time Complexity O(1)"""
+        if self.empty():
+            raise Empty
+        item = self._queue.dequeue()
+        self._wakeup(self._putters, 1)
+        return item
+
+
+    async def put_many(self, items):
+        """Add all the items in order, a batch at a time (as many as there are free slots)"""
+        """Time Complexity O(k)"""
+        items = list(items)
+        added = 0
+        while added < len(items):
+            while self.full():
+                await self._park(self._putters, self._has_room)
+            batch = items[added:added + self._maxsize - len(self._queue)]
+            self._queue.enqueue_many(batch)
+            added += len(batch)
+            self._wakeup(self._getters, len(batch))
+
+
+    async def get_many(self, max_items):
+        """Remove and return up to max_items items (at least one), waiting for the first if the buffer is empty"""
+        """Time Complexity O(k)"""
+        if max_items < 0:
+            raise ValueError("'max_items' must be a non-negative number")
+        if max_items == 0:
+            return []
+        while self.empty():
+            await self._park(self._getters, self._has_items)
+        items = self._queue.dequeue_many(max_items)
+        self._wakeup(self._putters, len(items))
+        return items
+
+
+    def _has_room(self):
+        return len(self._queue) < self._maxsize
+
+
+    def _has_items(self):
+        return len(self._queue) > 0
+
+
+    async def _park(self, waiters, predicate):
+        """Wait in line on waiters until woken up"""
+        waiter = asyncio.get_running_loop().create_future()
+        waiters.append(waiter)
+        try:
+            await waiter
+        except BaseException:
+            waiter.cancel()
+            try:
+                waiters.remove(waiter)
+            except ValueError:
+                pass
+            # if we were woken up right before being cancelled, pass the turn on
+            if predicate() and not waiter.cancelled():
+                self._wakeup(waiters, 1)
+            raise
+
+
+    @staticmethod
+    def _wakeup(waiters, k):
+        """Wake up the next k waiting coroutines (skipping the cancelled ones)"""
+        while k > 0 and waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                k -= 1
+
+
+    @property
+    def maxsize(self):
+        return self._maxsize
+
+
+    def empty(self):
+        """Time Complexity O(1)"""
+        return len(self._queue) == 0
+
+
+    def full(self):
+        """Time Complexity O(1)"""
+        return len(self._queue) == self._maxsize
+
+
+    def tolist(self):
+        """Get a list object from the AsyncRingBuffer"""
+        return self._queue.tolist()
+
+
+    def __repr__(self):
+        """representation of an AsyncRingBuffer object"""
+        return f"AsyncRingBuffer({self.tolist()}, maxsize={self._maxsize})"
+
+
+    def __len__(self):
+        """Time Complexity O(1)"""
+        return len(self._queue)
+    qsize = size = __len__
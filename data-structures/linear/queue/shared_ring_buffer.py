@@ -0,0 +1,299 @@
+"""
+A ring buffer of fixed size records living in shared memory
+(multiprocessing.shared_memory), so that processes can hand each other records
+without pickling them through a multiprocessing.Queue.
+
+It is the circular array based Queue laid out in a flat block of bytes:
+
+    offset 0     magic, record size, capacity
+    offset 64    head, the number of records read so far
+    offset 128   tail, the number of records written so far
+    offset 192   capacity slots of record_size bytes each
+
+head and tail only ever grow, the slot of a counter is counter % capacity, and
+tail - head is the number of records in the buffer (so full and empty can't be
+confused). They sit on separate cache lines so the producer and the consumer
+don't keep invalidating each other's cache.
+
+With one producer and one consumer (SPSC) no lock is needed: only the producer
+writes tail and only the consumer writes head, each after its record has been
+copied. That relies on the aligned 8 byte stores of the counters being atomic
+and not reordered with the record copy, which holds on x86-64. With several
+producers or consumers (MPMC), or on other platforms, pass a
+multiprocessing.Lock and every operation takes it.
+
+Records are bytes-like objects of exactly record_size bytes. get() copies a
+record out, peek() returns a zero copy memoryview of it that stays valid until
+the record is consumed. close() raises BufferError while such a view is alive,
+and the buffer stays usable.
+"""
+import struct
+import time
+from multiprocessing import shared_memory
+from queue import Empty, Full
+
+MAGIC = b"PYRB"
+HEADER = struct.Struct("=4sII")   # magic, record size, capacity
+HEAD_OFFSET = 64
+TAIL_OFFSET = 128
+DATA_OFFSET = 192
+
+
+class SharedRingBuffer:
+    def __init__(self, capacity, record_size, lock=None, name=None):
+        """Create a new ring buffer in shared memory (named name, if given)"""
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if record_size < 1:
+            raise ValueError("record_size must be at least 1")
+        shm = shared_memory.SharedMemory(name=name, create=True, size=DATA_OFFSET + capacity * record_size)
+        HEADER.pack_into(shm.buf, 0, MAGIC, record_size, capacity)
+        struct.pack_into("=Q", shm.buf, HEAD_OFFSET, 0)
+        struct.pack_into("=Q", shm.buf, TAIL_OFFSET, 0)
+        self._setup(shm, lock, owner=True)
+
+
+    @classmethod
+    def attach(cls, name, lock=None):
+        """Open an existing ring buffer by the name of its shared memory block"""
+        shm = shared_memory.SharedMemory(name=name)
+        if bytes(shm.buf[:4]) != MAGIC:
+            shm.close()
+            raise ValueError(f"{name!r} is not a SharedRingBuffer")
+        ring = cls.__new__(cls)
+        ring._setup(shm, lock, owner=False)
+        return ring
+
+
+    def _setup(self, shm, lock, owner):
+        self._shm = shm
+        self._lock = lock
+        self._owner = owner   # the creating process is the one that unlinks the memory
+        self._pinned = []     # old handles kept mapped for live peek() views, see close()
+        _, self._record_size, self._capacity = HEADER.unpack_from(shm.buf, 0)
+        self._head = shm.buf[HEAD_OFFSET:HEAD_OFFSET + 8].cast("Q")
+        self._tail = shm.buf[TAIL_OFFSET:TAIL_OFFSET + 8].cast("Q")
+        self._data = shm.buf[DATA_OFFSET:]
+
+
+    def __reduce__(self):
+        # sending the buffer to a child process (Process(args=...)) attaches to the same memory
+        return (type(self).attach, (self.name, self._lock))
+
+
+    def put(self, record, block=True, timeout=None):
+        """Copy a record into the buffer, waiting (up to timeout seconds) for a free slot if it's full"""
+        """Time Complexity O(record_size)"""
+        if len(record) != self._record_size:
+            raise ValueError(f"records must be {self._record_size} bytes long, got {len(record)}")
+        self._retry(lambda: self._put_some([record], 0), block, timeout, Full)
+
+
+    def get(self, block=True, timeout=None):
+        """Remove the first record and return a copy of it, waiting (up to timeout seconds) if the buffer is empty"""
+        """Time Complexity O(record_size)"""
+        return self._retry(lambda: self._get_some(1), block, timeout, Empty)[0]
+
+
+    def put_many(self, records, block=True, timeout=None):
+        """Copy all the records in, a batch at a time (as many as there are free slots)"""
+        """Time Complexity O(k * record_size)"""
+        # If the time runs out halfway, the records already added stay in the buffer
+        # and Full is raised for the rest
+        records = list(records)
+        for record in records:
+            if len(record) != self._record_size:
+                raise ValueError(f"records must be {self._record_size} bytes long, got {len(record)}")
+        deadline = None if timeout is None else time.monotonic() + timeout
+        added = 0
+        while added < len(records):
+            remaining = None if deadline is None else max(0, deadline - time.monotonic())
+            added += self._retry(lambda: self._put_some(records, added), block, remaining, Full)
+
+
+    def get_many(self, max_items, block=True, timeout=None):
+        """Remove up to max_items records (at least one) and return copies of them, waiting for the first if the buffer is empty"""
+        """Time Complexity O(k * record_size)"""
+        if max_items < 0:
+            raise ValueError("'max_items' must be a non-negative number")
+        if max_items == 0:
+            return []   # nothing was asked for, so there's nothing to wait for either
+        return self._retry(lambda: self._get_some(max_items), block, timeout, Empty)
+
+
+    def put_nowait(self, record):
+        return self.put(record, block=False)
+
+
+    def get_nowait(self):
+        return self.get(block=False)
+
+
+    def peek(self, index=0):
+        """Zero copy view of the index-th record waiting in the buffer, valid until it's consumed"""
+        """Time Complexity O(1)"""
+        # Meant for a single consumer: read the view, then consume() the record
+        head = self._head[0]
+        if not 0 <= index < self._tail[0] - head:
+            raise IndexError("Index out of range")
+        start = (head + index) % self._capacity * self._record_size
+        return self._data[start:start + self._record_size]
+
+
+    def consume(self, k=1):
+        """Drop the first k records (after reading them with peek)"""
+        """Time Complexity O(1)"""
+        self._locked(self._consume, k)
+
+
+    def _consume(self, k):
+        head = self._head[0]
+        if not 0 <= k <= self._tail[0] - head:
+            raise ValueError("Not enough records to consume")
+        self._head[0] = head + k
+
+
+    def _put_some(self, records, start):
+        """Copy as many records from records[start:] as fit, return how many (None when full)"""
+        return self._locked(self._put_unlocked, records, start)
+
+
+    def _put_unlocked(self, records, start):
+        tail = self._tail[0]
+        k = min(len(records) - start, self._capacity - (tail - self._head[0]))
+        size = self._record_size
+        for i in range(k):
+            slot = (tail + i) % self._capacity * size
+            self._data[slot:slot + size] = records[start + i]
+        if k == 0:
+            return None
+        self._tail[0] = tail + k   # publish the records only once they're written
+        return k
+
+
+    def _get_some(self, max_items):
+        """Copy out and remove up to max_items records, return them (None when empty)"""
+        return self._locked(self._get_unlocked, max_items)
+
+
+    def _get_unlocked(self, max_items):
+        head = self._head[0]
+        k = max(0, min(max_items, self._tail[0] - head))
+        if k == 0:
+            return None
+        size, slot = self._record_size, head % self._capacity
+        first = min(k, self._capacity - slot)   # the records before wrapping around
+        block = self._data[slot * size:(slot + first) * size].tobytes()
+        block += self._data[:(k - first) * size].tobytes()
+        self._head[0] = head + k   # free the slots only once they're copied out
+        return [block[i:i + size] for i in range(0, k * size, size)]
+
+
+    def _locked(self, func, *args):
+        if self._lock is None:
+            return func(*args)
+        with self._lock:
+            return func(*args)
+
+
+    @staticmethod
+    def _retry(attempt, block, timeout, exception):
+        """Call attempt until it returns something other than None, backing off in between"""
+        # There is no cross process condition variable to wait on, so a blocked
+        # caller polls: spin a little, then sleep for longer and longer (up to 1ms)
+        if timeout is not None and timeout < 0:
+            raise ValueError("'timeout' must be a non-negative number")
+        deadline = None if timeout is None else time.monotonic() + timeout
+        delay = 0
+        while True:
+            result = attempt()
+            if result is not None:
+                return result
+            if not block or (deadline is not None and time.monotonic() >= deadline):
+                raise exception
+            time.sleep(delay)
+            delay = min(0.001, delay * 2 or 1e-6)
+
+
+    @property
+    def name(self):
+        return self._shm.name
+
+
+    @property
+    def capacity(self):
+        return self._capacity
+
+
+    @property
+    def record_size(self):
+        return self._record_size
+
+
+    def empty(self):
+        """Time Complexity O(1)"""
+        return len(self) == 0
+
+
+    def full(self):
+        """Time Complexity O(1)"""
+        return len(self) == self._capacity
+
+
+    def close(self):
+        """Detach from the shared memory, the creating process also frees it"""
+        if self._shm is None:
+            return
+        self._release_views()
+        try:
+            self._shm.close()
+        except BufferError:
+            # a view returned by peek() is still alive and keeps the mapping in use, so
+            # SharedMemory.close() gave up halfway. Attach again so this handle stays
+            # usable and keep the old one mapped for the views that still point into it
+            pinned = self._pinned + [self._shm]
+            self._setup(shared_memory.SharedMemory(name=self._shm.name), self._lock, self._owner)
+            self._pinned = pinned
+            raise BufferError("release the views returned by peek() before closing") from None
+        for shm in self._pinned:
+            try:
+                shm.close()
+            except BufferError:
+                pass   # still viewed, the mapping goes away with the last of those views
+        if self._owner:
+            self._shm.unlink()
+        self._shm = None
+
+
+    def _release_views(self):
+        # views into the block must be released before it can be closed
+        self._head.release()
+        self._tail.release()
+        self._data.release()
+
+
+    def __del__(self):
+        # a process that just drops its handle (e.g. a worker exiting) must not
+        # leave views behind, or SharedMemory fails to close its mapping
+        if getattr(self, "_shm", None) is not None:
+            self._release_views()
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+    def __repr__(self):
+        """representation of a SharedRingBuffer object"""
+        return (f"SharedRingBuffer(name={self.name!r}, {len(self)}/{self._capacity} records "
+                f"of {self._record_size} bytes)")
+
+
+    def __len__(self):
+        """Time Complexity O(1)"""
+        return self._tail[0] - self._head[0]
+    qsize = size = __len__
@@ -0,0 +1,167 @@
+"""
+An aggregate stack keeps, next to every element, the aggregates (min, max or any
+other associative function) of everything from the bottom of the stack up to that
+element. The aggregates of the whole stack are then the ones stored with the top
+element, so they are O(1) to read and O(1) to keep up to date on push and pop.
+
+The stack is persistent: it's a chain of immutable nodes where every node points to
+the node below it, and pushing or popping only changes which node is the top.
+A node is never modified once it's created, so remembering the top node is a
+complete snapshot of the stack, and going back to it (rollback) is O(1) no matter
+how many pushes and pops happened in between. Rolling "forward" to a later
+snapshot works as well, which is all an undo/redo buffer needs.
+
+s = AggregateStack([5, 1, 7])
+s.min(), s.max()          # Output: (1, 7)
+marker = s.snapshot()
+s.push(0); s.pop(); s.pop(); s.push(-3)
+s.min()                   # Output: -3
+s.rollback(marker)
+s.tolist(), s.min()       # Output: ([5, 1, 7], 1)
+
+AggregateStack(aggregates={"sum": operator.add, "gcd": math.gcd})
+"""
+
+class AggregateStack:
+    class Node:
+        """each Node of an Aggregate Stack, never modified once created"""
+        __slots__ = ("data", "aggregates", "below", "depth")
+
+        def __init__(self, data, aggregates, below, depth):
+            self.data = data # data stored in the current Node
+            self.aggregates = aggregates # aggregates of the stack from the bottom up to this Node
+            self.below = below # the Node under this one (None for the bottom Node)
+            self.depth = depth # number of Nodes from the bottom, this one included
+
+
+    class Snapshot:
+        """A marker of the state of an Aggregate Stack, see snapshot() and rollback()"""
+        __slots__ = ("_stack", "_node")
+
+        def __init__(self, stack, node):
+            self._stack = stack
+            self._node = node
+
+
+        def __len__(self):
+            """Size of the stack when the snapshot was taken"""
+            return self._node.depth if self._node is not None else 0
+
+
+        def __repr__(self):
+            return f"Snapshot(size={len(self)})"
+
+
+    # aggregates maps a name to an associative function of two values, like
+    # {"sum": operator.add}. The aggregate of a single element is the element itself.
+    # The default keeps the min and the max, pass {} to keep nothing
+    def __init__(self, array=None, aggregates=None):
+        if aggregates is None:
+            aggregates = {"min": min, "max": max}
+        self._names = {name: i for i, name in enumerate(aggregates)}
+        self._functions = tuple(aggregates.values())
+        self._top = None   # the top Node, None when the stack is empty
+        if array is not None:
+            for item in array: self.push(item)
+
+
+    def push(self, item):
+        """Push a new element on the top of the stack"""
+        """Time Complexity O(1) (O(number of aggregates))"""
+        below = self._top
+        if below is None:
+            aggregates = (item,) * len(self._functions)
+            depth = 1
+        else:
+            aggregates = tuple(function(aggregate, item)
+                               for function, aggregate in zip(self._functions, below.aggregates))
+            depth = below.depth + 1
+        self._top = self.Node(item, aggregates, below, depth)
+
+
+    def pop(self):
+        """Pop the top element from the stack"""
+        """Time Complexity O(1)"""
+        if self._top is None:
+            raise ValueError("Can't pop from an empty stack")
+        value = self._top.data
+        self._top = self._top.below
+        return value
+
+
+    def top(self):
+        """get the top element on the stack, also known as peek"""
+        """Time Complexity O(1)"""
+        if self._top is None:
+            raise ValueError("Stack is empty")
+        return self._top.data
+    peek = top
+
+
+    def isempty(self):
+        """check if the stack is empty or not"""
+        """Time Complexity O(1)"""
+        return self._top is None
+
+
+    def aggregate(self, name):
+        """The aggregate called name of all the elements in the stack"""
+        """Time Complexity O(1)"""
+        if name not in self._names:
+            raise ValueError(f"No aggregate called {name!r}")
+        if self._top is None:
+            raise ValueError("Stack is empty")
+        return self._top.aggregates[self._names[name]]
+
+
+    def min(self):
+        """Time Complexity O(1)"""
+        return self.aggregate("min")
+
+
+    def max(self):
+        """Time Complexity O(1)"""
+        return self.aggregate("max")
+
+
+    def snapshot(self):
+        """Return a marker of the current state of the stack, to rollback to later"""
+        """Time Complexity O(1)"""
+        return self.Snapshot(self, self._top)
+
+
+    def rollback(self, snapshot):
+        """Bring the stack back to the state it had when snapshot was taken"""
+        """Time Complexity O(1)"""
+        if not isinstance(snapshot, self.Snapshot) or snapshot._stack is not self:
+            raise ValueError("The snapshot doesn't belong to this stack")
+        self._top = snapshot._node
+
+
+    def tolist(self):
+        """The elements from the bottom to the top"""
+        """Time Complexity O(n)"""
+        res = []
+        current_node = self._top
+        while current_node is not None:
+            res.append(current_node.data)
+            current_node = current_node.below
+        res.reverse()
+        return res
+
+
+    def __repr__(self):
+        """Representation of an aggregate stack"""
+        return f"AggregateStack({self.tolist()})"
+
+
+    def __len__(self):
+        """length of the stack"""
+        """Time Complexity O(1)"""
+        return self._top.depth if self._top is not None else 0
+    size = __len__
+
+
+    def __iter__(self):
+        """iterator for a stack (from the bottom to the top, like the array stacks)"""
+        return iter(self.tolist())
@@ -1,21 +1,32 @@
-import ctypes
-
-class Stack():
-    def __init__(self, array=None):
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "array"))   # see growth_policy.py
+from dynamic_array import TypedStorage
+from growth_policy import GrowthPolicy
+
+class Stack(TypedStorage):
+    # Stack(typecode='q') stores raw 8 byte signed integers in a contiguous buffer
+    # (see the `array` module for the available typecodes) instead of references to
+    # Python objects, which also lets tobuffer() export the live elements without copying
+    def __init__(self, array=None, policy=None, typecode=None):
         """initializing a new stack"""
         self._n = 0    # total elements
-        self._capacity = 1   # default capacity
-        self._stack = self._make_array(self._capacity)
+        self._typecode = typecode   # None means object mode (any Python objects)
+        self._policy = policy if policy is not None else GrowthPolicy()
+        self._grows = self._shrinks = 0   # resize counters
+        self._capacity = self._policy.min_capacity   # default capacity
+        self._array = self._make_array(self._capacity)
         if array is not None:
-            for item in array: self.push(item)
+            self.push_many(array)
 
 
     def push(self, item):
         """Push a new element on the top of the stack"""
         """Time Complexity O(1) (amortized)"""
         if self._n == self._capacity:
-            self._resize(2 * self._capacity)
-        self._stack[self._n] = item
+            self._resize(self._policy.grow(self._capacity, self._n + 1))
+        self._array[self._n] = item
         self._n += 1
 
 
@@ -23,14 +34,54 @@ class Stack():
         """Pop the top element from the stack"""
         """Time Complexity O(1) (amortized)"""
         if not self.isempty():
-            if 4 * self._n <= self._capacity:
-                self._resize(self._capacity // 2)
-            value = self._stack[self._n - 1]
+            value = self._array[self._n - 1]
             self._n -= 1
+            self._clear(self._n, self._n + 1)   # don't keep the popped object alive
+            # shrink only after the pop, so the policy sees the real occupancy
+            capacity = self._policy.shrink(self._capacity, self._n)
+            if capacity is not None:
+                self._resize(capacity)
             return value
         raise ValueError("Can't pop from an empty array")
 
 
+    def push_many(self, items):
+        """Push all the items, the last one ends up on the top"""
+        """Time Complexity O(k) (amortized)"""
+        # one capacity check (at most one resize) and a single block copy
+        block = self._make_block(items)
+        k = len(block)
+        if self._n + k > self._capacity:
+            self._resize(self._policy.grow(self._capacity, self._n + k))
+        self._array[self._n:self._n + k] = block
+        self._n += k
+
+
+    def pop_many(self, k):
+        """Pop the k top elements, returned in the order pop() would return them (top first)"""
+        """Time Complexity O(k) (amortized)"""
+        if k < 0:
+            raise ValueError("Can't pop a negative number of elements")
+        if k > self._n:
+            raise ValueError("Can't pop more elements than the stack has")
+        start = self._n - k
+        values = self._array[start:self._n]   # a single block copy
+        self._clear(start, self._n)   # don't keep the popped objects alive
+        values.reverse()
+        self._n = start
+        capacity = self._policy.shrink(self._capacity, self._n)
+        if capacity is not None:
+            self._resize(capacity)
+        return values if isinstance(values, list) else values.tolist()
+
+
+    def tolist(self):
+        """Get a list of the elements from the bottom to the top"""
+        """Time Complexity O(n)"""
+        values = self._array[:self._n]   # a C level copy of the live region
+        return values if isinstance(values, list) else values.tolist()
+
+
     def isempty(self):
         """check if the stack is empty or not"""
         """Time Complexity O(1)"""
@@ -42,10 +93,30 @@ class Stack():
         """Time Complexity O(1)"""
         if self.isempty():
             raise ValueError("Stack is empty")
-        return self._stack[self._n - 1]
+        return self._array[self._n - 1]
     peek = top # top is also known as peek
 
 
+    def reserve(self, capacity):
+        """Make sure the stack can hold `capacity` elements without resizing"""
+        """Time Complexity O(n)"""
+        if capacity > self._capacity:
+            self._resize(capacity)
+
+
+    def shrink_to_fit(self):
+        """Release the unused capacity"""
+        """Time Complexity O(n)"""
+        capacity = max(self._policy.min_capacity, self._n)
+        if capacity != self._capacity:
+            self._resize(capacity)
+
+
+    def resize_stats(self):
+        """Return how many times the stack grew and shrank, to tune the growth policy"""
+        return {"grows": self._grows, "shrinks": self._shrinks, "capacity": self._capacity}
+
+
     def __repr__(self):
         """Representation of a stack"""
         return f"Stack({list(self)})"
@@ -61,7 +132,7 @@ class Stack():
     def __iter__(self):
         """iterator for a stack"""
         for i in range(len(self)):
-            yield self._stack[i]
+            yield self._array[i]
 
 
     def __getitem__(self, key):
@@ -73,22 +144,20 @@ class Stack():
                 key += self._n
             if key < 0 or key >= self._n:
                 raise IndexError("Index out of range")
-            return self._stack[key]
+            return self._array[key]
 
         if isinstance(key, slice):
             start, stop, step = key.indices(self._n)
-            return self._stack[start:stop:step]
+            return self._array[start:stop:step]
 
 
     def _resize(self, capacity):
         """Resizing the current array with a diff capacity"""
+        if capacity > self._capacity:
+            self._grows += 1
+        elif capacity < self._capacity:
+            self._shrinks += 1
         aux = self._make_array(capacity)
-        for i in range(len(self)):
-            aux[i] = self._stack[i]
-        self._stack = aux
-
-
-    def _make_array(self, capacity):
-        """Creating a lower-level array"""
+        aux[:self._n] = self._array[:self._n]   # copy the live elements in one block
+        self._array = aux
         self._capacity = capacity
-        return (self._capacity * ctypes.py_object)()
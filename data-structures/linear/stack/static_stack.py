@@ -2,14 +2,21 @@
 A static stack has a predetermined (fixed) size and it can't be changed during the
 program's execution
 """
-import ctypes
+import os
+import sys
 
-class Stack:
-    def __init__(self, capacity):
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "array"))   # see growth_policy.py
+from dynamic_array import TypedStorage
+
+class Stack(TypedStorage):
+    def __init__(self, capacity, typecode=None):
         """initializing a new static stack"""
         # Stack(6) : Creating a stack with capacity 6 and all of the positions being empty
+        # Stack(6, typecode='q') stores raw 8 byte signed integers instead of references
+        # to Python objects (see the `array` module), and can export them with tobuffer()
         self._capacity = capacity
-        self._stack = (self._capacity * ctypes.py_object)() # creating a low-level python array with size of self._capacity
+        self._typecode = typecode   # None means object mode (any Python objects)
+        self._array = self._make_array(self._capacity) # creating a low-level array with size of self._capacity
         self._top = -1
 
 
@@ -17,21 +24,15 @@ class Stack:
     # Or, Stack.from_iterable([13,25,26,73,17,63], 10)   # with capacity 10
     # Creating a stack with capacity 6 and all of the positions being filled from the given iterable
     @classmethod
-    def from_iterable(cls, iterable, capacity=None):
+    def from_iterable(cls, iterable, capacity=None, typecode=None):
+        iterable = list(iterable)
         if capacity is None:
             capacity = len(iterable)
         if len(iterable) > capacity:
             raise ValueError("Capacity can't be smaller than the actual size of the iterable")
 
-        instance = cls(capacity) # Create a standard instance first
-        instance._capacity = capacity
-
-        instance._top = len(iterable) - 1
-        instance._stack = (instance._capacity * ctypes.py_object)() # creating a low-level python array
-        # fill the stack with elements
-        for i in range(len(iterable)):
-            instance._stack[i] = iterable[i]
-
+        instance = cls(capacity, typecode) # Create a standard instance first
+        instance.push_many(iterable)   # fill the stack with elements in one block copy
         return instance
 
 
@@ -40,7 +41,7 @@ class Stack:
         if len(self) == self._capacity:
             raise ValueError("The Stack is already full of it's capacity")
 
-        self._stack[self._top + 1] = item
+        self._array[self._top + 1] = item
         self._top += 1
 
 
@@ -49,19 +50,55 @@ class Stack:
         if self.isempty():
             raise ValueError("The Stack is empty")
 
-        value = self._stack[self._top]
-        self._stack[self._top] = None      # to be collected by the garbage collector
+        value = self._array[self._top]
+        self._clear(self._top, self._top + 1)   # to be collected by the garbage collector
         self._top -= 1
 
         return value
 
 
+    def push_many(self, items):
+        """Push all the items (the last one ends up on the top), or none if they don't fit"""
+        """Time Complexity O(k)"""
+        # one capacity check and a single block copy
+        block = self._make_block(items)
+        k = len(block)
+        if len(self) + k > self._capacity:
+            raise ValueError("The Stack doesn't have room for all the items")
+        self._array[self._top + 1:self._top + 1 + k] = block
+        self._top += k
+
+
+    def pop_many(self, k):
+        """Pop the k top elements, returned in the order pop() would return them (top first)"""
+        """Time Complexity O(k)"""
+        if k < 0:
+            raise ValueError("Can't pop a negative number of elements")
+        if k > len(self):
+            raise ValueError("Can't pop more elements than the Stack has")
+        start = len(self) - k
+        values = self._array[start:start + k]   # a single block copy
+        self._clear(start, start + k)   # to be collected by the garbage collector
+        if self._typecode is not None:
+            values = values.tolist()
+        values.reverse()
+        self._top -= k
+        return values
+
+
+    def tolist(self):
+        """Get a list of the elements from the bottom to the top"""
+        """Time Complexity O(n)"""
+        values = self._array[:len(self)]   # a C level copy of the live region
+        return values if isinstance(values, list) else values.tolist()
+
+
     def top(self):
         """Time Complexity O(1)"""
         if self.isempty():
             raise ValueError("The Stack is empty")
 
-        return self._stack[self._top]
+        return self._array[self._top]
     peek = top
 
 
@@ -74,7 +111,7 @@ class Stack:
         """search for an item in the static stack and return the index of the first occurrence of that item"""
         """Time Complexity O(n)"""
         for i in range(self.size()):
-            if self._stack[i] == item:
+            if self._array[i] == item:
                 return i
         raise ValueError("item doesn't exist in the array")
 
@@ -101,7 +138,7 @@ class Stack:
     def __iter__(self):
         """iterator for a static stack"""
         for i in range(self.size()):
-            yield self._stack[i]
+            yield self._array[i]
 
 
     def __getitem__(self, key):
@@ -113,8 +150,8 @@ class Stack:
                 key += self.size()
             if key < 0 or key >= self.size():
                 raise IndexError("Index out of range")
-            return self._stack[key]
+            return self._array[key]
 
         if isinstance(key, slice):
             start, stop, step = key.indices(self.size())   # handing slicing
-            return self._stack[start:stop:step]
+            return self._array[start:stop:step]
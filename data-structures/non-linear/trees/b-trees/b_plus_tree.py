@@ -0,0 +1,418 @@
+"""
+A B+ tree is a search tree where every node holds many keys instead of one. An
+internal node with k children holds k - 1 separator keys, and every key in its
+i-th child is >= keys[i - 1] and < keys[i]. All the (key, value) pairs live in
+the leaves, which are all at the same depth and linked left to right, so a range
+scan finds its first key and then just walks along the leaves.
+
+The order (fanout) is the maximum number of children of an internal node and of
+keys in a leaf. Every node except the root is kept at least half full, by
+splitting a node that overflows and by borrowing from or merging with a sibling
+when one underflows. The height is about log(n) / log(order / 2), and a node's
+keys sit next to each other in a list, so a lookup runs through a handful of
+contiguous lists (binary searched with bisect) instead of chasing one pointer
+per level of a binary tree. A key costs two list slots (its key and its value)
+plus its share of the node objects, much less than a binary tree node per key.
+
+t = BPlusTree(order=4)
+for k in [5, 1, 9, 3, 7]: t[k] = str(k)
+t[3], t.get(4)          # Output: ('3', None)
+list(t.range(3, 7))     # Output: [(3, '3'), (5, '5'), (7, '7')]
+del t[5]
+t = BPlusTree.from_sorted((i, i * i) for i in range(1_000_000))   # bulk loading, O(n)
+"""
+from bisect import bisect_left, bisect_right
+
+class BPlusTree:
+    class Leaf:
+        """A leaf of a B+ tree, sorted keys with their values and a link to the next leaf"""
+        __slots__ = ("keys", "values", "next")
+
+        def __init__(self, keys=None, values=None, next=None):
+            self.keys = keys if keys is not None else []
+            self.values = values if values is not None else []
+            self.next = next # the leaf on the right, None for the last one
+
+
+    class Internal:
+        """An internal node of a B+ tree, len(keys) + 1 children split by the separator keys"""
+        __slots__ = ("keys", "children")
+
+        def __init__(self, keys, children):
+            self.keys = keys
+            self.children = children
+
+
+    def __init__(self, items=None, order=64):
+        """An empty tree, or one bulk loaded with items (a mapping or (key, value) pairs)"""
+        if order < 3:
+            raise ValueError("The order must be at least 3")
+        self._order = order
+        self._min_keys = order // 2 # fewest keys in a leaf (except the root)
+        self._min_children = (order + 1) // 2 # fewest children of an internal node (except the root)
+        self._n = 0
+        self.root = self.Leaf()
+        if items is not None:
+            if hasattr(items, "items"):
+                items = items.items()
+            # a stable sort keeps equal keys in order, so the last one wins like in a dict
+            self._bulk_load(sorted(items, key=lambda item: item[0]))
+
+
+    @classmethod
+    def from_sorted(cls, items, order=64):
+        """Bulk load a tree from (key, value) pairs sorted by key (the last value of a repeated key wins).
+        Raises ValueError if the keys aren't sorted."""
+        """Time Complexity O(n)"""
+        tree = cls(order=order)
+        tree._bulk_load(items)
+        return tree
+
+
+    def get(self, key, default=None):
+        """The value of key, or default if key isn't in the tree"""
+        """Time Complexity O(log n)"""
+        leaf = self._find_leaf(key)
+        i = bisect_left(leaf.keys, key)
+        if i < len(leaf.keys) and leaf.keys[i] == key:
+            return leaf.values[i]
+        return default
+
+
+    def put(self, key, value):
+        """Set the value of key, adding key if it's not in the tree yet"""
+        """Time Complexity O(log n) (O(order) to shift the keys in the node)"""
+        path = [] # (internal node, index of the child we went down to)
+        node = self.root
+        while isinstance(node, self.Internal):
+            i = bisect_right(node.keys, key)
+            path.append((node, i))
+            node = node.children[i]
+        i = bisect_left(node.keys, key)
+        if i < len(node.keys) and node.keys[i] == key:
+            node.values[i] = value
+            return
+        node.keys.insert(i, key)
+        node.values.insert(i, value)
+        self._n += 1
+
+        # split every node that has overflowed, from the leaf up
+        if len(node.keys) <= self._order:
+            return
+        separator, right = self._split_leaf(node)
+        while path:
+            parent, i = path.pop()
+            parent.keys.insert(i, separator)
+            parent.children.insert(i + 1, right)
+            if len(parent.children) <= self._order:
+                return
+            node = parent
+            separator, right = self._split_internal(node)
+        self.root = self.Internal([separator], [node, right]) # the root split, the tree grows one level
+
+
+    def delete(self, key):
+        """Remove key (and its value) from the tree. Raises KeyError if it's not in the tree"""
+        """Time Complexity O(log n) (O(order) to shift the keys in the node)"""
+        path = []
+        node = self.root
+        while isinstance(node, self.Internal):
+            i = bisect_right(node.keys, key)
+            path.append((node, i))
+            node = node.children[i]
+        i = bisect_left(node.keys, key)
+        if i == len(node.keys) or node.keys[i] != key:
+            raise KeyError(key)
+        # the separators above may still hold key, that's fine: they only
+        # need to stay between the keys of the children they separate
+        del node.keys[i]
+        del node.values[i]
+        self._n -= 1
+
+        # fix every node that has underflowed, from the leaf up
+        while path and self._underflows(node):
+            parent, i = path.pop()
+            self._rebalance(parent, i)
+            node = parent
+        if isinstance(self.root, self.Internal) and len(self.root.children) == 1:
+            self.root = self.root.children[0] # the root is down to one child, the tree shrinks one level
+
+
+    def pop(self, key, *default):
+        """Remove key and return its value (or default if given and key isn't in the tree)"""
+        """Time Complexity O(log n)"""
+        leaf = self._find_leaf(key)
+        i = bisect_left(leaf.keys, key)
+        if i < len(leaf.keys) and leaf.keys[i] == key:
+            value = leaf.values[i]
+            self.delete(key)
+            return value
+        if default:
+            return default[0]
+        raise KeyError(key)
+
+
+    def range(self, lo=None, hi=None):
+        """Lazily yield the (key, value) pairs with lo <= key <= hi in order (None leaves that side unbounded)"""
+        """Time Complexity O(log n + k) for k pairs in the range"""
+        if lo is None:
+            leaf, i = self._first_leaf(), 0
+        else:
+            leaf = self._find_leaf(lo)
+            i = bisect_left(leaf.keys, lo)
+        while leaf is not None:
+            keys, values = leaf.keys, leaf.values
+            # the part of this leaf that is still in the range
+            end = len(keys) if hi is None else bisect_right(keys, hi, i)
+            for j in range(i, end):
+                yield keys[j], values[j]
+            if end < len(keys):
+                return
+            leaf, i = leaf.next, 0
+    items = range
+
+
+    def count_range(self, lo=None, hi=None):
+        """The number of keys with lo <= key <= hi"""
+        """Time Complexity O(log n + k / order)"""
+        if lo is None:
+            leaf, i = self._first_leaf(), 0
+        else:
+            leaf = self._find_leaf(lo)
+            i = bisect_left(leaf.keys, lo)
+        count = 0
+        while leaf is not None:
+            end = len(leaf.keys) if hi is None else bisect_right(leaf.keys, hi, i)
+            count += max(0, end - i)
+            if end < len(leaf.keys):
+                break
+            leaf, i = leaf.next, 0
+        return count
+
+
+    def keys(self):
+        """Time Complexity O(n)"""
+        for key, _ in self.range():
+            yield key
+
+
+    def values(self):
+        """Time Complexity O(n)"""
+        for _, value in self.range():
+            yield value
+
+
+    def min(self):
+        """The smallest key"""
+        """Time Complexity O(log n)"""
+        if not self._n:
+            raise ValueError("Empty B+ tree")
+        return self._first_leaf().keys[0]
+
+
+    def max(self):
+        """The largest key"""
+        """Time Complexity O(log n)"""
+        if not self._n:
+            raise ValueError("Empty B+ tree")
+        node = self.root
+        while isinstance(node, self.Internal):
+            node = node.children[-1]
+        return node.keys[-1]
+
+
+    def height(self):
+        """The number of levels below the root (0 when the root is a leaf)"""
+        """Time Complexity O(log n)"""
+        height = 0
+        node = self.root
+        while isinstance(node, self.Internal):
+            node = node.children[0]
+            height += 1
+        return height
+
+
+    @property
+    def order(self):
+        return self._order
+
+
+    def _find_leaf(self, key):
+        """The leaf where key is or would be"""
+        node = self.root
+        while isinstance(node, self.Internal):
+            node = node.children[bisect_right(node.keys, key)]
+        return node
+
+
+    def _first_leaf(self):
+        node = self.root
+        while isinstance(node, self.Internal):
+            node = node.children[0]
+        return node
+
+
+    def _split_leaf(self, leaf):
+        """Move the upper half of an overflowing leaf to a new leaf, return (separator, new leaf)"""
+        mid = len(leaf.keys) // 2
+        right = self.Leaf(leaf.keys[mid:], leaf.values[mid:], leaf.next)
+        del leaf.keys[mid:]
+        del leaf.values[mid:]
+        leaf.next = right
+        return right.keys[0], right # a copy of the first key of the new leaf goes up
+
+
+    def _split_internal(self, node):
+        """Move the upper half of an overflowing internal node to a new node, return (separator, new node)"""
+        mid = len(node.keys) // 2
+        separator = node.keys[mid] # the middle key moves up, it isn't kept in either half
+        right = self.Internal(node.keys[mid + 1:], node.children[mid + 1:])
+        del node.keys[mid:]
+        del node.children[mid + 1:]
+        return separator, right
+
+
+    def _underflows(self, node):
+        if isinstance(node, self.Leaf):
+            return len(node.keys) < self._min_keys
+        return len(node.children) < self._min_children
+
+
+    def _rebalance(self, parent, i):
+        """The i-th child of parent has underflowed, borrow from a sibling or merge with one"""
+        node = parent.children[i]
+        left = parent.children[i - 1] if i > 0 else None
+        right = parent.children[i + 1] if i + 1 < len(parent.children) else None
+        is_leaf = isinstance(node, self.Leaf)
+
+        # borrow one entry from a sibling that can spare it
+        if left is not None and not self._at_minimum(left):
+            if is_leaf:
+                node.keys.insert(0, left.keys.pop())
+                node.values.insert(0, left.values.pop())
+                parent.keys[i - 1] = node.keys[0]
+            else: # rotate through the parent: its separator comes down, the sibling's last key goes up
+                node.keys.insert(0, parent.keys[i - 1])
+                node.children.insert(0, left.children.pop())
+                parent.keys[i - 1] = left.keys.pop()
+            return
+        if right is not None and not self._at_minimum(right):
+            if is_leaf:
+                node.keys.append(right.keys.pop(0))
+                node.values.append(right.values.pop(0))
+                parent.keys[i] = right.keys[0]
+            else:
+                node.keys.append(parent.keys[i])
+                node.children.append(right.children.pop(0))
+                parent.keys[i] = right.keys.pop(0)
+            return
+
+        # both siblings are at the minimum, merge with one of them (the right one
+        # into the left one), which takes a separator and a child out of parent
+        if left is not None:
+            left_node, right_node, separator_index = left, node, i - 1
+        else:
+            left_node, right_node, separator_index = node, right, i
+        if is_leaf:
+            left_node.keys.extend(right_node.keys)
+            left_node.values.extend(right_node.values)
+            left_node.next = right_node.next
+        else: # the separator comes down between the two halves
+            left_node.keys.append(parent.keys[separator_index])
+            left_node.keys.extend(right_node.keys)
+            left_node.children.extend(right_node.children)
+        del parent.keys[separator_index]
+        del parent.children[separator_index + 1]
+
+
+    def _at_minimum(self, node):
+        if isinstance(node, self.Leaf):
+            return len(node.keys) <= self._min_keys
+        return len(node.children) <= self._min_children
+
+
+    def _bulk_load(self, items):
+        """Replace the tree with one holding items (sorted by key), built level by level from the leaves up"""
+        keys, values = [], []
+        for key, value in items:
+            if keys and not keys[-1] < key:
+                if key == keys[-1]: # a repeated key, the last value wins
+                    values[-1] = value
+                    continue
+                raise ValueError("The keys must be sorted in increasing order")
+            keys.append(key)
+            values.append(value)
+        self._n = len(keys)
+        if not keys:
+            self.root = self.Leaf()
+            return
+
+        # full leaves, except that the entries are spread evenly over the leaves so
+        # the last one isn't left under half full
+        nodes = []
+        for start, stop in self._chunks(len(keys)):
+            leaf = self.Leaf(keys[start:stop], values[start:stop])
+            if nodes:
+                nodes[-1].next = leaf
+            nodes.append(leaf)
+        lows = [leaf.keys[0] for leaf in nodes] # the smallest key under each node
+
+        # then each level of internal nodes over the one below, until one node is left
+        while len(nodes) > 1:
+            parents, parent_lows = [], []
+            for start, stop in self._chunks(len(nodes)):
+                parents.append(self.Internal(lows[start + 1:stop], nodes[start:stop]))
+                parent_lows.append(lows[start])
+            nodes, lows = parents, parent_lows
+        self.root = nodes[0]
+
+
+    def _chunks(self, n):
+        """Split range(n) into as few (start, stop) runs of at most order items as possible, of even sizes"""
+        count = -(-n // self._order) # ceil(n / order)
+        size, extra = divmod(n, count)
+        start = 0
+        for i in range(count):
+            stop = start + size + (1 if i < extra else 0)
+            yield start, stop
+            start = stop
+
+
+    def __getitem__(self, key):
+        """Time Complexity O(log n)"""
+        leaf = self._find_leaf(key)
+        i = bisect_left(leaf.keys, key)
+        if i < len(leaf.keys) and leaf.keys[i] == key:
+            return leaf.values[i]
+        raise KeyError(key)
+
+
+    def __setitem__(self, key, value):
+        self.put(key, value)
+
+
+    def __delitem__(self, key):
+        self.delete(key)
+
+
+    def __contains__(self, key):
+        """Time Complexity O(log n)"""
+        leaf = self._find_leaf(key)
+        i = bisect_left(leaf.keys, key)
+        return i < len(leaf.keys) and leaf.keys[i] == key
+
+
+    def __iter__(self):
+        """iterate over the keys in order"""
+        return self.keys()
+
+
+    def __len__(self):
+        return self._n
+    size = __len__
+
+
+    def __repr__(self):
+        """Representation of a BPlusTree object"""
+        pairs = ", ".join(f"{key!r}: {value!r}" for key, value in self.range())
+        return f"BPlusTree({{{pairs}}})"
@@ -0,0 +1,162 @@
+"""
+The B+ tree ordered map against the balanced BinarySearchTree and against bisect
+over a pair of sorted lists (keys and values), as an in-memory ordered index
+
+The BinarySearchTree stores keys only (it has no values), so its memory and
+times are, if anything, flattering.
+
+# run from anywhere, optionally with the number of keys (10,000,000 needs a few GB of RAM)
+❯ python3 data-structures/non-linear/trees/b-trees/benchmark.py 1000000
+"""
+import os
+import random
+import sys
+import tracemalloc
+from bisect import bisect_left, bisect_right
+from time import perf_counter
+
+here = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [here, os.path.join(here, "..", "binary-trees")]
+
+from b_plus_tree import BPlusTree
+from binary_search_tree import BinarySearchTree
+
+
+class SortedLists:
+    """The bisect baseline, an ordered map kept as a sorted list of keys and a parallel list of values"""
+
+    def __init__(self, keys, values):
+        self.keys = list(keys)
+        self.values = list(values)
+
+
+    def get(self, key, default=None):
+        i = bisect_left(self.keys, key)
+        if i < len(self.keys) and self.keys[i] == key:
+            return self.values[i]
+        return default
+
+
+    def put(self, key, value):
+        i = bisect_left(self.keys, key)
+        if i < len(self.keys) and self.keys[i] == key:
+            self.values[i] = value
+        else:   # shifts everything after i, O(n)
+            self.keys.insert(i, key)
+            self.values.insert(i, value)
+
+
+    def range(self, lo, hi):
+        start, stop = bisect_left(self.keys, lo), bisect_right(self.keys, hi)
+        return zip(self.keys[start:stop], self.values[start:stop])
+
+
+def timeit(func, repeat=3):
+    """Return the best wall-clock time of `repeat` runs of func"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        func()
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def builders(keys, values, order):
+    """(name, function building the structure from the sorted keys and values)"""
+    return [("BPlusTree", lambda: BPlusTree.from_sorted(zip(keys, values), order=order)),
+            ("BinarySearchTree", lambda: BinarySearchTree.from_sorted(keys, balanced=True)),
+            ("bisect lists", lambda: SortedLists(keys, values))]
+
+
+def bench_memory(n, order=64):
+    """Bytes per key of each structure, keys and values not included"""
+    # the keys and values are created up front so their objects are not counted
+    keys = list(range(0, 2 * n, 2))
+    values = keys
+    print(f"\n{n:,} keys, bytes per key (the key and value objects not included)")
+    for name, build in builders(keys, values, order):
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        structure = build()
+        used = tracemalloc.get_traced_memory()[0] - before
+        tracemalloc.stop()
+        del structure
+        print(f"{name:<40}{used / n:>12.1f}")
+
+
+def bench_operations(n, order=64, gets=100_000, puts=10_000, scans=1000, scan_width=100):
+    """Bulk load, point lookups, inserts of new keys and range scans (s, one run / best of 3)"""
+    keys = list(range(0, 2 * n, 2))   # even keys, so odd keys are new ones
+    values = keys
+    puts = min(puts, n)   # there are only n new keys
+    print(f"\n{n:,} keys, order {order} (s)")
+    print(f"{'workload':<40}{'BPlusTree':>12}{'BST (AVL)':>12}{'bisect':>12}")
+
+    structures = []
+    row = []
+    for _, build in builders(keys, values, order):
+        start = perf_counter()
+        structures.append(build())
+        row.append(perf_counter() - start)
+    print(f"{'bulk load from sorted (one run)':<40}" + "".join(f"{t:>12.3f}" for t in row))
+    bplus, bst, lists = structures
+
+    lookups = [random.choice(keys) for _ in range(gets)]
+    new_keys = random.sample(range(1, 2 * n, 2), puts)
+    lows = [random.randrange(2 * n) for _ in range(scans)]
+    hi = 2 * scan_width   # about scan_width keys, the keys are even
+
+    def get_all(get):
+        def run():
+            for key in lookups:
+                get(key)
+        return run
+
+    def put_all(put):
+        def run():
+            for key in new_keys:
+                put(key, key)
+        return run
+
+    def scan_all(scan):
+        def run():
+            for lo in lows:
+                for _ in scan(lo, lo + hi):
+                    pass
+        return run
+
+    print(f"{f'{gets:,} random gets':<40}" + "".join(f"{timeit(run):>12.3f}" for run in (
+        get_all(bplus.get), get_all(bst.contains), get_all(lists.get))))
+    # the same keys are inserted on every run, so only the first one does any work
+    print(f"{f'{puts:,} random puts of new keys':<40}" + "".join(f"{timeit(run, 1):>12.3f}" for run in (
+        put_all(bplus.put), put_all(lambda key, value: bst.insert(key)), put_all(lists.put))))
+    print(f"{f'{scans:,} range scans of ~{scan_width} keys':<40}" + "".join(f"{timeit(run):>12.3f}" for run in (
+        scan_all(bplus.range), scan_all(bst.iter_range), scan_all(lists.range))))
+
+
+def bench_order(n, orders=(8, 16, 32, 64, 128, 256), gets=100_000):
+    """How the order (fanout) of the B+ tree trades lookups against inserts (s, best of 3)"""
+    keys = list(range(0, 2 * n, 2))
+    lookups = [random.choice(keys) for _ in range(gets)]
+    new_keys = random.sample(range(1, 2 * n, 2), min(gets, n))   # there are only n new keys
+    print(f"\nBPlusTree with {n:,} keys, {gets:,} gets / {len(new_keys):,} puts (s)")
+    print(f"{'order':<10}{'height':>10}{'gets':>12}{'puts':>12}")
+    for order in orders:
+        tree = BPlusTree.from_sorted(zip(keys, keys), order=order)
+
+        def get_all():
+            for key in lookups:
+                tree.get(key)
+
+        def put_all():
+            for key in new_keys:
+                tree.put(key, key)
+
+        print(f"{order:<10}{tree.height():>10}{timeit(get_all):>12.3f}{timeit(put_all, 1):>12.3f}")
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    bench_memory(n)
+    bench_operations(n)
+    bench_order(n)
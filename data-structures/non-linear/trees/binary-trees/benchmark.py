@@ -0,0 +1,166 @@
+"""
+The plain BinarySearchTree against the balanced (AVL) one, for keys arriving in
+random order and in sorted order (timestamps), which is the worst case of the
+plain tree. Then the order statistic queries against scanning inorder(), and
+bulk loading against inserting the keys one at a time. Last, the node based
+BinaryTree against the array backed CompleteBinaryTree
+
+# run from anywhere, optionally with the number of keys
+❯ python3 data-structures/non-linear/trees/binary-trees/benchmark.py 5000
+"""
+import os
+import random
+import sys
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from binary_search_tree import BinarySearchTree
+from binary_tree import BinaryTree, CompleteBinaryTree
+
+
+def timeit(func, repeat=3):
+    """Return the best wall-clock time of `repeat` runs of func"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        func()
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def bench_balancing(n):
+    """Insert n keys, look all of them up and delete them, plain vs AVL (ms, best of 3)"""
+    print(f"\n{n:,} keys (ms, best of 3)")
+    print(f"{'workload':<28}{'plain':>12}{'AVL':>12}{'plain height':>14}{'AVL height':>12}")
+    random_keys = random.sample(range(n * 10), n)
+    for order, keys in (("random", random_keys), ("sorted", sorted(random_keys))):
+        trees = {}
+
+        def build(balanced):
+            def run():
+                tree = BinarySearchTree(keys[0], balanced=balanced)
+                for key in keys[1:]:
+                    tree.insert(key)
+                trees[balanced] = tree
+            return run
+
+        def lookup(balanced):
+            def run():
+                tree = trees[balanced]
+                for key in keys:
+                    tree.contains(key)
+            return run
+
+        def delete(balanced):
+            def run():
+                tree = BinarySearchTree(keys[0], balanced=balanced)
+                for key in keys[1:]:
+                    tree.insert(key)
+                for key in keys[1:]:
+                    tree.delete(key)
+            return run
+
+        for name, make in ((f"{order} insert", build), (f"{order} contains", lookup)):
+            print(f"{name:<28}" + "".join(f"{timeit(make(b)) * 1000:>12.1f}" for b in (False, True)), end="")
+            if make is build:
+                print(f"{trees[False].height():>14}{trees[True].height():>12}")
+            else:
+                print()
+        # delete includes building the tree again
+        print(f"{order + ' insert + delete':<28}" + "".join(f"{timeit(delete(b), 1) * 1000:>12.1f}" for b in (False, True)))
+
+
+def bench_range_queries(n, queries=1000):
+    """count_range / iter_range against dumping inorder() to a list and scanning it (ms, best of 3)"""
+    print(f"\n{queries} range queries over {n:,} keys, AVL tree (ms, best of 3)")
+    keys = random.sample(range(n * 10), n)
+    tree = BinarySearchTree(keys[0], balanced=True)
+    for key in keys[1:]:
+        tree.insert(key)
+    ranges = [sorted(random.sample(range(n * 10), 2)) for _ in range(queries)]
+    narrow = [(lo, lo + 100) for lo, _ in ranges]   # about 10 keys each
+
+    def scan_count():
+        for lo, hi in ranges:
+            sum(1 for key in list(tree.inorder()) if lo <= key <= hi)
+
+    def tree_count():
+        for lo, hi in ranges:
+            tree.count_range(lo, hi)
+
+    def scan_narrow():
+        for lo, hi in narrow:
+            [key for key in list(tree.inorder()) if lo <= key <= hi]
+
+    def tree_narrow():
+        for lo, hi in narrow:
+            list(tree.iter_range(lo, hi))
+
+    # the scans are slow enough that one run of them is plenty
+    print(f"{'query':<28}{'scan inorder()':>16}{'tree':>12}")
+    print(f"{'count_range':<28}{timeit(scan_count, 1) * 1000:>16.1f}{timeit(tree_count) * 1000:>12.1f}")
+    print(f"{'iter_range (~10 keys)':<28}{timeit(scan_narrow, 1) * 1000:>16.1f}{timeit(tree_narrow) * 1000:>12.1f}")
+
+
+def bench_bulk_load(n):
+    """from_sorted / from_iterable against n AVL inserts, and merge against inserting the other tree (s, one run)"""
+    print(f"\nbuilding a tree of {n:,} keys (s, one run)")
+    keys = random.sample(range(n * 10), n)
+    sorted_keys = sorted(keys)
+
+    def insert_all(values):
+        tree = BinarySearchTree(values[0], balanced=True)
+        for key in values[1:]:
+            tree.insert(key)
+        return tree
+
+    evens, odds = sorted_keys[::2], BinarySearchTree.from_sorted(sorted_keys[1::2])
+
+    def insert_odds():
+        tree = BinarySearchTree.from_sorted(evens, balanced=True)
+        for key in odds:
+            tree.insert(key)
+
+    def merge_odds():
+        BinarySearchTree.from_sorted(evens, balanced=True).merge(odds)
+
+    workloads = [("n sorted inserts (AVL)", lambda: insert_all(sorted_keys)),
+                 ("from_sorted", lambda: BinarySearchTree.from_sorted(sorted_keys)),
+                 ("from_iterable (unsorted)", lambda: BinarySearchTree.from_iterable(keys)),
+                 ("n/2 keys + insert the other n/2", insert_odds),
+                 ("n/2 keys + merge the other n/2", merge_odds)]
+    for name, func in workloads:
+        print(f"{name:<40}{timeit(func, 1):>10.2f}")
+
+
+def bench_complete(n):
+    """Building a complete tree with n inserts and asking about its shape, node based vs array backed (ms, one run)"""
+    print(f"\ncomplete tree of {n:,} nodes (ms, one run)")
+    print(f"{'workload':<28}{'BinaryTree':>14}{'Complete':>14}")
+    trees = {}
+
+    def build(cls):
+        def run():
+            tree = BinaryTree(0) if cls is BinaryTree else cls([0])
+            for i in range(1, n):
+                tree.insert(i)
+            trees[cls] = tree
+        return run
+
+    def shape(cls):
+        def run():
+            tree = trees[cls]
+            tree.height(), tree.iscomplete(), tree.isperfect()
+        return run
+
+    for name, make in (("n inserts", build), ("height/iscomplete/isperfect", shape)):
+        print(f"{name:<28}" + "".join(f"{timeit(make(cls), 1) * 1000:>14.3f}" for cls in (BinaryTree, CompleteBinaryTree)))
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    bench_balancing(n)
+    bench_range_queries(n)
+    bench_bulk_load(n * 100)
+    bench_complete(n)
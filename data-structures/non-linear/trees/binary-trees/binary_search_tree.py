@@ -1,21 +1,82 @@
+"""
+With balanced=True the tree is an AVL tree: after every insert and delete the
+nodes on the path back up to the root check that the heights of their two
+subtrees differ by at most 1, and rotate when they don't. That keeps the height
+under ~1.44 log2(n), so insert, contains and delete are O(log n) even when the
+values arrive sorted (which turns the plain tree into a linked list).
+
+Every node also knows the size of its subtree, so the tree answers order
+statistic and range questions in O(h) without walking the values in between:
+rank, select, count_range, floor, ceiling, and iter_range which only goes down
+the subtrees that overlap the range.
+
+t = BinarySearchTree(0, balanced=True)
+for i in range(1, 1000): t.insert(i)
+t.height()   # Output: 9 (it would be 999 without balancing)
+t.delete(500)
+t.rank(250), t.select(250)   # Output: (250, 250)
+t.count_range(100, 199)      # Output: 100
+list(t.iter_range(498, 502)) # Output: [498, 499, 501, 502]
+
+A tree can also be built in one go from values that are already sorted, which
+is O(n) instead of n inserts, and always gives a perfectly balanced tree:
+
+t = BinarySearchTree.from_sorted(range(1_000_000))
+t = BinarySearchTree.from_iterable([5, 3, 8, 3, 1])   # sorts (and drops duplicates) first
+t.merge(BinarySearchTree.from_iterable([2, 9]))       # rebuilds t with the values of both trees
+"""
 import collections
 
 class BinarySearchTree:
     class Node:
         """A node in a binary search tree contains a data value and references to its left and right children."""
+        __slots__ = ("data", "left", "right", "height", "size") # no per node __dict__, big trees take much less memory
+
         def __init__(self, data, left=None, right=None):
             self.data = data
             self.left = left
             self.right = right
+            self.height = 1 # number of nodes on the longest path down from this node to a leaf
+            self.size = 1 # number of nodes in the subtree rooted at this node (this one included)
         
         def __repr__(self):
             return f"Node(data={self.data}, left={self.left}, right={self.right})"
 
-    def __init__(self, rootval):
+    def __init__(self, rootval, balanced=False):
         """Initialize the binary search tree with a root value. 
-        The root node is created with the given value, and the size of the tree is set to 1."""
+        The root node is created with the given value, and the size of the tree is set to 1.
+        With balanced=True the tree keeps itself balanced (AVL) on every insert and delete."""
         self.root = self.Node(rootval)
         self._n = 1
+        self._balanced = balanced
+
+    @classmethod
+    def from_sorted(cls, iterable, balanced=False):
+        """Build a perfectly balanced tree from values in increasing order (repeated values are kept once).
+        Raises ValueError if the values aren't sorted."""
+        values = []
+        for value in iterable:
+            if values and not values[-1] < value:
+                if value == values[-1]: # no duplicate nodes
+                    continue
+                raise ValueError("The values must be sorted in increasing order")
+            values.append(value)
+        tree = cls.__new__(cls)
+        tree._balanced = balanced
+        tree._rebuild(values)
+        return tree
+
+    @classmethod
+    def from_iterable(cls, iterable, balanced=False):
+        """Build a perfectly balanced tree from values in any order (repeated values are kept once)"""
+        return cls.from_sorted(sorted(iterable), balanced)
+
+    def merge(self, other):
+        """Add all the values of another Binary Search Tree to this one (other is left unchanged).
+        The tree is rebuilt perfectly balanced, which is O(n + m) instead of m inserts."""
+        if not isinstance(other, BinarySearchTree):
+            raise TypeError("Can only merge another BinarySearchTree")
+        self._rebuild(self._merge_sorted(list(self), list(other)))
 
     def insert(self, data):
         """Insert a specific value in the Binary Search Tree.
@@ -24,6 +85,11 @@ class BinarySearchTree:
         There must be no duplicate nodes."""
         return self._insert(self.root, data) # start inserting from the root node
 
+    def delete(self, data):
+        """Remove a specific value from the Binary Search Tree.
+        Raises ValueError if the value is not in the tree."""
+        self._delete(data)
+
     def contains(self, target):
         """Search for a target value in the Binary Search Tree.
         Returns True if the target value is found in the tree, and False otherwise."""
@@ -45,6 +111,120 @@ class BinarySearchTree:
         """Level-order traversal (Breadth First Search): visit nodes level by level from left to right"""
         return self._levelorder(self.root) # start level-order traversal from the root node
 
+    def morris_inorder(self):
+        """In-order traversal in O(1) extra space: threads the tree while walking it and restores it afterwards"""
+        return self._morris_inorder(self.root)
+
+    def height(self):
+        """The number of edges on the longest path from the root to a leaf (-1 for an empty tree)"""
+        return self._height(self.root) - 1
+
+    @property
+    def balanced(self):
+        """True if the tree keeps itself balanced (AVL)"""
+        return self._balanced
+
+
+    def rank(self, key):
+        """The number of values in the tree smaller than key (key doesn't have to be in the tree)"""
+        """Time Complexity O(h)"""
+        return self._count_below(key, inclusive=False)
+
+
+    def select(self, k):
+        """The k-th smallest value (0-based, negative k counts from the largest)"""
+        """Time Complexity O(h)"""
+        if k < 0:
+            k += self._n
+        if k < 0 or k >= self._n:
+            raise IndexError("Binary Search Tree index out of range")
+        node = self.root
+        while True:
+            left_size = self._size(node.left)
+            if k < left_size: # the k-th value is in the left subtree
+                node = node.left
+            elif k == left_size: # exactly k values are smaller than this one
+                return node.data
+            else: # skip the left subtree and this node
+                k -= left_size + 1
+                node = node.right
+
+
+    def count_range(self, lo=None, hi=None):
+        """The number of values v with lo <= v <= hi (None leaves that side unbounded)"""
+        """Time Complexity O(h)"""
+        if lo is not None and hi is not None and lo > hi:
+            return 0
+        below_hi = self._n if hi is None else self._count_below(hi, inclusive=True)
+        below_lo = 0 if lo is None else self._count_below(lo, inclusive=False)
+        return below_hi - below_lo
+
+
+    def floor(self, key):
+        """The largest value <= key, or None if there is none"""
+        """Time Complexity O(h)"""
+        node, res = self.root, None
+        while node is not None:
+            if node.data == key:
+                return node.data
+            if node.data < key: # a candidate, but there may be a larger one on the right
+                res = node.data
+                node = node.right
+            else:
+                node = node.left
+        return res
+
+
+    def ceiling(self, key):
+        """The smallest value >= key, or None if there is none"""
+        """Time Complexity O(h)"""
+        node, res = self.root, None
+        while node is not None:
+            if node.data == key:
+                return node.data
+            if node.data > key: # a candidate, but there may be a smaller one on the left
+                res = node.data
+                node = node.left
+            else:
+                node = node.right
+        return res
+
+
+    def iter_range(self, lo=None, hi=None):
+        """Lazily yield the values v with lo <= v <= hi in order (None leaves that side unbounded)"""
+        """Time Complexity O(h + k) for k values in the range"""
+        # the in-order traversal, except that subtrees entirely below lo are never
+        # pushed and the walk stops at the first value above hi
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                if lo is not None and node.data < lo: # this node and its left subtree are below the range
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            if hi is not None and node.data > hi: # everything from here on is above the range
+                return
+            yield node.data
+            node = node.right
+
+
+    def _count_below(self, key, inclusive):
+        """The number of values < key (<= key if inclusive)"""
+        count = 0
+        node = self.root
+        while node is not None:
+            if node.data < key or (inclusive and node.data == key):
+                count += self._size(node.left) + 1 # the whole left subtree and this node are below key
+                node = node.right
+            else:
+                node = node.left
+        return count
+
 
     def _insert(self, node, data):
         """
@@ -60,59 +240,279 @@ class BinarySearchTree:
         In the best case (when the tree is balanced), h is log(n),
         making the time complexity O(log n).
         """
-        if data < node.data: # go to the left subtree (smaller values)
-            if node.left is None: # if the left child is empty, insert the new node here
-                node.left = self.Node(data) # create a new node and assign it to the left child of the current node
-                self._n += 1
-                return node.left # return the newly inserted node
-            self._insert(node.left, data) # otherwise, continue searching in the left subtree
-        elif data > node.data: # go to the right subtree (larger values)
-            if node.right is None: # if the right child is empty, insert the new node here
-                node.right = self.Node(data)  # create a new node and assign it to the right child of the current node
-                self._n += 1
-                return node.right # return the newly inserted node
-            self._insert(node.right, data) # otherwise, continue searching in the right subtree
+        # A loop instead of recursion: a tree built from (nearly) sorted input is a
+        # long chain, and recursing down it would hit the recursion limit
+        if node is None: # the tree is empty (everything was deleted), the new node becomes the root
+            self.root = self.Node(data)
+            self._n = 1
+            return self.root
+        path = [] # the nodes we go through, their heights have to be fixed on the way back up
+        while True:
+            path.append(node)
+            if data < node.data: # go to the left subtree (smaller values)
+                if node.left is None: # if the left child is empty, insert the new node here
+                    node.left = self.Node(data) # create a new node and assign it to the left child of the current node
+                    new_node = node.left
+                    break
+                node = node.left # otherwise, continue searching in the left subtree
+            elif data > node.data: # go to the right subtree (larger values)
+                if node.right is None: # if the right child is empty, insert the new node here
+                    node.right = self.Node(data)  # create a new node and assign it to the right child of the current node
+                    new_node = node.right
+                    break
+                node = node.right # otherwise, continue searching in the right subtree
+            else: # the value is already in the tree (no duplicates)
+                return None
+        self._n += 1
+        self._retrace(path)
+        return new_node # return the newly inserted node
+
+
+    def _delete(self, data):
+        """
+        Remove a specific value from the Binary Search Tree
+        A node with at most one child is replaced by that child. A node with two
+        children takes the value of its in-order successor (the smallest value of
+        its right subtree), and the successor node, which has no left child, is
+        removed instead.
+
+        Time complexity: O(h), O(log n) when the tree is balanced
+        """
+        path = []
+        node = self.root
+        while node is not None and data != node.data: # find the node holding data
+            path.append(node)
+            node = node.left if data < node.data else node.right
+        if node is None:
+            raise ValueError("Value not in the Binary Search Tree")
+
+        if node.left is not None and node.right is not None:
+            path.append(node)
+            successor = node.right
+            while successor.left is not None: # the leftmost node of the right subtree
+                path.append(successor)
+                successor = successor.left
+            node.data = successor.data # move the successor's value up, and remove the successor node
+            node = successor
+        child = node.left if node.left is not None else node.right
+        self._replace_child(path[-1] if path else None, node, child)
+        self._n -= 1
+        self._retrace(path)
+
+
+    def _rebuild(self, values):
+        """Replace the whole tree with a perfectly balanced one holding values (sorted, no duplicates)"""
+        """Time Complexity O(n)"""
+        self.root = self._build(values, 0, len(values))
+        self._n = len(values)
+
+
+    def _build(self, values, lo, hi):
+        """Build the subtree of values[lo:hi] bottom-up and return its root (the middle value)"""
+        # The recursion is only O(log n) deep since the two halves differ by at most one value
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        node = self.Node(values[mid], self._build(values, lo, mid), self._build(values, mid + 1, hi))
+        # with halves split like this, k nodes are always k.bit_length() levels high
+        node.size = hi - lo
+        node.height = node.size.bit_length()
+        return node
+
+
+    @staticmethod
+    def _merge_sorted(a, b):
+        """Merge two sorted lists into one, keeping values found in both once"""
+        """Time Complexity O(n + m)"""
+        res = []
+        i = j = 0
+        while i < len(a) and j < len(b):
+            if a[i] < b[j]:
+                res.append(a[i])
+                i += 1
+            elif b[j] < a[i]:
+                res.append(b[j])
+                j += 1
+            else: # in both trees
+                res.append(a[i])
+                i += 1
+                j += 1
+        res.extend(a[i:])
+        res.extend(b[j:])
+        return res
+
+
+    def _retrace(self, path):
+        """Fix the heights of the nodes on path (from the root down), bottom-up, rotating them if the tree is balanced"""
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            self._update(node)
+            if self._balanced:
+                subtree = self._rebalance(node)
+                if subtree is not node: # a rotation moved another node to the top of this subtree
+                    self._replace_child(path[i - 1] if i else None, node, subtree)
+
+
+    def _replace_child(self, parent, old, new):
+        """Put new where old was under parent (parent None means old is the root)"""
+        if parent is None:
+            self.root = new
+        elif parent.left is old:
+            parent.left = new
+        else:
+            parent.right = new
+
+
+    @staticmethod
+    def _height(node):
+        return node.height if node is not None else 0
+
+
+    @staticmethod
+    def _size(node):
+        return node.size if node is not None else 0
+
+
+    def _update(self, node):
+        """Recompute the height and the size of node from the ones of its children"""
+        node.height = 1 + max(self._height(node.left), self._height(node.right))
+        node.size = 1 + self._size(node.left) + self._size(node.right)
+
+
+    def _rebalance(self, node):
+        """
+        Rotate the subtree rooted at node if its two sides differ in height by more
+        than 1, and return the (possibly new) root of the subtree.
+
+        left-left: rotate right                  left-right: rotate the left child left, then rotate right
+              z                y                       z                  z                x
+             /                / \\                     /                  /                / \\
+            y        ->      x   z                   y        ->        x        ->      y   z
+           /                                          \\                /
+          x                                            x              y
+        (the right-right and right-left cases are the mirror images)
+        """
+        balance = self._height(node.left) - self._height(node.right)
+        if balance > 1: # the left side is too tall
+            if self._height(node.left.left) < self._height(node.left.right): # left-right case
+                node.left = self._rotate_left(node.left)
+            return self._rotate_right(node)
+        if balance < -1: # the right side is too tall
+            if self._height(node.right.right) < self._height(node.right.left): # right-left case
+                node.right = self._rotate_right(node.right)
+            return self._rotate_left(node)
+        return node
+
+
+    def _rotate_left(self, node):
+        """Rotate the subtree rooted at node to the left, its right child becomes the root of the subtree"""
+        pivot = node.right
+        node.right = pivot.left
+        pivot.left = node
+        self._update(node) # node is now below pivot, so it's updated first
+        self._update(pivot)
+        return pivot
+
+
+    def _rotate_right(self, node):
+        """Rotate the subtree rooted at node to the right, its left child becomes the root of the subtree"""
+        pivot = node.left
+        node.left = pivot.right
+        pivot.right = node
+        self._update(node)
+        self._update(pivot)
+        return pivot
 
 
     def _contains(self, node, target):
         """Search for a target value in the Binary Search Tree"""
-        if node is None: # if we reach a leaf node and haven't found the target, it means the target is not in the tree
-            return False 
-        if target == node.data: # if we find the target value, return True
-            return True
-        if target < node.data: # if the target value is smaller than the current node's value, search in the left subtree
-            return self._contains(node.left, target)
-        return self._contains(node.right, target) # if the target value is larger than the current node's value, search in the right subtree
+        while node is not None: # if we reach a leaf node and haven't found the target, it means the target is not in the tree
+            if target == node.data: # if we find the target value, return True
+                return True
+            # if the target value is smaller than the current node's value, search in the left subtree, otherwise in the right one
+            node = node.left if target < node.data else node.right
+        return False
 
 
     def _preorder(self, node):
         """Pre-order traversing. node.data -> left.data -> right.data"""
-        if node is None: # if we reach a leaf node, we return to the previous level of the tree
-            return
-        # visit the current node first (pre-order), then recursively visit the left and right subtrees
-        print(node.data)
-        self._preorder(node.left)
-        self._preorder(node.right)
+        """Time Complexity O(n), Space Complexity O(h)"""
+        # an explicit stack instead of recursion, so deep (skewed) trees can't hit the recursion limit
+        stack = [node] if node is not None else []
+        while stack:
+            node = stack.pop()
+            yield node.data
+            # push the right child first so that the left subtree is visited first
+            if node.right is not None:
+                stack.append(node.right)
+            if node.left is not None:
+                stack.append(node.left)
 
 
     def _inorder(self, node):
         """In-order traversing. left.data -> node.data -> right.data"""
-        if node is None: # if we reach a leaf node, we return to the previous level of the tree
-            return
-        # recursively visit the left subtree first (in-order), then visit the current node, and finally recursively visit the right subtree
-        self._inorder(node.left)
-        print(node.data)
-        self._inorder(node.right)
+        """Time Complexity O(n), Space Complexity O(h)"""
+        stack = []
+        while stack or node is not None:
+            # go as far left as possible, remembering the nodes we pass on the way
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.data
+            node = node.right   # then the right subtree of the node we just visited
 
 
     def _postorder(self, node):
         """Post-order traversing. left.data -> right.data -> node.data"""
-        if node is None: # if we reach a leaf node, we return to the previous level of the tree
-            return
-        # recursively visit the left and right subtrees first (post-order), and then visit the current node
-        self._postorder(node.left)
-        self._postorder(node.right)
-        print(node.data)
+        """Time Complexity O(n), Space Complexity O(h)"""
+        stack = []
+        last_visited = None
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            top = stack[-1]
+            if top.right is not None and top.right is not last_visited:
+                node = top.right   # the right subtree hasn't been visited yet
+            else:   # both subtrees are done, visit the node itself
+                stack.pop()
+                yield top.data
+                last_visited = top
+
+
+    def _morris_inorder(self, node):
+        """In-order traversing in O(1) extra space (Morris traversal)"""
+        """Time Complexity O(n), Space Complexity O(1)"""
+        # Before going down into a left subtree, the rightmost node of that subtree
+        # (the in-order predecessor) gets a temporary right link back up to the
+        # current node, so we can climb back without a stack. The link is removed
+        # when we follow it, so the tree is unchanged once the traversal is over.
+        # If the caller stops early, the rest of the walk runs without yielding
+        # to remove the remaining links. Don't modify the tree while traversing
+        try:
+            while node is not None:
+                node, visit = self._morris_step(node)
+                if visit is not None:
+                    yield visit.data
+        finally:
+            while node is not None:
+                node, _ = self._morris_step(node)
+
+
+    @staticmethod
+    def _morris_step(node):
+        """One step of the Morris traversal, return (the next node, the node to visit or None)"""
+        if node.left is None:
+            return node.right, node
+        predecessor = node.left
+        while predecessor.right is not None and predecessor.right is not node:
+            predecessor = predecessor.right
+        if predecessor.right is None:   # first time here, link back and go left
+            predecessor.right = node
+            return node.left, None
+        predecessor.right = None   # came back through the link, remove it
+        return node.right, node
 
 
     def _levelorder(self, root):
@@ -124,7 +524,7 @@ class BinarySearchTree:
         queue = collections.deque([root]) # initialize a queue with the root node to start the level-order traversal
         while queue: # continue traversing until the queue is empty (i.e., we have visited all nodes in the tree)
             node = queue.popleft() # remove and return the leftmost node from the queue (the next node to visit in level-order)
-            print(node.data) # visit the current node (print its data value)
+            yield node.data # visit the current node (hand its data value to the caller)
             if node.left: # if the current node has a left child, add it to the queue to be visited later
                 queue.append(node.left)
             if node.right: # if the current node has a right child, add it to the queue to be visited later
@@ -137,20 +537,10 @@ class BinarySearchTree:
     
     
     def __repr__(self):
-        return f"BinarySearchTree(root={self.root.data}, size={self._n})"
+        root = self.root.data if self.root is not None else None
+        return f"BinarySearchTree(root={root}, size={self._n})"
     
     
     def __iter__(self):
         """In-order traversal iterator"""
-        stack = []
-        current = self.root
-        while stack or current: # continue traversing until we have visited all nodes (i.e., the stack is empty and there are no more nodes to visit)
-            # We go as far left as possible, pushing each node onto the stack as we go.
-            while current:
-                stack.append(current)
-                current = current.left
-            # Once we reach a leaf node (where current is None), we pop the last node from the stack, visit it (yield its data value), 
-            # and then move to its right child to continue the traversal.    
-            current = stack.pop()
-            yield current.data
-            current = current.right
\ No newline at end of file
+        return self._inorder(self.root)
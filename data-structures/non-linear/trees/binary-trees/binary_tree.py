@@ -25,6 +25,9 @@ class BinaryTree:
     def levelorder(self):
         return self._levelorder(self.root)
 
+    def morris_inorder(self):
+        return self._morris_inorder(self.root)
+
     def insert(self, data):
         return self._insert(self.root, data)
 
@@ -133,29 +136,83 @@ class BinaryTree:
 
     def _preorder(self, node):
         """Pre-order traversing. node.data -> left.data -> right.data"""
-        if node is None:
-            return
-        print(node.data)
-        self._preorder(node.left)
-        self._preorder(node.right)
+        """Time Complexity O(n), Space Complexity O(h)"""
+        # an explicit stack instead of recursion, so deep (skewed) trees can't hit the recursion limit
+        stack = [node] if node is not None else []
+        while stack:
+            node = stack.pop()
+            yield node.data
+            # push the right child first so that the left subtree is visited first
+            if node.right is not None:
+                stack.append(node.right)
+            if node.left is not None:
+                stack.append(node.left)
 
 
     def _inorder(self, node):
         """In-order traversing. left.data -> node.data -> right.data"""
-        if node is None:
-            return
-        self._inorder(node.left)
-        print(node.data)
-        self._inorder(node.right)
+        """Time Complexity O(n), Space Complexity O(h)"""
+        stack = []
+        while stack or node is not None:
+            # go as far left as possible, remembering the nodes we pass on the way
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.data
+            node = node.right   # then the right subtree of the node we just visited
 
 
     def _postorder(self, node):
         """Post-order traversing. left.data -> right.data -> node.data"""
-        if node is None:
-            return
-        self._postorder(node.left)
-        self._postorder(node.right)
-        print(node.data)
+        """Time Complexity O(n), Space Complexity O(h)"""
+        stack = []
+        last_visited = None
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            top = stack[-1]
+            if top.right is not None and top.right is not last_visited:
+                node = top.right   # the right subtree hasn't been visited yet
+            else:   # both subtrees are done, visit the node itself
+                stack.pop()
+                yield top.data
+                last_visited = top
+
+
+    def _morris_inorder(self, node):
+        """In-order traversing in O(1) extra space (Morris traversal)"""
+        """Time Complexity O(n), Space Complexity O(1)"""
+        # Before going down into a left subtree, the rightmost node of that subtree
+        # (the in-order predecessor) gets a temporary right link back up to the
+        # current node, so we can climb back without a stack. The link is removed
+        # when we follow it, so the tree is unchanged once the traversal is over.
+        # If the caller stops early, the rest of the walk runs without yielding
+        # to remove the remaining links. Don't modify the tree while traversing
+        try:
+            while node is not None:
+                node, visit = self._morris_step(node)
+                if visit is not None:
+                    yield visit.data
+        finally:
+            while node is not None:
+                node, _ = self._morris_step(node)
+
+
+    @staticmethod
+    def _morris_step(node):
+        """One step of the Morris traversal, return (the next node, the node to visit or None)"""
+        if node.left is None:
+            return node.right, node
+        predecessor = node.left
+        while predecessor.right is not None and predecessor.right is not node:
+            predecessor = predecessor.right
+        if predecessor.right is None:   # first time here, link back and go left
+            predecessor.right = node
+            return node.left, None
+        predecessor.right = None   # came back through the link, remove it
+        return node.right, node
 
 
     def _levelorder(self, root):
@@ -165,7 +222,7 @@ class BinaryTree:
         queue = collections.deque([root])
         while queue:
             node = queue.popleft()
-            print(node.data)
+            yield node.data
             if node.left is not None:
                 queue.append(node.left)
             if node.right is not None:
@@ -176,4 +233,227 @@ class BinaryTree:
     size = __len__
 
     def __repr__(self):
-        return f"BinaryTree(root={self.root.data}, size={self._n})"
\ No newline at end of file
+        return f"BinaryTree(root={self.root.data}, size={self._n})"
+
+
+class CompleteBinaryTree:
+    """
+    A complete binary tree (every level full except possibly the last, which is
+    filled from the left) stored implicitly in a list, level by level, the same
+    layout as MaxHeap:
+    - Parent of node at index i is at (i-1) // 2
+    - Left child of node at index i is at 2*i + 1
+    - Right child of node at index i is at 2*i + 2
+
+    No node objects and no links, and the shape of the tree follows from its size
+    alone: inserting is an append (instead of a BFS for the first free slot), and
+    height, iscomplete, isfull and isperfect are O(1) arithmetic on n.
+
+    t = CompleteBinaryTree("ABCDEF")
+    t.height(), t.isperfect()         # Output: (2, False)
+    list(t.inorder())                 # Output: ['D', 'B', 'E', 'A', 'F', 'C']
+    t.to_binary_tree()                # Output: BinaryTree(root=A, size=6)
+    """
+
+    def __init__(self, values=None):
+        self._tree = list(values) if values is not None else []
+
+
+    @classmethod
+    def from_binary_tree(cls, tree):
+        """The values of a node based BinaryTree in level order. Raises ValueError if it isn't complete"""
+        """Time Complexity O(n)"""
+        values = []
+        queue = collections.deque([tree.root] if tree.root is not None else [])
+        end = False # a missing child was seen, every later one must be missing too
+        while queue:
+            node = queue.popleft()
+            values.append(node.data)
+            for child in (node.left, node.right):
+                if child is None:
+                    end = True
+                elif end:
+                    raise ValueError("The binary tree is not complete")
+                else:
+                    queue.append(child)
+        return cls(values)
+
+
+    def to_binary_tree(self):
+        """A node based BinaryTree with the same shape and values"""
+        """Time Complexity O(n)"""
+        if not self._tree:
+            raise ValueError("A BinaryTree can't be empty")
+        nodes = [BinaryTree.Node(data) for data in self._tree]
+        for i in range(len(nodes) // 2): # the nodes with at least one child
+            nodes[i].left = nodes[2*i + 1]
+            if 2*i + 2 < len(nodes):
+                nodes[i].right = nodes[2*i + 2]
+        tree = BinaryTree(self._tree[0])
+        tree.root = nodes[0]
+        tree._n = len(nodes)
+        return tree
+
+
+    def insert(self, data):
+        """Add a node at the first free position (the leftmost free one of the last level)"""
+        """Time Complexity O(1) (amortized)"""
+        self._tree.append(data)
+        return len(self._tree) - 1 # the index of the new node
+    append = insert
+
+
+    def pop(self):
+        """Remove the last node (the rightmost one of the last level) and return its data"""
+        """Time Complexity O(1)"""
+        if not self._tree:
+            raise ValueError("Empty tree")
+        return self._tree.pop()
+
+
+    def root(self):
+        """Time Complexity O(1)"""
+        if not self._tree:
+            raise ValueError("Empty tree")
+        return self._tree[0]
+
+
+    def parent(self, i):
+        """Index of the parent of node i, None for the root"""
+        """Time Complexity O(1)"""
+        self._check_index(i)
+        return (i - 1) // 2 if i > 0 else None
+
+
+    def left(self, i):
+        """Index of the left child of node i, None if it has none"""
+        """Time Complexity O(1)"""
+        self._check_index(i)
+        return 2*i + 1 if 2*i + 1 < len(self._tree) else None
+
+
+    def right(self, i):
+        """Index of the right child of node i, None if it has none"""
+        """Time Complexity O(1)"""
+        self._check_index(i)
+        return 2*i + 2 if 2*i + 2 < len(self._tree) else None
+
+
+    def height(self):
+        """The number of edges from the root to the deepest leaf (-1 for an empty tree)"""
+        """Time Complexity O(1)"""
+        # levels 0..h-1 hold 2**h - 1 nodes, so n nodes fill n.bit_length() levels
+        return len(self._tree).bit_length() - 1
+
+
+    def iscomplete(self):
+        """Time Complexity O(1)"""
+        return True # the layout can't represent anything else
+
+
+    def isfull(self):
+        """Every node has 0 or 2 children, only the last node can be a lonely left child"""
+        """Time Complexity O(1)"""
+        return len(self._tree) % 2 == 1 or not self._tree
+
+
+    def isperfect(self):
+        """Every level is full, n is 2**(h+1) - 1"""
+        """Time Complexity O(1)"""
+        n = len(self._tree)
+        return n & (n + 1) == 0
+
+
+    def iscompletefull(self):
+        """Time Complexity O(1)"""
+        return self.isfull()
+
+
+    def preorder(self):
+        """Pre-order traversing. node.data -> left.data -> right.data"""
+        """Time Complexity O(n), Space Complexity O(log n)"""
+        n = len(self._tree)
+        stack = [0] if n else []
+        while stack:
+            i = stack.pop()
+            yield self._tree[i]
+            if 2*i + 2 < n: # push the right child first so that the left subtree is visited first
+                stack.append(2*i + 2)
+            if 2*i + 1 < n:
+                stack.append(2*i + 1)
+
+
+    def inorder(self):
+        """In-order traversing. left.data -> node.data -> right.data"""
+        """Time Complexity O(n), Space Complexity O(log n)"""
+        n = len(self._tree)
+        stack = []
+        i = 0
+        while stack or i < n:
+            while i < n: # go as far left as possible
+                stack.append(i)
+                i = 2*i + 1
+            i = stack.pop()
+            yield self._tree[i]
+            i = 2*i + 2
+
+
+    def postorder(self):
+        """Post-order traversing. left.data -> right.data -> node.data"""
+        """Time Complexity O(n), Space Complexity O(log n)"""
+        n = len(self._tree)
+        stack = []
+        last_visited = None
+        i = 0
+        while stack or i < n:
+            while i < n:
+                stack.append(i)
+                i = 2*i + 1
+            top = stack[-1]
+            if 2*top + 2 < n and 2*top + 2 != last_visited:
+                i = 2*top + 2 # the right subtree hasn't been visited yet
+            else:
+                stack.pop()
+                yield self._tree[top]
+                last_visited = top
+
+
+    def levelorder(self):
+        """Breadth First Search, which is just the order of the list"""
+        """Time Complexity O(n)"""
+        return iter(self._tree)
+
+
+    def tolist(self):
+        """The values in level order"""
+        return list(self._tree)
+
+
+    def _check_index(self, i):
+        if not 0 <= i < len(self._tree):
+            raise IndexError("index out of bounds")
+
+
+    def __getitem__(self, i):
+        """Time Complexity O(1)"""
+        self._check_index(i)
+        return self._tree[i]
+
+
+    def __setitem__(self, i, data):
+        """Time Complexity O(1)"""
+        self._check_index(i)
+        self._tree[i] = data
+
+
+    def __iter__(self):
+        return self.levelorder()
+
+
+    def __len__(self):
+        return len(self._tree)
+    size = __len__
+
+
+    def __repr__(self):
+        return f"CompleteBinaryTree({self._tree})"